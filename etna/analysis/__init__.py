@@ -4,6 +4,8 @@ from etna.analysis.eda_utils import SeasonalPlotAlignment
 from etna.analysis.eda_utils import SeasonalPlotCycle
 from etna.analysis.eda_utils import cross_corr_plot
 from etna.analysis.eda_utils import distribution_plot
+from etna.analysis.eda_utils import get_acf
+from etna.analysis.eda_utils import get_pacf
 from etna.analysis.eda_utils import prediction_actual_scatter_plot
 from etna.analysis.eda_utils import qq_plot
 from etna.analysis.eda_utils import sample_acf_plot
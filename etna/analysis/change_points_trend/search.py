@@ -1,14 +1,63 @@
+from collections import OrderedDict
+from copy import deepcopy
+from typing import Any
 from typing import Dict
 from typing import List
+from typing import Optional
 
 import numpy as np
 import pandas as pd
+from joblib import Parallel
+from joblib import delayed
+from joblib import hash as joblib_hash
 from ruptures.base import BaseEstimator
 from ruptures.costs import CostLinear
 
 from etna.datasets import TSDataset
 
 
+class _ChangePointsCache:
+    """LRU cache of change points found on the series, shared between the copies of the transform that owns it."""
+
+    def __init__(self, max_size: int = 10000):
+        """Init _ChangePointsCache.
+
+        Parameters
+        ----------
+        max_size:
+            maximal number of series which change points are kept in the cache
+        """
+        self.max_size = max_size
+        self._change_points: "OrderedDict[str, List[pd.Timestamp]]" = OrderedDict()
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "_ChangePointsCache":
+        # copies of the transform in the same process reuse the same detections, pickled copies get their own cache
+        return self
+
+    def __len__(self) -> int:
+        return len(self._change_points)
+
+    def get(self, fingerprint: Optional[str]) -> Optional[List[pd.Timestamp]]:
+        """Get change points from the cache, None if there are no such change points."""
+        if fingerprint is None or fingerprint not in self._change_points:
+            return None
+        self._change_points.move_to_end(fingerprint)
+        return list(self._change_points[fingerprint])
+
+    def set(self, fingerprint: Optional[str], change_points: List[pd.Timestamp]):
+        """Save change points to the cache dropping the least recently used ones if it is full."""
+        if fingerprint is None:
+            return
+        self._change_points[fingerprint] = list(change_points)
+        self._change_points.move_to_end(fingerprint)
+        while len(self._change_points) > self.max_size:
+            self._change_points.popitem(last=False)
+
+    def clear(self):
+        """Remove all the change points from the cache."""
+        self._change_points.clear()
+
+
 def _prepare_signal(series: pd.Series, model: BaseEstimator) -> np.ndarray:
     """Prepare series for change point model."""
     signal = series.to_numpy()
@@ -17,10 +66,22 @@ def _prepare_signal(series: pd.Series, model: BaseEstimator) -> np.ndarray:
     return signal
 
 
-def _find_change_points_segment(
+def _get_fingerprint(series: pd.Series, change_point_model: BaseEstimator, **model_predict_params) -> Optional[str]:
+    """Get key of change points of the series in cache, None if the result can't be cached.
+
+    Key is built from values and timestamps of the series, the whole state of the model including its cost
+    and predict params, so any change of the model gives another key.
+    """
+    try:
+        return joblib_hash((series.index.values, series.values, change_point_model, model_predict_params))
+    except Exception:
+        return None
+
+
+def _detect_change_points(
     series: pd.Series, change_point_model: BaseEstimator, **model_predict_params
 ) -> List[pd.Timestamp]:
-    """Find trend change points within one segment."""
+    """Detect trend change points within one segment with the model."""
     signal = _prepare_signal(series=series, model=change_point_model)
     timestamp = series.index
     change_point_model.fit(signal=signal)
@@ -30,11 +91,64 @@ def _find_change_points_segment(
     return change_points
 
 
+def _find_change_points_segment(
+    series: pd.Series, change_point_model: BaseEstimator, **model_predict_params
+) -> List[pd.Timestamp]:
+    """Find trend change points within one segment."""
+    return _detect_change_points(series=series, change_point_model=change_point_model, **model_predict_params)
+
+
+def _find_change_points_segments(
+    series: Dict[str, pd.Series],
+    change_point_model: BaseEstimator,
+    n_jobs: int = 1,
+    joblib_params: Optional[Dict[str, Any]] = None,
+    cache: Optional[_ChangePointsCache] = None,
+    **model_predict_params,
+) -> Dict[str, List[pd.Timestamp]]:
+    """Find trend change points within given segments in parallel.
+
+    If ``cache`` is given, segments which change points are in it aren't processed, detection for the rest
+    of them is run in ``n_jobs`` parallel jobs.
+    """
+    if joblib_params is None:
+        joblib_params = dict(verbose=0, backend="multiprocessing", mmap_mode="c")
+
+    result: Dict[str, List[pd.Timestamp]] = {}
+    fingerprints: Dict[str, Optional[str]] = {}
+    if cache is not None:
+        for segment, segment_series in series.items():
+            fingerprints[segment] = _get_fingerprint(segment_series, change_point_model, **model_predict_params)
+            change_points = cache.get(fingerprints[segment])
+            if change_points is not None:
+                result[segment] = change_points
+
+    segments_to_detect = [segment for segment in series if segment not in result]
+    detected_change_points = Parallel(n_jobs=n_jobs, **joblib_params)(
+        delayed(_detect_change_points)(
+            series=series[segment], change_point_model=deepcopy(change_point_model), **model_predict_params
+        )
+        for segment in segments_to_detect
+    )
+    result.update(zip(segments_to_detect, detected_change_points))
+    if cache is not None:
+        for segment in segments_to_detect:
+            cache.set(fingerprints[segment], result[segment])
+    return {segment: result[segment] for segment in series}
+
+
 def find_change_points(
-    ts: TSDataset, in_column: str, change_point_model: BaseEstimator, **model_predict_params
+    ts: TSDataset,
+    in_column: str,
+    change_point_model: BaseEstimator,
+    n_jobs: int = 1,
+    joblib_params: Optional[Dict[str, Any]] = None,
+    **model_predict_params,
 ) -> Dict[str, List[pd.Timestamp]]:
     """Find trend change points using ruptures models.
 
+    Segments are processed in ``n_jobs`` parallel jobs.
+
     Parameters
     ----------
     ts:
@@ -43,6 +157,10 @@ def find_change_points(
         name of column to work with
     change_point_model:
         ruptures model to get trend change points
+    n_jobs:
+        number of segments to process in parallel
+    joblib_params:
+        additional parameters for :py:class:`joblib.Parallel`
     model_predict_params:
         params for ``change_point_model`` predict method
 
@@ -51,13 +169,16 @@ def find_change_points(
     Dict[str, List[pd.Timestamp]]
         dictionary with list of trend change points for each segment
     """
-    result: Dict[str, List[pd.Timestamp]] = {}
+    series = {}
     df = ts.to_pandas()
     for segment in ts.segments:
         df_segment = df[segment]
         raw_series = df_segment[in_column]
-        series = raw_series.loc[raw_series.first_valid_index() : raw_series.last_valid_index()]
-        result[segment] = _find_change_points_segment(
-            series=series, change_point_model=change_point_model, **model_predict_params
-        )
-    return result
+        series[segment] = raw_series.loc[raw_series.first_valid_index() : raw_series.last_valid_index()]
+    return _find_change_points_segments(
+        series=series,
+        change_point_model=change_point_model,
+        n_jobs=n_jobs,
+        joblib_params=joblib_params,
+        **model_predict_params,
+    )
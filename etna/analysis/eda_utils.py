@@ -15,8 +15,10 @@ import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
 import seaborn as sns
-import statsmodels.api as sm
 from matplotlib.ticker import MaxNLocator
+from scipy.fft import irfft
+from scipy.fft import next_fast_len
+from scipy.fft import rfft
 from sklearn.linear_model import LinearRegression
 from sklearn.metrics import r2_score
 from statsmodels.graphics.gofplots import qqplot
@@ -28,8 +30,42 @@ from etna.analysis.utils import prepare_axes
 if TYPE_CHECKING:
     from etna.datasets import TSDataset
 
-plot_acf = sm.graphics.tsa.plot_acf
-plot_pacf = sm.graphics.tsa.plot_pacf
+
+def _correlate(a: np.ndarray, b: np.ndarray, maxlags: int) -> np.ndarray:
+    """Calculate sums ``sum_t a[..., t + lag] * b[..., t]`` for lags from ``-maxlags`` to ``maxlags`` by FFT.
+
+    Arrays shouldn't contain NaNs, computation is done along the last axis for all the leading axes at once.
+    """
+    length = a.shape[-1]
+    n_fft = next_fast_len(2 * length - 1, real=True)
+    spectrum = rfft(a, n=n_fft, axis=-1) * np.conj(rfft(b, n=n_fft, axis=-1))
+    correlations = irfft(spectrum, n=n_fft, axis=-1)
+    lags = np.arange(-maxlags, maxlags + 1)
+    return correlations[..., lags % n_fft]
+
+
+def _masked_correlation(a: np.ndarray, b: np.ndarray, maxlags: int, normed: bool = True) -> np.ndarray:
+    """Calculate cross correlations between arrays with NaNs along the last axis for all the leading axes at once.
+
+    NaNs are ignored: for each lag only the pairs of non-missing values are taken into account,
+    normalization is done by norms of the values from these pairs.
+    """
+    nan_mask_a, nan_mask_b = np.isnan(a), np.isnan(b)
+    a, b = np.where(nan_mask_a, 0, a), np.where(nan_mask_b, 0, b)
+    dot_product = _correlate(a, b, maxlags=maxlags)
+    if not normed:
+        return dot_product
+
+    # sums of squares of values that have non-missing pair on each lag
+    squares_a, squares_b = a**2, b**2
+    norm_a = _correlate(squares_a, (~nan_mask_b).astype(float), maxlags=maxlags)
+    norm_b = _correlate((~nan_mask_a).astype(float), squares_b, maxlags=maxlags)
+    # FFT doesn't give exact zeros, so values at the level of its errors are considered as zeros
+    norm_a[norm_a <= 1e-10 * squares_a.sum(axis=-1, keepdims=True)] = 0
+    norm_b[norm_b <= 1e-10 * squares_b.sum(axis=-1, keepdims=True)] = 0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        normed_dot_product = dot_product / np.sqrt(norm_a * norm_b)
+    return np.nan_to_num(normed_dot_product, nan=0.0, posinf=0.0, neginf=0.0)
 
 
 def _cross_correlation(
@@ -37,7 +73,7 @@ def _cross_correlation(
 ) -> Tuple[np.ndarray, np.ndarray]:
     """Calculate cross correlation between arrays.
 
-    This implementation is slow: O(n^2), but can properly ignore NaNs.
+    Correlations for all the lags are computed at once by FFT, NaNs are properly ignored.
 
     Parameters
     ----------
@@ -76,31 +112,125 @@ def _cross_correlation(
     if maxlags < 1 or maxlags >= length:
         raise ValueError("Parameter maxlags should be >= 1 and < len(a)")
 
-    result = []
     lags = np.arange(-maxlags, maxlags + 1)
-    for lag in lags:
-        if lag < 0:
-            cur_a = a[:lag]
-            cur_b = b[-lag:]
-        elif lag == 0:
-            cur_a = a
-            cur_b = b
-        else:
-            cur_a = a[lag:]
-            cur_b = b[:-lag]
-        dot_product = np.nansum(cur_a * cur_b)
-        if normed:
-            nan_mask_a = np.isnan(cur_a)
-            nan_mask_b = np.isnan(cur_b)
-            nan_mask = nan_mask_a | nan_mask_b
-            normed_dot_product = dot_product / np.sqrt(
-                np.sum(cur_a[~nan_mask] * cur_a[~nan_mask]) * np.sum(cur_b[~nan_mask] * cur_b[~nan_mask])
-            )
-            normed_dot_product = np.nan_to_num(normed_dot_product)
-            result.append(normed_dot_product)
-        else:
-            result.append(dot_product)
-    return lags, np.array(result)
+    result = _masked_correlation(
+        a=np.asarray(a, dtype=float), b=np.asarray(b, dtype=float), maxlags=maxlags, normed=normed
+    )
+    return lags, result
+
+
+def _get_targets(ts: "TSDataset", segments: Optional[List[str]]) -> pd.DataFrame:
+    """Get wide dataframe with targets of given segments, all the segments are taken if ``segments`` is None."""
+    if segments is None:
+        segments = sorted(ts.segments)
+    return ts.to_pandas().loc[:, pd.IndexSlice[segments, "target"]].droplevel("feature", axis=1).astype(float)
+
+
+def get_acf(ts: "TSDataset", lags: int = 21, segments: Optional[List[str]] = None) -> pd.DataFrame:
+    """Calculate autocorrelation function of targets for all the segments at once.
+
+    Values are computed by FFT. NaNs (e.g. in the beginning of segments) are ignored: segments are centered
+    by the mean of non-missing values, on each lag only the pairs of non-missing values are taken into account.
+    Without NaNs the result is the same as :py:func:`statsmodels.tsa.stattools.acf`.
+
+    Parameters
+    ----------
+    ts:
+        TSDataset with timeseries data
+    lags:
+        maximal lag to calculate autocorrelation for, should be >= 1
+    segments:
+        segments to calculate autocorrelation for, if None all the segments are taken
+
+    Returns
+    -------
+    pd.DataFrame:
+        dataframe with lags from 0 to ``lags`` as index and segments as columns
+
+    Raises
+    ------
+    ValueError:
+        parameter ``lags`` doesn't satisfy constraints
+    """
+    if lags < 1:
+        raise ValueError("Parameter lags should be >= 1")
+    df = _get_targets(ts=ts, segments=segments)
+    values = df.values.T
+    values = values - np.nanmean(values, axis=1, keepdims=True)
+    maxlags = min(lags, values.shape[1] - 1)
+    autocovariance = _masked_correlation(a=values, b=values, maxlags=maxlags, normed=False)[:, maxlags:]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        autocorrelation = autocovariance / autocovariance[:, :1]
+    return pd.DataFrame(autocorrelation.T, index=pd.RangeIndex(maxlags + 1, name="lag"), columns=df.columns)
+
+
+def get_pacf(ts: "TSDataset", lags: int = 21, segments: Optional[List[str]] = None) -> pd.DataFrame:
+    """Calculate partial autocorrelation function of targets for all the segments at once.
+
+    Values are computed by Durbin-Levinson recursion from :py:func:`~etna.analysis.eda_utils.get_acf`,
+    without NaNs the result is the same as :py:func:`statsmodels.tsa.stattools.pacf` with ``method="ldb"``.
+
+    Parameters
+    ----------
+    ts:
+        TSDataset with timeseries data
+    lags:
+        maximal lag to calculate partial autocorrelation for, should be >= 1
+    segments:
+        segments to calculate partial autocorrelation for, if None all the segments are taken
+
+    Returns
+    -------
+    pd.DataFrame:
+        dataframe with lags from 0 to ``lags`` as index and segments as columns
+
+    Raises
+    ------
+    ValueError:
+        parameter ``lags`` doesn't satisfy constraints
+    """
+    acf = get_acf(ts=ts, lags=lags, segments=segments)
+    autocorrelation = acf.values.T
+    n_series, n_lags = autocorrelation.shape
+    partial_autocorrelation = np.ones((n_series, n_lags))
+    # coefficients of autoregression of the current order
+    phi = np.zeros((n_series, n_lags))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for k in range(1, n_lags):
+            numerator = autocorrelation[:, k] - np.sum(phi[:, 1:k] * autocorrelation[:, k - 1 : 0 : -1], axis=1)
+            denominator = 1 - np.sum(phi[:, 1:k] * autocorrelation[:, 1:k], axis=1)
+            phi_kk = numerator / denominator
+            phi[:, 1:k] = phi[:, 1:k] - phi_kk[:, np.newaxis] * phi[:, k - 1 : 0 : -1]
+            phi[:, k] = phi_kk
+            partial_autocorrelation[:, k] = phi_kk
+    partial_autocorrelation[np.isnan(autocorrelation[:, 0])] = np.NaN
+    return pd.DataFrame(partial_autocorrelation.T, index=acf.index, columns=acf.columns)
+
+
+def _plot_correlation_function(
+    values: pd.DataFrame, confidence_bounds: pd.DataFrame, title: str, figsize: Tuple[int, int]
+):
+    """Plot correlation function of each segment with its confidence band on the separate subplot."""
+    k = values.shape[1]
+    columns_num = min(2, k)
+    rows_num = math.ceil(k / columns_num)
+
+    figsize = (figsize[0] * columns_num, figsize[1] * rows_num)
+    fig, ax = plt.subplots(rows_num, columns_num, figsize=figsize, constrained_layout=True, squeeze=False)
+    ax = ax.ravel()
+    fig.suptitle(title, fontsize=16)
+    lags = values.index.values
+    for i, segment in enumerate(values.columns):
+        ax[i].vlines(lags, 0, values[segment].values)
+        ax[i].plot(lags, values[segment].values, "o", markersize=5)
+        ax[i].axhline(0, color="black", linewidth=1)
+        ax[i].fill_between(
+            lags[1:], -confidence_bounds[segment].values[1:], confidence_bounds[segment].values[1:], alpha=0.25
+        )
+        ax[i].set_title(segment)
+        ax[i].xaxis.set_major_locator(MaxNLocator(integer=True))
+        ax[i].grid()
+    plt.show()
 
 
 def cross_corr_plot(
@@ -147,8 +277,11 @@ def cross_corr_plot(
     fig.suptitle("Cross-correlation", fontsize=16)
 
     df = ts.to_pandas()
+    if maxlags < 1 or maxlags >= len(df):
+        raise ValueError("Parameter maxlags should be >= 1 and < len(a)")
 
-    for i, (segment_1, segment_2) in enumerate(segment_pairs):
+    targets_1, targets_2 = [], []
+    for segment_1, segment_2 in segment_pairs:
         target_1 = df.loc[:, pd.IndexSlice[segment_1, "target"]]
         target_2 = df.loc[:, pd.IndexSlice[segment_2, "target"]]
 
@@ -157,11 +290,13 @@ def cross_corr_plot(
                 "At least one target column has integer dtype, "
                 "it is converted to float in order to calculate correlation."
             )
-            target_1 = target_1.astype(float)
-            target_2 = target_2.astype(float)
+        targets_1.append(target_1.values.astype(float))
+        targets_2.append(target_2.values.astype(float))
 
-        lags, correlations = _cross_correlation(a=target_1.values, b=target_2.values, maxlags=maxlags, normed=True)
-        ax[i].plot(lags, correlations, "-o", markersize=5)
+    lags = np.arange(-maxlags, maxlags + 1)
+    correlations = _masked_correlation(a=np.array(targets_1), b=np.array(targets_2), maxlags=maxlags, normed=True)
+    for i, (segment_1, segment_2) in enumerate(segment_pairs):
+        ax[i].plot(lags, correlations[i], "-o", markersize=5)
         ax[i].set_title(f"{segment_1} vs {segment_2}")
         ax[i].xaxis.set_major_locator(MaxNLocator(integer=True))
 
@@ -198,19 +333,16 @@ def sample_acf_plot(
         segments = sorted(ts.segments)
 
     k = min(n_segments, len(segments))
-    columns_num = min(2, k)
-    rows_num = math.ceil(k / columns_num)
-
-    figsize = (figsize[0] * columns_num, figsize[1] * rows_num)
-    fig, ax = plt.subplots(rows_num, columns_num, figsize=figsize, constrained_layout=True, squeeze=False)
-    ax = ax.ravel()
-    fig.suptitle("Autocorrelation", fontsize=16)
-    for i, name in enumerate(sorted(np.random.choice(segments, size=k, replace=False))):
-        df_slice = ts[:, name, :][name]
-        plot_acf(x=df_slice["target"].values, ax=ax[i], lags=lags)
-        ax[i].set_title(name)
-        ax[i].grid()
-    plt.show()
+    chosen_segments = sorted(np.random.choice(segments, size=k, replace=False))
+    acf = get_acf(ts=ts, lags=lags, segments=chosen_segments)
+    # confidence bounds by Bartlett's formula
+    n_observations = _get_targets(ts=ts, segments=chosen_segments).notna().sum().values
+    variance = np.ones_like(acf.values) / n_observations
+    variance[2:] *= 1 + 2 * np.cumsum(acf.values[1:-1] ** 2, axis=0)
+    confidence_bounds = pd.DataFrame(1.96 * np.sqrt(variance), index=acf.index, columns=acf.columns)
+    _plot_correlation_function(
+        values=acf, confidence_bounds=confidence_bounds, title="Autocorrelation", figsize=figsize
+    )
 
 
 def sample_pacf_plot(
@@ -244,19 +376,17 @@ def sample_pacf_plot(
         segments = sorted(ts.segments)
 
     k = min(n_segments, len(segments))
-    columns_num = min(2, k)
-    rows_num = math.ceil(k / columns_num)
-
-    figsize = (figsize[0] * columns_num, figsize[1] * rows_num)
-    fig, ax = plt.subplots(rows_num, columns_num, figsize=figsize, constrained_layout=True, squeeze=False)
-    ax = ax.ravel()
-    fig.suptitle("Partial Autocorrelation", fontsize=16)
-    for i, name in enumerate(sorted(np.random.choice(segments, size=k, replace=False))):
-        df_slice = ts[:, name, :][name]
-        plot_pacf(x=df_slice["target"].values, ax=ax[i], lags=lags)
-        ax[i].set_title(name)
-        ax[i].grid()
-    plt.show()
+    chosen_segments = sorted(np.random.choice(segments, size=k, replace=False))
+    pacf = get_pacf(ts=ts, lags=lags, segments=chosen_segments)
+    n_observations = _get_targets(ts=ts, segments=chosen_segments).notna().sum().values
+    confidence_bounds = pd.DataFrame(
+        np.repeat(1.96 / np.sqrt(n_observations)[np.newaxis, :], len(pacf), axis=0),
+        index=pacf.index,
+        columns=pacf.columns,
+    )
+    _plot_correlation_function(
+        values=pacf, confidence_bounds=confidence_bounds, title="Partial Autocorrelation", figsize=figsize
+    )
 
 
 def distribution_plot(
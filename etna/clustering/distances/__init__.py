@@ -2,3 +2,5 @@ from etna.clustering.distances.base import Distance
 from etna.clustering.distances.distance_matrix import DistanceMatrix
 from etna.clustering.distances.dtw_distance import DTWDistance
 from etna.clustering.distances.euclidean_distance import EuclideanDistance
+from etna.clustering.distances.paa import paa
+from etna.clustering.distances.paa import paa_distance
@@ -5,7 +5,11 @@ from abc import abstractmethod
 from typing import TYPE_CHECKING
 from typing import Any
 from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
 
+import numba
 import numpy as np
 import pandas as pd
 
@@ -15,6 +19,44 @@ if TYPE_CHECKING:
     from etna.datasets import TSDataset
 
 
+@numba.njit
+def _get_pair_index(k: int, n: int) -> Tuple[int, int]:
+    """Get indices ``(i, j)``, ``i < j`` of the pair with index ``k`` in condensed matrix of ``n`` series."""
+    i = n - 2 - int(np.sqrt(-8 * k + 4 * n * (n - 1) - 7) / 2 - 0.5)
+    # fix possible rounding errors of sqrt
+    while i > 0 and k < i * (2 * n - i - 1) // 2:
+        i -= 1
+    while k >= (i + 1) * (2 * n - i - 2) // 2:
+        i += 1
+    j = k - i * (2 * n - i - 1) // 2 + i + 1
+    return i, j
+
+
+@numba.njit
+def _get_series_pair(
+    values: np.ndarray, positions: np.ndarray, offsets: np.ndarray, i: int, j: int, trim_series: bool
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Get ``i``-th and ``j``-th series from the packed ones, take their common part if ``trim_series``."""
+    x1, x2 = values[offsets[i] : offsets[i + 1]], values[offsets[j] : offsets[j + 1]]
+    if not trim_series:
+        return x1, x2
+    positions1, positions2 = positions[offsets[i] : offsets[i + 1]], positions[offsets[j] : offsets[j + 1]]
+    common1 = np.empty(min(len(x1), len(x2)), dtype=np.int64)
+    common2 = np.empty(min(len(x1), len(x2)), dtype=np.int64)
+    k1, k2, n_common = 0, 0, 0
+    while k1 < len(positions1) and k2 < len(positions2):
+        if positions1[k1] == positions2[k2]:
+            common1[n_common], common2[n_common] = k1, k2
+            n_common += 1
+            k1 += 1
+            k2 += 1
+        elif positions1[k1] < positions2[k2]:
+            k1 += 1
+        else:
+            k2 += 1
+    return x1[common1[:n_common]], x2[common2[:n_common]]
+
+
 class Distance(ABC, BaseMixin):
     """Base class for distances between series."""
 
@@ -74,6 +116,69 @@ class Distance(ABC, BaseMixin):
         distance = min(self.inf_value, distance)
         return distance
 
+    def _compute_condensed_matrix(
+        self, values: np.ndarray, positions: np.ndarray, offsets: np.ndarray
+    ) -> Optional[np.ndarray]:
+        """Compute distances between all the pairs of packed series at once.
+
+        Parameters
+        ----------
+        values:
+            concatenated values of the series
+        positions:
+            positions of the values in the timestamp index of dataset
+        offsets:
+            ``i``-th series is ``values[offsets[i]:offsets[i + 1]]``
+
+        Returns
+        -------
+        np.ndarray:
+            condensed distance matrix (see :py:func:`scipy.spatial.distance.squareform`)
+            or None if the distance can't be computed by compiled code
+        """
+        return None
+
+    def _compute_aligned_condensed_matrix(self, values: np.ndarray, chunk_size: Optional[int]) -> Optional[np.ndarray]:
+        """Compute distances between all the pairs of aligned series at once.
+
+        Parameters
+        ----------
+        values:
+            array with shape (n_series, series_length), series have the same timestamps
+            (or only the same length if ``trim_series`` is False)
+        chunk_size:
+            number of series to process at once to bound memory, if None all the series are processed at once
+
+        Returns
+        -------
+        np.ndarray:
+            condensed distance matrix (see :py:func:`scipy.spatial.distance.squareform`)
+            or None if the distance has no special method for aligned series
+        """
+        return None
+
+    def _get_nearest(self, x: pd.Series, candidates: List[pd.Series]) -> Tuple[int, float]:
+        """Find the nearest to ``x`` series of ``candidates``.
+
+        Returns
+        -------
+        Tuple[int, float]:
+            index of the nearest candidate and distance to it
+        """
+        distances = [self(x, candidate) for candidate in candidates]
+        idx = int(np.argmin(distances))
+        return idx, distances[idx]
+
+    def _get_nearest_many(self, xs: List[pd.Series], candidates: List[pd.Series]) -> List[Tuple[int, float]]:
+        """Find the nearest series of ``candidates`` for each of ``xs``.
+
+        Returns
+        -------
+        List[Tuple[int, float]]:
+            index of the nearest candidate and distance to it for each of ``xs``
+        """
+        return [self._get_nearest(x=x, candidates=candidates) for x in xs]
+
     @staticmethod
     def _validate_dataset(ts: "TSDataset"):
         """Check that dataset does not contain NaNs."""
@@ -3,9 +3,11 @@ from typing import TYPE_CHECKING
 from typing import Dict
 from typing import List
 from typing import Optional
+from typing import Tuple
 
 import numpy as np
 import pandas as pd
+from scipy.spatial.distance import squareform
 
 from etna.clustering.distances.base import Distance
 from etna.core import BaseMixin
@@ -16,18 +18,32 @@ if TYPE_CHECKING:
 
 
 class DistanceMatrix(BaseMixin):
-    """DistanceMatrix computes distance matrix from TSDataset."""
+    """DistanceMatrix computes distance matrix from TSDataset.
 
-    def __init__(self, distance: Distance):
+    Notes
+    -----
+    Only distances between different series are computed, the matrix is stored in condensed form
+    (see :py:func:`scipy.spatial.distance.squareform`). Built-in distances compute all of them
+    in parallel by compiled code, the number of threads is controlled by ``NUMBA_NUM_THREADS``.
+
+    If all the series are aligned (have the same timestamps), euclidean distances are computed
+    with matrix multiplication by chunks of ``chunk_size`` series.
+    """
+
+    def __init__(self, distance: Distance, chunk_size: Optional[int] = None):
         """Init DistanceMatrix.
 
         Parameters
         ----------
         distance:
             class for distance measurement
+        chunk_size:
+            number of aligned series which distances to the others are computed at once,
+            it bounds memory used in addition to the matrix, if None all the series are processed at once
         """
         self.distance = distance
-        self.matrix: Optional[np.ndarray] = None
+        self.chunk_size = chunk_size
+        self.condensed_matrix: Optional[np.ndarray] = None
         self.series: Optional[List[np.ndarray]] = None
         self.segment2idx: Dict[str, int] = {}
         self.idx2segment: Dict[int, str] = {}
@@ -62,25 +78,68 @@ class DistanceMatrix(BaseMixin):
         self.series_number = len(series_list)
         return series_list
 
+    @property
+    def matrix(self) -> Optional[np.ndarray]:
+        """Square distance matrix."""
+        if self.condensed_matrix is None:
+            return None
+        return squareform(self.condensed_matrix, checks=False)
+
+    @staticmethod
+    def _pack_series(ts: "TSDataset", series: List[pd.Series]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Pack series into concatenated values, their positions in the timestamp index and offsets of series."""
+        values = np.concatenate([np.asarray(x.values, dtype=float) for x in series])
+        positions = np.concatenate([ts.index.get_indexer(x.index) for x in series]).astype(np.int64)
+        offsets = np.zeros(len(series) + 1, dtype=np.int64)
+        offsets[1:] = np.cumsum([len(x) for x in series])
+        return values, positions, offsets
+
+    @staticmethod
+    def _get_aligned_values(
+        values: np.ndarray, positions: np.ndarray, offsets: np.ndarray, trim_series: bool
+    ) -> Optional[np.ndarray]:
+        """Get 2D array of packed series if they have the same length and the same timestamps in case of ``trim_series``."""
+        n_series = len(offsets) - 1
+        lengths = np.diff(offsets)
+        if n_series == 0 or np.any(lengths != lengths[0]):
+            return None
+        if trim_series and np.any(positions.reshape(n_series, -1) != positions[: lengths[0]]):
+            return None
+        return values.reshape(n_series, -1)
+
     def _compute_dist(self, series: List[pd.Series], idx: int) -> np.ndarray:
-        """Compute distance from idx-th series to other ones."""
+        """Compute distance from idx-th series to the next ones."""
         if self.series_number is None:
             raise ValueError("Something went wrong during getting the series from dataset!")
-        distances = np.array([self.distance(series[idx], series[j]) for j in range(self.series_number)])
+        distances = np.array([self.distance(series[idx], series[j]) for j in range(idx + 1, self.series_number)])
         return distances
 
-    def _compute_dist_matrix(self, series: List[pd.Series]) -> np.ndarray:
-        """Compute distance matrix for given series."""
+    def _compute_dist_matrix(self, ts: "TSDataset", series: List[pd.Series]) -> np.ndarray:
+        """Compute condensed distance matrix for given series."""
         if self.series_number is None:
             raise ValueError("Something went wrong during getting the series from dataset!")
-        distances = np.empty(shape=(self.series_number, self.series_number))
-        logging_freq = max(1, self.series_number // 10)
         tslogger.log(f"Calculating distance matrix...")
+        values, positions, offsets = self._pack_series(ts=ts, series=series)
+        aligned_values = self._get_aligned_values(
+            values=values, positions=positions, offsets=offsets, trim_series=self.distance.trim_series
+        )
+        if aligned_values is not None:
+            distances = self.distance._compute_aligned_condensed_matrix(
+                values=aligned_values, chunk_size=self.chunk_size
+            )
+            if distances is not None:
+                return distances
+        distances = self.distance._compute_condensed_matrix(values=values, positions=positions, offsets=offsets)
+        if distances is not None:
+            return distances
+
+        distances_list = []
+        logging_freq = max(1, self.series_number // 10)
         for idx in range(self.series_number):
-            distances[idx] = self._compute_dist(series=series, idx=idx)
+            distances_list.append(self._compute_dist(series=series, idx=idx))
             if (idx + 1) % logging_freq == 0:
                 tslogger.log(f"Done {idx + 1} out of {self.series_number} ")
-        return distances
+        return np.concatenate(distances_list)
 
     def fit(self, ts: "TSDataset") -> "DistanceMatrix":
         """Fit distance matrix: get timeseries from ts and compute pairwise distances.
@@ -98,7 +157,7 @@ class DistanceMatrix(BaseMixin):
         """
         self._validate_dataset(ts)
         self.series = self._get_series(ts)
-        self.matrix = self._compute_dist_matrix(self.series)
+        self.condensed_matrix = self._compute_dist_matrix(ts=ts, series=self.series)
         return self
 
     def predict(self) -> np.ndarray:
@@ -109,9 +168,9 @@ class DistanceMatrix(BaseMixin):
         np.ndarray:
             2D array with distances between series
         """
-        if self.matrix is None:
+        if self.condensed_matrix is None:
             raise ValueError("DistanceMatrix is not fitted! Fit the DistanceMatrix before calling predict method!")
-        return self.matrix
+        return self.matrix  # type: ignore
 
     def fit_predict(self, ts: "TSDataset") -> np.ndarray:
         """Compute distance matrix and return it.
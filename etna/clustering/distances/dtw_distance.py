@@ -1,6 +1,7 @@
 from typing import TYPE_CHECKING
 from typing import Callable
 from typing import List
+from typing import Optional
 from typing import Tuple
 
 import numba
@@ -8,6 +9,8 @@ import numpy as np
 import pandas as pd
 
 from etna.clustering.distances.base import Distance
+from etna.clustering.distances.base import _get_pair_index
+from etna.clustering.distances.base import _get_series_pair
 
 if TYPE_CHECKING:
     from etna.datasets import TSDataset
@@ -32,10 +35,245 @@ def simple_dist(x1: float, x2: float) -> float:
     return abs(x1 - x2)
 
 
+@numba.njit
+def _get_window(x1_size: int, x2_size: int, window: int) -> int:
+    """Get width of Sakoe-Chiba band wide enough to reach the end of both series, negative ``window`` means no band."""
+    if window < 0:
+        return max(x1_size, x2_size)
+    return max(window, abs(x1_size - x2_size))
+
+
+@numba.njit
+def _build_matrix(
+    x1: np.ndarray, x2: np.ndarray, points_distance: Callable[[float, float], float], window: int = -1
+) -> np.ndarray:
+    """Build dtw-distance matrix for series x1 and x2, cells outside Sakoe-Chiba band of width ``window`` are inf."""
+    x1_size, x2_size = len(x1), len(x2)
+    window = _get_window(x1_size, x2_size, window)
+    matrix = np.full(shape=(x1_size, x2_size), fill_value=np.inf)
+    matrix[0][0] = points_distance(x1[0], x2[0])
+    for i in range(1, min(x1_size, window + 1)):
+        matrix[i][0] = points_distance(x1[i], x2[0]) + matrix[i - 1][0]
+    for j in range(1, min(x2_size, window + 1)):
+        matrix[0][j] = points_distance(x1[0], x2[j]) + matrix[0][j - 1]
+    for i in range(1, x1_size):
+        for j in range(max(1, i - window), min(x2_size, i + window + 1)):
+            matrix[i][j] = points_distance(x1[i], x2[j]) + min(matrix[i - 1][j], matrix[i][j - 1], matrix[i - 1][j - 1])
+    return matrix
+
+
+@numba.njit
+def _dtw_distance(
+    x1: np.ndarray,
+    x2: np.ndarray,
+    points_distance: Callable[[float, float], float],
+    window: int = -1,
+    max_distance: float = np.inf,
+) -> float:
+    """Compute dtw-distance between x1 and x2 keeping only two rows of dtw-distance matrix.
+
+    Only the cells of Sakoe-Chiba band of width ``window`` are filled. Computation is abandoned and ``inf``
+    is returned as soon as the distance is known to be greater than ``max_distance``.
+    """
+    x1_size, x2_size = len(x1), len(x2)
+    window = _get_window(x1_size, x2_size, window)
+    previous_row = np.full(x2_size, np.inf)
+    current_row = np.full(x2_size, np.inf)
+    previous_row[0] = points_distance(x1[0], x2[0])
+    for j in range(1, min(x2_size, window + 1)):
+        previous_row[j] = points_distance(x1[0], x2[j]) + previous_row[j - 1]
+    for i in range(1, x1_size):
+        min_j, max_j = max(0, i - window), min(x2_size - 1, i + window)
+        current_row[:] = np.inf
+        if min_j == 0:
+            current_row[0] = points_distance(x1[i], x2[0]) + previous_row[0]
+        for j in range(max(1, min_j), max_j + 1):
+            current_row[j] = points_distance(x1[i], x2[j]) + min(
+                previous_row[j], current_row[j - 1], previous_row[j - 1]
+            )
+        if np.min(current_row[min_j : max_j + 1]) > max_distance:
+            return np.inf
+        previous_row, current_row = current_row, previous_row
+    return previous_row[-1]
+
+
+@numba.njit
+def _lb_kim(x1: np.ndarray, x2: np.ndarray, points_distance: Callable[[float, float], float]) -> float:
+    """Get lower bound of dtw-distance by the first and the last points of the series that are always matched."""
+    if len(x1) == 1 and len(x2) == 1:
+        return points_distance(x1[0], x2[0])
+    return points_distance(x1[0], x2[0]) + points_distance(x1[-1], x2[-1])
+
+
+@numba.njit
+def _get_envelope(x: np.ndarray, window: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Get lower and upper envelopes of the series: min and max over Sakoe-Chiba band of width ``window``.
+
+    Envelopes are computed in ``O(n)`` with Lemire's streaming min/max: monotonic queues of indices
+    of the band are kept, so each point is pushed and popped only once.
+    """
+    n = len(x)
+    window = min(window, n)
+    lower, upper = np.empty(n), np.empty(n)
+    min_queue, max_queue = np.empty(n, dtype=np.int64), np.empty(n, dtype=np.int64)
+    min_head, min_tail, max_head, max_tail = 0, 0, 0, 0
+    for j in range(n + window):
+        if j < n:
+            while min_tail > min_head and x[min_queue[min_tail - 1]] >= x[j]:
+                min_tail -= 1
+            min_queue[min_tail] = j
+            min_tail += 1
+            while max_tail > max_head and x[max_queue[max_tail - 1]] <= x[j]:
+                max_tail -= 1
+            max_queue[max_tail] = j
+            max_tail += 1
+        i = j - window
+        if i < 0:
+            continue
+        while min_queue[min_head] < i - window:
+            min_head += 1
+        while max_queue[max_head] < i - window:
+            max_head += 1
+        lower[i], upper[i] = x[min_queue[min_head]], x[max_queue[max_head]]
+    return lower, upper
+
+
+@numba.njit
+def _get_envelopes(values: np.ndarray, offsets: np.ndarray, window: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Get envelopes of the packed series for the comparison with series of the same length, packed the same way."""
+    lowers, uppers = np.empty(len(values)), np.empty(len(values))
+    for k in range(len(offsets) - 1):
+        series = values[offsets[k] : offsets[k + 1]]
+        lower, upper = _get_envelope(series, _get_window(len(series), len(series), window))
+        lowers[offsets[k] : offsets[k + 1]] = lower
+        uppers[offsets[k] : offsets[k + 1]] = upper
+    return lowers, uppers
+
+
+@numba.njit
+def _lb_keogh(x: np.ndarray, lower: np.ndarray, upper: np.ndarray) -> float:
+    """Get lower bound of dtw-distance with ``simple_dist`` between x and the series of the same length with given envelopes."""
+    lower_bound = 0.0
+    for i in range(len(x)):
+        if x[i] > upper[i]:
+            lower_bound += x[i] - upper[i]
+        elif x[i] < lower[i]:
+            lower_bound += lower[i] - x[i]
+    return lower_bound
+
+
+@numba.njit
+def _dtw_nearest(
+    x: np.ndarray,
+    values: np.ndarray,
+    offsets: np.ndarray,
+    lowers: np.ndarray,
+    uppers: np.ndarray,
+    points_distance: Callable[[float, float], float],
+    window: int,
+    use_lb_keogh: bool,
+) -> Tuple[int, float]:
+    """Find the nearest to ``x`` of the packed candidates, ``i``-th of them is ``values[offsets[i]:offsets[i + 1]]``.
+
+    Candidates are checked in the order of LB_Kim lower bound, the ones with LB_Kim or LB_Keogh greater than the best
+    distance found so far are skipped, dtw-distance computation is abandoned as soon as it exceeds the best distance.
+    LB_Keogh is computed with the envelopes of candidates ``lowers`` and ``uppers`` packed the same way as ``values``.
+    """
+    n_candidates = len(offsets) - 1
+    lower_bounds = np.empty(n_candidates)
+    for k in range(n_candidates):
+        lower_bounds[k] = _lb_kim(x, values[offsets[k] : offsets[k + 1]], points_distance)
+
+    best_idx, best_distance = -1, np.inf
+    for k in np.argsort(lower_bounds):
+        if lower_bounds[k] > best_distance:
+            break
+        candidate = values[offsets[k] : offsets[k + 1]]
+        if use_lb_keogh and len(candidate) == len(x):
+            lower, upper = lowers[offsets[k] : offsets[k + 1]], uppers[offsets[k] : offsets[k + 1]]
+            if _lb_keogh(x, lower, upper) > best_distance:
+                continue
+        distance = _dtw_distance(x, candidate, points_distance, window, best_distance)
+        if distance < best_distance or best_idx == -1:
+            best_idx, best_distance = k, distance
+    return best_idx, best_distance
+
+
+@numba.njit(parallel=True)
+def _dtw_condensed_matrix(
+    values: np.ndarray,
+    positions: np.ndarray,
+    offsets: np.ndarray,
+    trim_series: bool,
+    inf_value: float,
+    points_distance: Callable[[float, float], float],
+    window: int,
+) -> np.ndarray:
+    """Compute condensed matrix of dtw-distances between packed series."""
+    n_series = len(offsets) - 1
+    n_pairs = n_series * (n_series - 1) // 2
+    distances = np.empty(n_pairs)
+    for k in numba.prange(n_pairs):
+        i, j = _get_pair_index(k, n_series)
+        x1, x2 = _get_series_pair(values, positions, offsets, i, j, trim_series)
+        if len(x1) == 0 and len(x2) == 0:
+            distances[k] = inf_value
+        else:
+            distances[k] = min(inf_value, _dtw_distance(x1, x2, points_distance, window))
+    return distances
+
+
+@numba.njit(parallel=True)
+def _dba_iteration(
+    centroid: np.ndarray,
+    values: np.ndarray,
+    offsets: np.ndarray,
+    points_distance: Callable[[float, float], float],
+    window: int,
+) -> np.ndarray:
+    """Run DBA iteration for the packed series, ``i``-th of them is ``values[offsets[i]:offsets[i + 1]]``.
+
+    Series are split into chunks processed in parallel, each chunk accumulates its own association table.
+    """
+    n_series = len(offsets) - 1
+    n_chunks = min(numba.get_num_threads(), max(n_series, 1))
+    assoc_tables = np.zeros((n_chunks, len(centroid)))
+    n_samples = np.zeros((n_chunks, len(centroid)))
+    for chunk in numba.prange(n_chunks):
+        for k in range(chunk, n_series, n_chunks):
+            series = values[offsets[k] : offsets[k + 1]]
+            matrix = _build_matrix(centroid, series, points_distance, window)
+            # walk the warping path from the end and add matched values of series to the centroid's points
+            i, j = len(centroid) - 1, len(series) - 1
+            while i and j:
+                assoc_tables[chunk, i] += series[j]
+                n_samples[chunk, i] += 1
+                up, left, diagonal = matrix[i - 1, j], matrix[i, j - 1], matrix[i - 1, j - 1]
+                if up <= left and up <= diagonal:
+                    i -= 1
+                elif left <= diagonal:
+                    j -= 1
+                else:
+                    i -= 1
+                    j -= 1
+    assoc_table = centroid + assoc_tables.sum(axis=0)
+    return assoc_table / (1 + n_samples.sum(axis=0))
+
+
 class DTWDistance(Distance):
-    """DTW distance handler."""
+    """DTW distance handler.
+
+    Warping path can be constrained with Sakoe-Chiba band: i-th point of one series can be matched only with
+    points of another series which indices differ from i not more than by ``window``.
+    It reduces computation from ``O(n * m)`` to ``O(n * window)``.
+    """
 
-    def __init__(self, points_distance: Callable[[float, float], float] = simple_dist, trim_series: bool = False):
+    def __init__(
+        self,
+        points_distance: Callable[[float, float], float] = simple_dist,
+        trim_series: bool = False,
+        window: Optional[int] = None,
+    ):
         """Init DTWDistance.
 
         Parameters
@@ -44,6 +282,9 @@ class DTWDistance(Distance):
             function to be used for computation of distance between two series' points
         trim_series:
             True if it is necessary to trim series, default False.
+        window:
+            width of Sakoe-Chiba band, if None the path isn't constrained.
+            For series of different lengths the band is widened to the difference of lengths
 
         Notes
         -----
@@ -51,24 +292,19 @@ class DTWDistance(Distance):
         """
         super().__init__(trim_series=trim_series)
         self.points_distance = points_distance
+        self.window = window
 
     @staticmethod
-    @numba.njit
-    def _build_matrix(x1: np.ndarray, x2: np.ndarray, points_distance: Callable[[float, float], float]) -> np.ndarray:
-        """Build dtw-distance matrix for series x1 and x2."""
-        x1_size, x2_size = len(x1), len(x2)
-        matrix = np.empty(shape=(x1_size, x2_size))
-        matrix[0][0] = points_distance(x1[0], x2[0])
-        for i in range(1, x1_size):
-            matrix[i][0] = points_distance(x1[i], x2[0]) + matrix[i - 1][0]
-        for j in range(1, x2_size):
-            matrix[0][j] = points_distance(x1[0], x2[j]) + matrix[0][j - 1]
-        for i in range(1, x1_size):
-            for j in range(1, x2_size):
-                matrix[i][j] = points_distance(x1[i], x2[j]) + min(
-                    matrix[i - 1][j], matrix[i][j - 1], matrix[i - 1][j - 1]
-                )
-        return matrix
+    def _build_matrix(
+        x1: np.ndarray, x2: np.ndarray, points_distance: Callable[[float, float], float], window: int = -1
+    ) -> np.ndarray:
+        """Build dtw-distance matrix for series x1 and x2, cells outside Sakoe-Chiba band of width ``window`` are inf."""
+        return _build_matrix(x1, x2, points_distance, window)
+
+    @property
+    def _window(self) -> int:
+        """Width of Sakoe-Chiba band for compiled code, -1 if the path isn't constrained."""
+        return -1 if self.window is None else self.window
 
     @staticmethod
     @numba.njit
@@ -92,27 +328,81 @@ class DTWDistance(Distance):
 
     def _compute_distance(self, x1: np.ndarray, x2: np.ndarray) -> float:
         """Compute distance between x1 and x2."""
-        matrix = self._build_matrix(x1=x1, x2=x2, points_distance=self.points_distance)
-        return matrix[-1][-1]
+        return _dtw_distance(x1, x2, self.points_distance, self._window)
+
+    def _compute_condensed_matrix(
+        self, values: np.ndarray, positions: np.ndarray, offsets: np.ndarray
+    ) -> Optional[np.ndarray]:
+        """Compute dtw-distances between all the pairs of packed series at once."""
+        # dtw isn't defined for empty series
+        if np.any(np.diff(offsets) == 0):
+            return None
+        return _dtw_condensed_matrix(
+            values, positions, offsets, self.trim_series, self.inf_value, self.points_distance, self._window
+        )
+
+    def _get_nearest(self, x: pd.Series, candidates: List[pd.Series]) -> Tuple[int, float]:
+        """Find the nearest to ``x`` series of ``candidates``.
+
+        Returns
+        -------
+        Tuple[int, float]:
+            index of the nearest candidate and distance to it
+        """
+        return self._get_nearest_many(xs=[x], candidates=candidates)[0]
+
+    def _get_nearest_many(self, xs: List[pd.Series], candidates: List[pd.Series]) -> List[Tuple[int, float]]:
+        """Find the nearest series of ``candidates`` for each of ``xs``.
+
+        Candidates that can't be nearer than the best found so far according to LB_Kim and LB_Keogh lower bounds
+        are skipped without computing dtw-distance. LB_Keogh is used only with ``simple_dist`` as points distance,
+        envelopes of candidates are computed once for all of ``xs``.
+
+        Returns
+        -------
+        List[Tuple[int, float]]:
+            index of the nearest candidate and distance to it for each of ``xs``
+        """
+        if self.trim_series or len(candidates) == 0 or any(len(candidate) == 0 for candidate in candidates):
+            return super()._get_nearest_many(xs=xs, candidates=candidates)
+        values = np.concatenate([candidate.values for candidate in candidates]).astype(float)
+        offsets = np.zeros(len(candidates) + 1, dtype=np.int64)
+        offsets[1:] = np.cumsum([len(candidate) for candidate in candidates])
+        use_lb_keogh = self.points_distance is simple_dist
+        if use_lb_keogh:
+            lowers, uppers = _get_envelopes(values, offsets, self._window)
+        else:
+            lowers, uppers = np.empty(0), np.empty(0)
+
+        nearest = []
+        for x in xs:
+            if len(x) == 0:
+                nearest.append(Distance._get_nearest(self, x=x, candidates=candidates))
+                continue
+            idx, distance = _dtw_nearest(
+                np.asarray(x.values, dtype=float),
+                values,
+                offsets,
+                lowers,
+                uppers,
+                self.points_distance,
+                self._window,
+                use_lb_keogh,
+            )
+            nearest.append((idx, min(self.inf_value, distance)))
+        return nearest
 
     def _dba_iteration(self, initial_centroid: np.ndarray, series_list: List[np.ndarray]) -> np.ndarray:
         """Run DBA iteration.
         * for each series from series list build a dtw matrix and warping path
         * update values of centroid with values from series according to path
         """
-        assoc_table = initial_centroid.copy()
-        n_samples = np.ones(shape=(len(initial_centroid)))
-        for series in series_list:
-            mat = self._build_matrix(x1=initial_centroid, x2=series, points_distance=self.points_distance)
-            path = self._get_path(matrix=mat)
-            i, j = len(initial_centroid) - 1, len(series) - 1
-            while i and j:
-                assoc_table[i] += series[j]
-                n_samples[i] += 1
-                path.pop(0)
-                i, j = path[0]
-        centroid = assoc_table / n_samples
-        return centroid
+        values = np.concatenate(series_list).astype(float)
+        offsets = np.zeros(len(series_list) + 1, dtype=np.int64)
+        offsets[1:] = np.cumsum([len(series) for series in series_list])
+        return _dba_iteration(
+            np.asarray(initial_centroid, dtype=float), values, offsets, self.points_distance, self._window
+        )
 
     @staticmethod
     def _get_longest_series(ts: "TSDataset") -> pd.Series:
@@ -133,7 +423,7 @@ class DTWDistance(Distance):
             series_list.append(series)
         return series_list
 
-    def _get_average(self, ts: "TSDataset", n_iters: int = 10) -> pd.DataFrame:
+    def _get_average(self, ts: "TSDataset", n_iters: int = 10, tolerance: Optional[float] = None) -> pd.DataFrame:
         """Get series that minimizes squared distance to given ones according to the dtw distance.
 
         Parameters
@@ -141,7 +431,9 @@ class DTWDistance(Distance):
         ts:
             TSDataset with series to be averaged
         n_iters:
-            number of DBA iterations to adjust centroid with series
+            maximum number of DBA iterations to adjust centroid with series
+        tolerance:
+            if given, iterations are stopped as soon as no point of centroid changes more than by ``tolerance``
 
         Returns
         -------
@@ -153,7 +445,10 @@ class DTWDistance(Distance):
         centroid = initial_centroid.values
         for _ in range(n_iters):
             new_centroid = self._dba_iteration(initial_centroid=centroid, series_list=series_list)
+            converged = tolerance is not None and np.max(np.abs(new_centroid - centroid)) <= tolerance
             centroid = new_centroid
+            if converged:
+                break
         centroid = pd.DataFrame({"timestamp": initial_centroid.index.values, "target": centroid})
         return centroid
 
@@ -1,10 +1,17 @@
 from typing import TYPE_CHECKING
+from typing import List
+from typing import Optional
+from typing import Tuple
 
 import numba
 import numpy as np
 import pandas as pd
 
 from etna.clustering.distances.base import Distance
+from etna.clustering.distances.base import _get_pair_index
+from etna.clustering.distances.base import _get_series_pair
+from etna.clustering.distances.paa import paa
+from etna.clustering.distances.paa import paa_distance
 
 if TYPE_CHECKING:
     from etna.datasets import TSDataset
@@ -29,6 +36,30 @@ def euclidean_distance(x1: np.ndarray, x2: np.ndarray) -> float:
     return np.linalg.norm(x1 - x2)
 
 
+# number of frames of PAA used to prune candidates in the nearest series search
+_PAA_N_FRAMES = 16
+# maximal number of elements of intermediate array of lower bounds in the nearest series search
+_LOWER_BOUNDS_CHUNK_ELEMENTS = 2**22
+
+
+@numba.njit(parallel=True)
+def _euclidean_condensed_matrix(
+    values: np.ndarray, positions: np.ndarray, offsets: np.ndarray, trim_series: bool, inf_value: float
+) -> np.ndarray:
+    """Compute condensed matrix of euclidean distances between packed series."""
+    n_series = len(offsets) - 1
+    n_pairs = n_series * (n_series - 1) // 2
+    distances = np.empty(n_pairs)
+    for k in numba.prange(n_pairs):
+        i, j = _get_pair_index(k, n_series)
+        x1, x2 = _get_series_pair(values, positions, offsets, i, j, trim_series)
+        if len(x1) == 0 and len(x2) == 0:
+            distances[k] = inf_value
+        else:
+            distances[k] = min(inf_value, np.sqrt(np.sum((x1 - x2) ** 2)))
+    return distances
+
+
 class EuclideanDistance(Distance):
     """Euclidean distance handler."""
 
@@ -46,6 +77,115 @@ class EuclideanDistance(Distance):
         """Compute distance between x1 and x2."""
         return euclidean_distance(x1=x1, x2=x2)
 
+    def _compute_condensed_matrix(
+        self, values: np.ndarray, positions: np.ndarray, offsets: np.ndarray
+    ) -> Optional[np.ndarray]:
+        """Compute euclidean distances between all the pairs of packed series at once."""
+        if not self.trim_series and len(np.unique(np.diff(offsets))) > 1:
+            return None
+        return _euclidean_condensed_matrix(values, positions, offsets, self.trim_series, self.inf_value)
+
+    def _compute_aligned_condensed_matrix(self, values: np.ndarray, chunk_size: Optional[int]) -> Optional[np.ndarray]:
+        """Compute euclidean distances between all the pairs of aligned series with matrix multiplication.
+
+        Squared distances are computed as ``||x||^2 + ||y||^2 - 2 * x @ y.T`` by chunks of ``chunk_size`` rows,
+        series are centered beforehand to reduce cancellation errors.
+        """
+        n_series, series_length = values.shape
+        if series_length == 0:
+            return None
+        values = values - values.mean(axis=0)
+        squared_norms = np.einsum("ij,ij->i", values, values)
+        chunk_size = n_series if chunk_size is None else max(1, chunk_size)
+
+        distances = np.empty(n_series * (n_series - 1) // 2)
+        pair_idx = 0
+        for start in range(0, n_series - 1, chunk_size):
+            stop = min(start + chunk_size, n_series - 1)
+            # distances from series start..stop - 1 to the next ones
+            squared_distances = (
+                squared_norms[start:stop, np.newaxis]
+                + squared_norms[np.newaxis, start + 1 :]
+                - 2 * values[start:stop] @ values[start + 1 :].T
+            )
+            upper_triangle = np.arange(start + 1, n_series)[np.newaxis, :] > np.arange(start, stop)[:, np.newaxis]
+            chunk_distances = squared_distances[upper_triangle]
+            distances[pair_idx : pair_idx + len(chunk_distances)] = chunk_distances
+            pair_idx += len(chunk_distances)
+        return np.minimum(np.sqrt(np.maximum(distances, 0)), self.inf_value)
+
+    def _get_nearest(self, x: pd.Series, candidates: List[pd.Series]) -> Tuple[int, float]:
+        """Find the nearest to ``x`` series of ``candidates``.
+
+        Returns
+        -------
+        Tuple[int, float]:
+            index of the nearest candidate and distance to it
+        """
+        return self._get_nearest_many(xs=[x], candidates=candidates)[0]
+
+    def _is_aligned(self, x: pd.Series, reference: pd.Series) -> bool:
+        """Check if ``x`` can be compared with ``reference`` point by point without trimming."""
+        if self.trim_series:
+            return x.index.equals(reference.index)
+        return len(x) == len(reference)
+
+    def _get_nearest_many(self, xs: List[pd.Series], candidates: List[pd.Series]) -> List[Tuple[int, float]]:
+        """Find the nearest series of ``candidates`` for each of ``xs``.
+
+        If series are aligned, piecewise aggregate approximations of candidates are computed once and lower bounds
+        of distances from all the series to all the candidates are computed at once. Candidates are checked
+        in the order of the lower bound, the search stops as soon as the lower bound exceeds the best distance
+        found so far.
+
+        Returns
+        -------
+        List[Tuple[int, float]]:
+            index of the nearest candidate and distance to it for each of ``xs``
+        """
+        if len(candidates) == 0 or len(candidates[0]) == 0:
+            return super()._get_nearest_many(xs=xs, candidates=candidates)
+        reference = candidates[0]
+        if not all(self._is_aligned(candidate, reference) for candidate in candidates):
+            return super()._get_nearest_many(xs=xs, candidates=candidates)
+
+        series_length = len(reference)
+        n_frames = min(_PAA_N_FRAMES, series_length)
+        candidates_values = np.vstack([candidate.values for candidate in candidates]).astype(float)
+        candidates_paa = paa(candidates_values, n_frames=n_frames)
+
+        aligned_idx = [i for i, x in enumerate(xs) if self._is_aligned(x, reference)]
+        nearest: List[Optional[Tuple[int, float]]] = [None] * len(xs)
+        # lower bounds are computed by chunks of series, so their intermediate array stays small
+        chunk_size = max(1, _LOWER_BOUNDS_CHUNK_ELEMENTS // (len(candidates) * n_frames))
+        for start in range(0, len(aligned_idx), chunk_size):
+            chunk_idx = aligned_idx[start : start + chunk_size]
+            xs_values = np.vstack([xs[i].values for i in chunk_idx]).astype(float)
+            lower_bounds = paa_distance(
+                paa(xs_values, n_frames=n_frames)[:, np.newaxis, :],
+                candidates_paa[np.newaxis, :, :],
+                series_length=series_length,
+            )
+            for i, x_values, x_lower_bounds in zip(chunk_idx, xs_values, lower_bounds):
+                nearest[i] = self._search_nearest(x_values, candidates_values, x_lower_bounds)
+        return [
+            Distance._get_nearest(self, x=x, candidates=candidates) if result is None else result
+            for x, result in zip(xs, nearest)
+        ]
+
+    def _search_nearest(
+        self, x_values: np.ndarray, candidates_values: np.ndarray, lower_bounds: np.ndarray
+    ) -> Tuple[int, float]:
+        """Find the nearest candidate computing distances only to the ones with lower bound under the best distance."""
+        best_idx, best_distance = -1, np.inf
+        for k in np.argsort(lower_bounds, kind="stable"):
+            if lower_bounds[k] > best_distance:
+                break
+            distance = np.sqrt(np.sum((candidates_values[k] - x_values) ** 2))
+            if distance < best_distance or (distance == best_distance and k < best_idx):
+                best_idx, best_distance = k, distance
+        return int(best_idx), min(self.inf_value, best_distance)
+
     def _get_average(self, ts: "TSDataset") -> pd.DataFrame:
         """Get series that minimizes squared distance to given ones according to the euclidean distance.
 
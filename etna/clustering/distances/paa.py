@@ -0,0 +1,65 @@
+from typing import Tuple
+
+import numpy as np
+
+
+def _get_frames(series_length: int, n_frames: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Get starts and lengths of ``n_frames`` almost equal frames that cover the series of given length."""
+    if n_frames < 1 or n_frames > series_length:
+        raise ValueError("Number of frames should be positive and not greater than the length of series!")
+    bounds = np.linspace(0, series_length, n_frames + 1).astype(int)
+    return bounds[:-1], np.diff(bounds)
+
+
+def paa(x: np.ndarray, n_frames: int) -> np.ndarray:
+    """Get piecewise aggregate approximation (PAA) of the series: means of its values over ``n_frames`` frames.
+
+    If the length of series isn't divisible by ``n_frames``, frames have lengths that differ by one.
+
+    Parameters
+    ----------
+    x:
+        array of series with shape (..., series_length), the last axis is considered as time
+    n_frames:
+        number of frames
+
+    Returns
+    -------
+    np.ndarray:
+        array of approximations with shape (..., n_frames)
+
+    Raises
+    ------
+    ValueError:
+        if ``n_frames`` isn't positive or greater than length of series
+    """
+    x = np.asarray(x, dtype=float)
+    starts, lengths = _get_frames(series_length=x.shape[-1], n_frames=n_frames)
+    return np.add.reduceat(x, starts, axis=-1) / lengths
+
+
+def paa_distance(x1_paa: np.ndarray, x2_paa: np.ndarray, series_length: int) -> np.ndarray:
+    """Get distance between PAA of the series that lower bounds euclidean distance between the series.
+
+    For series of length ``n`` with approximations ``a`` and ``b`` over frames of lengths ``l`` it is
+    ``sqrt(sum(l * (a - b) ** 2))`` that is not greater than euclidean distance between the series.
+
+    Parameters
+    ----------
+    x1_paa:
+        array of approximations with shape (..., n_frames)
+    x2_paa:
+        array of approximations with shape (..., n_frames), it should be broadcastable with ``x1_paa``
+    series_length:
+        length of the approximated series
+
+    Returns
+    -------
+    np.ndarray:
+        array of lower bounds of euclidean distances
+    """
+    _, lengths = _get_frames(series_length=series_length, n_frames=np.shape(x1_paa)[-1])
+    return np.sqrt(np.sum(lengths * (np.asarray(x1_paa) - np.asarray(x2_paa)) ** 2, axis=-1))
+
+
+__all__ = ["paa", "paa_distance"]
@@ -4,6 +4,7 @@ from typing import List
 from typing import Optional
 from typing import Union
 
+import numpy as np
 import pandas as pd
 from sklearn.cluster import AgglomerativeClustering
 
@@ -23,7 +24,13 @@ class ClusteringLinkageMode(Enum):
 
 
 class HierarchicalClustering(Clustering):
-    """Base class for hierarchical clustering."""
+    """Base class for hierarchical clustering.
+
+    For large number of segments distance matrix can be built only on the random sample of them:
+    the sample is clustered hierarchically and the rest of segments are assigned to the nearest medoid
+    of sample's clusters, so the full distance matrix is never computed.
+    New segments can be assigned to the clusters with :py:meth:`predict` by distances to centroids only.
+    """
 
     def __init__(self, distance: Distance):
         """Init HierarchicalClustering."""
@@ -37,20 +44,30 @@ class HierarchicalClustering(Clustering):
         self.segment2cluster: Optional[Dict[str, int]] = None
         self.distance: Distance = distance
         self.centroids_df: Optional[pd.DataFrame] = None
+        self.medoids: Optional[Dict[int, str]] = None
 
-    def build_distance_matrix(self, ts: "TSDataset"):
+    def build_distance_matrix(self, ts: "TSDataset", sample_size: Optional[int] = None, random_state: int = 0):
         """Compute distance matrix with given ts and distance.
 
         Parameters
         ----------
         ts:
             TSDataset with series to build distance matrix
-        distance:
-            instance if distance to compute matrix
+        sample_size:
+            if given, distance matrix is built only on the random sample of ``sample_size`` segments,
+            the rest of segments are assigned to the nearest medoid of the sample's clusters in :py:meth:`fit_predict`
+        random_state:
+            seed for sampling segments
         """
         self.ts = ts
+        segments = ts.segments
+        if sample_size is not None and sample_size < len(segments):
+            rng = np.random.default_rng(random_state)
+            sample_segments = sorted(rng.choice(segments, size=sample_size, replace=False))
+            ts = TSDataset(df=ts[:, sample_segments, "target"], freq=ts.freq)
         self.distance_matrix = DistanceMatrix(distance=self.distance)
         self.distance_matrix.fit(ts=ts)
+        self.medoids = None
         self.clusters = None
         self.segment2cluster = None
         self.centroids_df = None
@@ -99,14 +116,65 @@ class HierarchicalClustering(Clustering):
             raise ValueError(
                 "Distance matrix is not built! Build distance matrix using build_distance_matrix method before calling fit_predict!"
             )
-        self.clusters = self.clustering_algo.fit_predict(X=self.distance_matrix.matrix)
+        matrix = self.distance_matrix.matrix
+        self.clusters = self.clustering_algo.fit_predict(X=matrix)
         if self.clusters is None:
             raise ValueError("Something went wrong during predicting the clusters!")
         self.segment2cluster = {
             self.distance_matrix.idx2segment[i]: self.clusters[i] for i in range(len(self.clusters))
         }
+
+        if self.ts is not None and len(self.segment2cluster) < len(self.ts.segments):
+            self.medoids = self._get_medoids(matrix=matrix)  # type: ignore
+            medoids_series = [self.ts[:, segment, "target"].dropna() for segment in self.medoids.values()]
+            medoids_clusters = list(self.medoids.keys())
+            new_segments = [segment for segment in self.ts.segments if segment not in self.segment2cluster]
+            nearest = self.distance._get_nearest_many(
+                [self.ts[:, segment, "target"].dropna() for segment in new_segments], medoids_series
+            )
+            for segment, (idx, _) in zip(new_segments, nearest):
+                self.segment2cluster[segment] = medoids_clusters[idx]
+            self.segment2cluster = {segment: self.segment2cluster[segment] for segment in self.ts.segments}
+            self.clusters = list(self.segment2cluster.values())
         return self.segment2cluster
 
+    def _get_medoids(self, matrix: np.ndarray) -> Dict[int, str]:
+        """Get medoids of clusters: segments with the minimal sum of distances to the other segments of cluster."""
+        if self.clusters is None or self.distance_matrix is None:
+            raise ValueError("Something went wrong during predicting the clusters!")
+        medoids = {}
+        for cluster in np.unique(self.clusters):
+            indices = np.flatnonzero(self.clusters == cluster)
+            medoid_idx = indices[np.argmin(matrix[np.ix_(indices, indices)].sum(axis=1))]
+            medoids[cluster] = self.distance_matrix.idx2segment[medoid_idx]
+        return medoids
+
+    def predict(self, ts: "TSDataset") -> Dict[str, int]:
+        """Assign segments of the given dataset to the clusters of the fitted clustering by the nearest centroid.
+
+        Only distances between the segments and centroids are computed, centroids are computed by
+        :py:meth:`get_centroids` if they aren't computed yet.
+
+        Parameters
+        ----------
+        ts:
+            TSDataset with series to assign to clusters
+
+        Returns
+        -------
+        Dict[str, int]:
+            dict in format {segment: cluster}
+        """
+        if self.centroids_df is None:
+            self.get_centroids()
+        clusters = self.centroids_df.columns.get_level_values("cluster").unique().tolist()  # type: ignore
+        centroids_series = [self.centroids_df[cluster]["target"].dropna() for cluster in clusters]  # type: ignore
+        nearest = self.distance._get_nearest_many(
+            [ts[:, segment, "target"].dropna() for segment in ts.segments], centroids_series
+        )
+        segment2cluster = {segment: clusters[idx] for segment, (idx, _) in zip(ts.segments, nearest)}
+        return segment2cluster
+
     def _get_series_in_cluster(self, cluster: int) -> TSDataset:
         """Get series in cluster."""
         if self.ts is None or self.segment2cluster is None:
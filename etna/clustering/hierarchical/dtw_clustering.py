@@ -1,4 +1,5 @@
 from typing import TYPE_CHECKING
+from typing import Optional
 
 from etna.clustering.distances.dtw_distance import DTWDistance
 from etna.clustering.hierarchical.base import HierarchicalClustering
@@ -34,11 +35,18 @@ class DTWClustering(HierarchicalClustering):
      'segment_9': 2}
     """
 
-    def __init__(self):
-        """Create instance of DTWClustering."""
-        super().__init__(distance=DTWDistance())
+    def __init__(self, window: Optional[int] = None):
+        """Create instance of DTWClustering.
 
-    def build_distance_matrix(self, ts: "TSDataset"):
+        Parameters
+        ----------
+        window:
+            width of Sakoe-Chiba band of DTW distance, if None the warping path isn't constrained
+        """
+        self.window = window
+        super().__init__(distance=DTWDistance(window=window))
+
+    def build_distance_matrix(self, ts: "TSDataset", sample_size: Optional[int] = None, random_state: int = 0):
         """
         Build distance matrix with DTW distance.
 
@@ -46,8 +54,12 @@ class DTWClustering(HierarchicalClustering):
         ----------
         ts:
             TSDataset with series to build distance matrix
+        sample_size:
+            if given, distance matrix is built only on the random sample of ``sample_size`` segments
+        random_state:
+            seed for sampling segments
         """
-        super().build_distance_matrix(ts=ts)
+        super().build_distance_matrix(ts=ts, sample_size=sample_size, random_state=random_state)
 
 
 __all__ = ["DTWClustering"]
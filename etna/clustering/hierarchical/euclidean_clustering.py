@@ -1,4 +1,5 @@
 from typing import TYPE_CHECKING
+from typing import Optional
 
 from etna.clustering.distances.euclidean_distance import EuclideanDistance
 from etna.clustering.hierarchical.base import HierarchicalClustering
@@ -38,7 +39,7 @@ class EuclideanClustering(HierarchicalClustering):
         """Create instance of EuclideanClustering."""
         super().__init__(distance=EuclideanDistance())
 
-    def build_distance_matrix(self, ts: "TSDataset"):
+    def build_distance_matrix(self, ts: "TSDataset", sample_size: Optional[int] = None, random_state: int = 0):
         """
         Build distance matrix with euclidean distance.
 
@@ -46,8 +47,12 @@ class EuclideanClustering(HierarchicalClustering):
         ----------
         ts:
             TSDataset with series to build distance matrix
+        sample_size:
+            if given, distance matrix is built only on the random sample of ``sample_size`` segments
+        random_state:
+            seed for sampling segments
         """
-        super().build_distance_matrix(ts=ts)
+        super().build_distance_matrix(ts=ts, sample_size=sample_size, random_state=random_state)
 
 
 __all__ = ["EuclideanClustering"]
@@ -1,6 +1,7 @@
 import inspect
 import warnings
 from enum import Enum
+from typing import Sequence
 
 
 class BaseMixin:
@@ -9,10 +10,14 @@ class BaseMixin:
     def __repr__(self):
         """Get default representation of etna object."""
         # TODO: add tests default behaviour for all registered objects
+        return self._get_repr()
+
+    def _get_repr(self, exclude: Sequence[str] = ()) -> str:
+        """Get default representation of etna object without the init parameters listed in ``exclude``."""
         args_str_representation = ""
         init_args = inspect.signature(self.__init__).parameters
         for arg, param in init_args.items():
-            if param.kind == param.VAR_POSITIONAL:
+            if param.kind == param.VAR_POSITIONAL or arg in exclude:
                 continue
             elif param.kind == param.VAR_KEYWORD:
                 for arg_, value in self.__dict__[arg].items():
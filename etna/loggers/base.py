@@ -4,6 +4,7 @@ from contextlib import contextmanager
 from typing import TYPE_CHECKING
 from typing import Any
 from typing import Dict
+from typing import Optional
 from typing import Union
 
 import numpy as np
@@ -40,7 +41,7 @@ class BaseLogger(ABC, BaseMixin):
 
     @abstractmethod
     def log_backtest_metrics(
-        self, ts: "TSDataset", metrics_df: pd.DataFrame, forecast_df: pd.DataFrame, fold_info_df: pd.DataFrame
+        self, ts: "TSDataset", metrics_df: pd.DataFrame, forecast_df: Optional[pd.DataFrame], fold_info_df: pd.DataFrame
     ):
         """
         Write metrics to logger.
@@ -52,7 +53,7 @@ class BaseLogger(ABC, BaseMixin):
         metrics_df:
             Dataframe produced with :py:meth:`etna.pipeline.Pipeline._get_backtest_metrics`
         forecast_df:
-            Forecast from backtest
+            Forecast from backtest, None if it isn't returned by backtest
         fold_info_df:
             Fold information from backtest
         """
@@ -127,7 +128,7 @@ class _Logger(BaseLogger):
             logger.log(msg, **kwargs)
 
     def log_backtest_metrics(
-        self, ts: "TSDataset", metrics_df: pd.DataFrame, forecast_df: pd.DataFrame, fold_info_df: pd.DataFrame
+        self, ts: "TSDataset", metrics_df: pd.DataFrame, forecast_df: Optional[pd.DataFrame], fold_info_df: pd.DataFrame
     ):
         """
         Write metrics to logger.
@@ -139,7 +140,7 @@ class _Logger(BaseLogger):
         metrics_df:
             Dataframe produced with :py:meth:`etna.pipeline.Pipeline._get_backtest_metrics`
         forecast_df:
-            Forecast from backtest
+            Forecast from backtest, None if it isn't returned by backtest
         fold_info_df:
             Fold information from backtest
         """
@@ -2,6 +2,7 @@ import sys
 from typing import TYPE_CHECKING
 from typing import Any
 from typing import Dict
+from typing import Optional
 from typing import Union
 
 import pandas as pd
@@ -49,7 +50,7 @@ class ConsoleLogger(BaseLogger):
         self.logger.patch(lambda r: r.update(**kwargs)).info(msg)  # type: ignore
 
     def log_backtest_metrics(
-        self, ts: "TSDataset", metrics_df: pd.DataFrame, forecast_df: pd.DataFrame, fold_info_df: pd.DataFrame
+        self, ts: "TSDataset", metrics_df: pd.DataFrame, forecast_df: Optional[pd.DataFrame], fold_info_df: pd.DataFrame
     ):
         """
         Write metrics to logger.
@@ -61,7 +62,7 @@ class ConsoleLogger(BaseLogger):
         metrics_df:
             Dataframe produced with :py:meth:`etna.pipeline.Pipeline._get_backtest_metrics`
         forecast_df:
-            Forecast from backtest
+            Forecast from backtest, None if it isn't returned by backtest
         fold_info_df:
             Fold information from backtest
 
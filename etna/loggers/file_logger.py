@@ -137,7 +137,7 @@ class BaseFileLogger(BaseLogger):
             warnings.warn(str(e), UserWarning)
 
     def log_backtest_metrics(
-        self, ts: "TSDataset", metrics_df: pd.DataFrame, forecast_df: pd.DataFrame, fold_info_df: pd.DataFrame
+        self, ts: "TSDataset", metrics_df: pd.DataFrame, forecast_df: Optional[pd.DataFrame], fold_info_df: pd.DataFrame
     ):
         """
         Write metrics to logger.
@@ -149,7 +149,7 @@ class BaseFileLogger(BaseLogger):
         metrics_df:
             Dataframe produced with :py:meth:`etna.pipeline.Pipeline._get_backtest_metrics`
         forecast_df:
-            Forecast from backtest
+            Forecast from backtest, None if it isn't returned by backtest
         fold_info_df:
             Fold information from backtest
 
@@ -161,7 +161,8 @@ class BaseFileLogger(BaseLogger):
 
         try:
             self._save_table(metrics_df, "metrics")
-            self._save_table(TSDataset.to_flatten(forecast_df), "forecast")
+            if forecast_df is not None:
+                self._save_table(TSDataset.to_flatten(forecast_df), "forecast")
             self._save_table(fold_info_df, "fold_info")
         except Exception as e:
             warnings.warn(str(e), UserWarning)
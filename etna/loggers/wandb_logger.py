@@ -107,7 +107,7 @@ class WandbLogger(BaseLogger):
         pass
 
     def log_backtest_metrics(
-        self, ts: "TSDataset", metrics_df: pd.DataFrame, forecast_df: pd.DataFrame, fold_info_df: pd.DataFrame
+        self, ts: "TSDataset", metrics_df: pd.DataFrame, forecast_df: Optional[pd.DataFrame], fold_info_df: pd.DataFrame
     ):
         """
         Write metrics to logger.
@@ -119,7 +119,7 @@ class WandbLogger(BaseLogger):
         metrics_df:
             Dataframe produced with :py:meth:`etna.pipeline.Pipeline._get_backtest_metrics`
         forecast_df:
-            Forecast from backtest
+            Forecast from backtest, None if it isn't returned by backtest
         fold_info_df:
             Fold information from backtest
         """
@@ -129,10 +129,11 @@ class WandbLogger(BaseLogger):
         summary: Dict[str, Any] = dict()
         if self.table:
             summary["metrics"] = wandb.Table(data=metrics_df)
-            summary["forecast"] = wandb.Table(data=TSDataset.to_flatten(forecast_df))
+            if forecast_df is not None:
+                summary["forecast"] = wandb.Table(data=TSDataset.to_flatten(forecast_df))
             summary["fold_info"] = wandb.Table(data=fold_info_df)
 
-        if self.plot:
+        if self.plot and forecast_df is not None:
             fig = plot_backtest_interactive(forecast_df, ts, history_len=100)
             summary["backtest"] = fig
 
@@ -1,6 +1,10 @@
+import inspect
 from enum import Enum
 from typing import Callable
 from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
 from typing import Union
 
 import numpy as np
@@ -9,6 +13,7 @@ import pandas as pd
 from etna.core import BaseMixin
 from etna.datasets.tsdataset import TSDataset
 from etna.loggers import tslogger
+from etna.metrics.functional_metrics import _PER_COLUMN_METRICS
 
 
 class MetricAggregationMode(str, Enum):
@@ -30,6 +35,9 @@ class Metric(BaseMixin):
 
     How it works: Metric computes ``metric_fn`` value for each segment in given forecast
     dataset and aggregates it according to mode.
+
+    For the built-in functional metrics values of all the segments are computed at once on the arrays of targets
+    with shape (n_timestamps, n_segments).
     """
 
     def __init__(self, metric_fn: Callable[..., float], mode: str = MetricAggregationMode.per_segment, **kwargs):
@@ -57,6 +65,7 @@ class Metric(BaseMixin):
         """
         self.metric_fn = metric_fn
         self.kwargs = kwargs
+        self._metric_fn_per_column = self._get_metric_fn_per_column(metric_fn=metric_fn, kwargs=kwargs)
         if MetricAggregationMode(mode) == MetricAggregationMode.macro:
             self._aggregate_metrics = self._macro_average
         elif MetricAggregationMode(mode) == MetricAggregationMode.per_segment:
@@ -102,12 +111,17 @@ class Metric(BaseMixin):
                 f"There are segments in y_true that are not in y_pred, for example: "
                 f"{', '.join(list(true_diff_pred)[:5])}"
             )
-        for segment in segments_true:
-            for name, dataset in zip(("y_true", "y_pred"), (y_true, y_pred)):
-                if "target" not in dataset.loc[:, segment].columns:
-                    raise ValueError(
-                        f"All the segments in {name} should contain 'target' column. Segment {segment} doesn't."
-                    )
+        for name, dataset in zip(("y_true", "y_pred"), (y_true, y_pred)):
+            columns = dataset.df.columns
+            segments_with_target = set(
+                columns[columns.get_level_values("feature") == "target"].get_level_values("segment")
+            )
+            segments_without_target = segments_true - segments_with_target
+            if segments_without_target:
+                segment = sorted(segments_without_target)[0]
+                raise ValueError(
+                    f"All the segments in {name} should contain 'target' column. Segment {segment} doesn't."
+                )
 
     @staticmethod
     def _validate_timestamp_columns(timestamp_true: pd.Series, timestamp_pred: pd.Series):
@@ -129,6 +143,60 @@ class Metric(BaseMixin):
         if set(timestamp_pred) != set(timestamp_true):
             raise ValueError("y_true and y_pred have different timestamps")
 
+    @staticmethod
+    def _get_metric_fn_per_column(
+        metric_fn: Callable[..., float], kwargs: Dict[str, object]
+    ) -> Optional[Callable[..., np.ndarray]]:
+        """Get version of ``metric_fn`` computing values for all the columns at once if it supports ``kwargs``."""
+        metric_fn_per_column = _PER_COLUMN_METRICS.get(metric_fn)
+        if metric_fn_per_column is None:
+            return None
+        try:
+            inspect.signature(metric_fn_per_column).bind(None, None, **kwargs)
+        except TypeError:
+            return None
+        return metric_fn_per_column
+
+    @staticmethod
+    def _get_target_arrays(
+        y_true: TSDataset, y_pred: TSDataset, segments: List[str]
+    ) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Get arrays of targets with shape (n_timestamps, n_segments) from ``y_true`` and ``y_pred``.
+
+        Parameters
+        ----------
+        y_true:
+            y_true dataset
+        y_pred:
+            y_pred dataset
+        segments:
+            segments to take in the order of the columns
+
+        Returns
+        -------
+        :
+            arrays of ``y_true`` and ``y_pred`` targets or None if they can't be compared at once:
+            datasets have different timestamps or targets contain NaNs
+
+        Raises
+        ------
+        ValueError:
+            If there are mismatches in ``y_true`` and ``y_pred`` timestamps
+        """
+        if not y_true.df.index.equals(y_pred.df.index):
+            return None
+        columns = pd.MultiIndex.from_product([segments, ["target"]])
+        true_values = y_true.df.loc[:, columns].to_numpy(dtype=float)
+        pred_values = y_pred.df.loc[:, columns].to_numpy(dtype=float)
+
+        true_nans, pred_nans = np.isnan(true_values), np.isnan(pred_values)
+        if not np.array_equal(true_nans, pred_nans):
+            raise ValueError("y_true and y_pred have different timestamps")
+        if true_nans.any() or pred_nans.any():
+            return None
+        return true_values, pred_values
+
     @staticmethod
     def _macro_average(metrics_per_segments: Dict[str, float]) -> Union[float, Dict[str, float]]:
         """
@@ -186,18 +254,35 @@ class Metric(BaseMixin):
         self._log_start()
         self._validate_segment_columns(y_true=y_true, y_pred=y_pred)
 
-        segments = set(y_true.df.columns.get_level_values("segment"))
-        metrics_per_segment = {}
-        for segment in segments:
-            self._validate_timestamp_columns(
-                timestamp_true=y_true[:, segment, "target"].dropna().index,
-                timestamp_pred=y_pred[:, segment, "target"].dropna().index,
-            )
-            metrics_per_segment[segment] = self.metric_fn(
-                y_true=y_true[:, segment, "target"].values, y_pred=y_pred[:, segment, "target"].values, **self.kwargs
-            )
+        segments = sorted(set(y_true.df.columns.get_level_values("segment")))
+        values = self._compute_all_segments(y_true=y_true, y_pred=y_pred, segments=segments)
+        if values is not None:
+            metrics_per_segment = dict(zip(segments, values))
+        else:
+            metrics_per_segment = {}
+            for segment in segments:
+                self._validate_timestamp_columns(
+                    timestamp_true=y_true[:, segment, "target"].dropna().index,
+                    timestamp_pred=y_pred[:, segment, "target"].dropna().index,
+                )
+                metrics_per_segment[segment] = self._compute_segment(y_true=y_true, y_pred=y_pred, segment=segment)
         metrics = self._aggregate_metrics(metrics_per_segment)
         return metrics
 
+    def _compute_all_segments(self, y_true: TSDataset, y_pred: TSDataset, segments: List[str]) -> Optional[np.ndarray]:
+        """Compute metric's values for all the ``segments`` at once, return None if it isn't possible."""
+        if self._metric_fn_per_column is None:
+            return None
+        arrays = self._get_target_arrays(y_true=y_true, y_pred=y_pred, segments=segments)
+        if arrays is None:
+            return None
+        return self._metric_fn_per_column(*arrays, **self.kwargs)
+
+    def _compute_segment(self, y_true: TSDataset, y_pred: TSDataset, segment: str) -> float:
+        """Compute metric's value for one segment."""
+        return self.metric_fn(
+            y_true=y_true[:, segment, "target"].values, y_pred=y_pred[:, segment, "target"].values, **self.kwargs
+        )
+
 
 __all__ = ["Metric", "MetricAggregationMode"]
@@ -1,7 +1,16 @@
+import warnings
+from typing import Callable
+from typing import Dict
 from typing import List
 from typing import Union
 
 import numpy as np
+from sklearn.exceptions import UndefinedMetricWarning
+from sklearn.metrics import mean_absolute_error
+from sklearn.metrics import mean_squared_error
+from sklearn.metrics import mean_squared_log_error
+from sklearn.metrics import median_absolute_error
+from sklearn.metrics import r2_score
 
 ArrayLike = List[Union[float, List[float]]]
 
@@ -112,3 +121,60 @@ def sign(y_true: ArrayLike, y_pred: ArrayLike) -> float:
         raise ValueError("Shapes of the labels must be the same")
 
     return np.mean(np.sign(y_true_array - y_pred_array))
+
+
+def _mae_per_column(y_true: np.ndarray, y_pred: np.ndarray) -> np.ndarray:
+    return np.mean(np.abs(y_true - y_pred), axis=0)
+
+
+def _mse_per_column(y_true: np.ndarray, y_pred: np.ndarray) -> np.ndarray:
+    return np.mean((y_true - y_pred) ** 2, axis=0)
+
+
+def _msle_per_column(y_true: np.ndarray, y_pred: np.ndarray) -> np.ndarray:
+    if (y_true < 0).any() or (y_pred < 0).any():
+        raise ValueError("Mean Squared Logarithmic Error cannot be used when targets contain negative values.")
+    return np.mean((np.log1p(y_true) - np.log1p(y_pred)) ** 2, axis=0)
+
+
+def _medae_per_column(y_true: np.ndarray, y_pred: np.ndarray) -> np.ndarray:
+    return np.median(np.abs(y_true - y_pred), axis=0)
+
+
+def _r2_score_per_column(y_true: np.ndarray, y_pred: np.ndarray) -> np.ndarray:
+    if len(y_true) < 2:
+        warnings.warn("R^2 score is not well-defined with less than two samples.", UndefinedMetricWarning)
+        return np.full(y_true.shape[1], np.nan)
+    numerator = np.sum((y_true - y_pred) ** 2, axis=0)
+    denominator = np.sum((y_true - np.mean(y_true, axis=0)) ** 2, axis=0)
+    # constant y_true gives 1 for the perfect forecast and 0 otherwise as in sklearn
+    result = np.where(numerator == 0, 1.0, 0.0)
+    nonzero_denominator = denominator != 0
+    result[nonzero_denominator] = 1 - numerator[nonzero_denominator] / denominator[nonzero_denominator]
+    return result
+
+
+def _mape_per_column(y_true: np.ndarray, y_pred: np.ndarray, eps: float = 1e-15) -> np.ndarray:
+    y_true = y_true.clip(eps)
+    return np.mean(np.abs((y_true - y_pred) / y_true), axis=0) * 100
+
+
+def _smape_per_column(y_true: np.ndarray, y_pred: np.ndarray, eps: float = 1e-15) -> np.ndarray:
+    return 100 * np.mean(2 * np.abs(y_pred - y_true) / (np.abs(y_true) + np.abs(y_pred)).clip(eps), axis=0)
+
+
+def _sign_per_column(y_true: np.ndarray, y_pred: np.ndarray) -> np.ndarray:
+    return np.mean(np.sign(y_true - y_pred), axis=0)
+
+
+# functional metrics and their versions computing values for each column of 2-D arrays (time x segment) at once
+_PER_COLUMN_METRICS: Dict[Callable[..., float], Callable[..., np.ndarray]] = {
+    mean_absolute_error: _mae_per_column,
+    mean_squared_error: _mse_per_column,
+    mean_squared_log_error: _msle_per_column,
+    median_absolute_error: _medae_per_column,
+    r2_score: _r2_score_per_column,
+    mape: _mape_per_column,
+    smape: _smape_per_column,
+    sign: _sign_per_column,
+}
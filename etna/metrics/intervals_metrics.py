@@ -1,9 +1,12 @@
 from typing import Dict
+from typing import List
+from typing import Optional
 from typing import Sequence
 from typing import Tuple
 from typing import Union
 
 import numpy as np
+import pandas as pd
 
 from etna.datasets import TSDataset
 from etna.metrics.base import Metric
@@ -15,12 +18,21 @@ def dummy():
 
 
 class _QuantileMetricMixin:
+    quantiles: Sequence[float]
+
     def _validate_tsdataset_quantiles(self, ts: TSDataset, quantiles: Sequence[float]) -> None:
         """Check if quantiles presented in y_pred."""
         features = set(ts.df.columns.get_level_values("feature"))
         for quantile in quantiles:
             assert f"target_{quantile:.4g}" in features, f"Quantile {quantile} is not presented in tsdataset."
 
+    def _get_quantile_arrays(self, ts: TSDataset, segments: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """Get arrays of lower and upper quantiles with shape (n_timestamps, n_segments) in one pass over dataset."""
+        quantile_columns = [f"target_{quantile:.4g}" for quantile in self.quantiles]
+        columns = pd.MultiIndex.from_product([segments, quantile_columns])
+        values = ts.df.loc[:, columns].to_numpy(dtype=float).reshape(len(ts.df), len(segments), len(quantile_columns))
+        return values[:, :, 0], values[:, :, 1]
+
 
 class Coverage(Metric, _QuantileMetricMixin):
     """Coverage metric for prediction intervals - precenteage of samples in the interval ``[lower quantile, upper quantile]``.
@@ -67,22 +79,22 @@ class Coverage(Metric, _QuantileMetricMixin):
         -------
             metric's value aggregated over segments or not (depends on mode)
         """
-        self._validate_segment_columns(y_true=y_true, y_pred=y_pred)
         self._validate_tsdataset_quantiles(ts=y_pred, quantiles=self.quantiles)
+        return super().__call__(y_true=y_true, y_pred=y_pred)
 
-        segments = set(y_true.df.columns.get_level_values("segment"))
-        metrics_per_segment = {}
-        for segment in segments:
-            self._validate_timestamp_columns(
-                timestamp_true=y_true[:, segment, "target"].dropna().index,
-                timestamp_pred=y_pred[:, segment, "target"].dropna().index,
-            )
-            upper_quantile_flag = y_true[:, segment, "target"] <= y_pred[:, segment, f"target_{self.quantiles[1]:.4g}"]
-            lower_quantile_flag = y_true[:, segment, "target"] >= y_pred[:, segment, f"target_{self.quantiles[0]:.4g}"]
+    def _compute_all_segments(self, y_true: TSDataset, y_pred: TSDataset, segments: List[str]) -> Optional[np.ndarray]:
+        """Compute metric's values for all the ``segments`` at once, return None if it isn't possible."""
+        arrays = self._get_target_arrays(y_true=y_true, y_pred=y_pred, segments=segments)
+        if arrays is None:
+            return None
+        lower_quantile, upper_quantile = self._get_quantile_arrays(ts=y_pred, segments=segments)
+        return np.mean((arrays[0] >= lower_quantile) & (arrays[0] <= upper_quantile), axis=0)
 
-            metrics_per_segment[segment] = np.mean(upper_quantile_flag * lower_quantile_flag)
-        metrics = self._aggregate_metrics(metrics_per_segment)
-        return metrics
+    def _compute_segment(self, y_true: TSDataset, y_pred: TSDataset, segment: str) -> float:
+        """Compute metric's value for one segment."""
+        upper_quantile_flag = y_true[:, segment, "target"] <= y_pred[:, segment, f"target_{self.quantiles[1]:.4g}"]
+        lower_quantile_flag = y_true[:, segment, "target"] >= y_pred[:, segment, f"target_{self.quantiles[0]:.4g}"]
+        return np.mean(upper_quantile_flag * lower_quantile_flag)
 
 
 class Width(Metric, _QuantileMetricMixin):
@@ -130,23 +142,24 @@ class Width(Metric, _QuantileMetricMixin):
         -------
             metric's value aggregated over segments or not (depends on mode)
         """
-        self._validate_segment_columns(y_true=y_true, y_pred=y_pred)
         self._validate_tsdataset_quantiles(ts=y_pred, quantiles=self.quantiles)
-
-        segments = set(y_true.df.columns.get_level_values("segment"))
-        metrics_per_segment = {}
-        for segment in segments:
-            self._validate_timestamp_columns(
-                timestamp_true=y_true[:, segment, "target"].dropna().index,
-                timestamp_pred=y_pred[:, segment, "target"].dropna().index,
-            )
-            upper_quantile = y_pred[:, segment, f"target_{self.quantiles[1]:.4g}"]
-            lower_quantile = y_pred[:, segment, f"target_{self.quantiles[0]:.4g}"]
-
-            metrics_per_segment[segment] = np.abs(lower_quantile - upper_quantile).mean()
-
-        metrics = self._aggregate_metrics(metrics_per_segment)
-        return metrics
+        return super().__call__(y_true=y_true, y_pred=y_pred)
+
+    def _compute_all_segments(self, y_true: TSDataset, y_pred: TSDataset, segments: List[str]) -> Optional[np.ndarray]:
+        """Compute metric's values for all the ``segments`` at once, return None if it isn't possible."""
+        if self._get_target_arrays(y_true=y_true, y_pred=y_pred, segments=segments) is None:
+            return None
+        lower_quantile, upper_quantile = self._get_quantile_arrays(ts=y_pred, segments=segments)
+        # mean of the segment skips NaNs in quantiles, so they are left to the computation per segment
+        if np.isnan(lower_quantile).any() or np.isnan(upper_quantile).any():
+            return None
+        return np.mean(np.abs(lower_quantile - upper_quantile), axis=0)
+
+    def _compute_segment(self, y_true: TSDataset, y_pred: TSDataset, segment: str) -> float:
+        """Compute metric's value for one segment."""
+        upper_quantile = y_pred[:, segment, f"target_{self.quantiles[1]:.4g}"]
+        lower_quantile = y_pred[:, segment, f"target_{self.quantiles[0]:.4g}"]
+        return np.abs(lower_quantile - upper_quantile).mean()
 
 
 __all__ = ["Coverage", "Width"]
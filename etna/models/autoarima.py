@@ -1,7 +1,20 @@
+import glob
+import inspect
+import json
+import os
+import socket
+import tempfile
+import threading
 import warnings
+from enum import Enum
+from pathlib import Path
+from typing import Any
+from typing import Dict
 from typing import List
 from typing import Optional
 from typing import Sequence
+from typing import Tuple
+from typing import Union
 
 import numpy as np
 import pandas as pd
@@ -9,8 +22,10 @@ import pmdarima as pm
 from pmdarima.arima import ARIMA
 from statsmodels.tools.sm_exceptions import ValueWarning
 
+from etna.datasets.tsdataset import TSDataset
 from etna.models.base import BaseAdapter
 from etna.models.base import PerSegmentPredictionIntervalModel
+from etna.models.base import log_decorator
 
 warnings.filterwarnings(
     message="No frequency information was provided, so inferred frequency .* will be used",
@@ -19,6 +34,29 @@ warnings.filterwarnings(
     module="statsmodels.tsa.base.tsa_model",
 )
 
+_ARIMA_PARAMS = set(inspect.signature(ARIMA).parameters)
+
+
+class OrderCacheMode(str, Enum):
+    """Enum for ways to use the previously selected orders of AutoARIMA model.
+
+    Attributes
+    ----------
+    start:
+        differencing orders are fixed and the stepwise search starts from the previously selected order
+    fix:
+        the model with the previously selected order is fitted without search
+    """
+
+    start = "start"
+    fix = "fix"
+
+    @classmethod
+    def _missing_(cls, value):
+        raise NotImplementedError(
+            f"{value} is not a valid {cls.__name__}. Only {', '.join([repr(m.value) for m in cls])} modes are allowed"
+        )
+
 
 class _AutoARIMAAdapter(BaseAdapter):
     """
@@ -28,6 +66,9 @@ class _AutoARIMAAdapter(BaseAdapter):
     -----
     We use auto ARIMA [1] model from pmdarima package.
 
+    If ``cached_order`` attribute is set (dictionary with ``order``, ``seasonal_order`` and ``with_intercept`` keys
+    of the previously selected model), it is used according to ``order_cache_mode`` instead of the full search.
+
     .. `auto ARIMA: <https://alkaline-ml.com/pmdarima/>_`
 
     """
@@ -45,6 +86,8 @@ class _AutoARIMAAdapter(BaseAdapter):
             Training parameters for auto_arima from pmdarima package.
         """
         self.kwargs = kwargs
+        self.cached_order: Optional[Dict[str, Any]] = None
+        self.order_cache_mode: OrderCacheMode = OrderCacheMode.start
         self._model: Optional[ARIMA] = None
         self.regressor_columns: List[str] = []
 
@@ -81,9 +124,44 @@ class _AutoARIMAAdapter(BaseAdapter):
 
         exog_train = self._select_regressors(df)
 
-        self._model = pm.auto_arima(df["target"], X=exog_train, **self.kwargs)
+        if self.cached_order is None:
+            self._model = pm.auto_arima(df["target"], X=exog_train, **self.kwargs)
+        elif self.order_cache_mode == OrderCacheMode.fix:
+            arima_params = {key: value for key, value in self.kwargs.items() if key in _ARIMA_PARAMS}
+            arima_params.update(self.cached_order)
+            self._model = ARIMA(**arima_params).fit(df["target"], X=exog_train)
+        else:
+            self._model = pm.auto_arima(df["target"], X=exog_train, **self._get_start_kwargs())
         return self
 
+    def _get_start_kwargs(self) -> Dict[str, Any]:
+        """Get parameters of the search that starts from the cached order."""
+        if self.cached_order is None:
+            raise ValueError("Something went wrong, cached_order is None!")
+        kwargs = dict(self.kwargs)
+        start_p, d, start_q = self.cached_order["order"]
+        kwargs.update(start_p=start_p, d=d, start_q=start_q)
+        start_P, D, start_Q, m = self.cached_order["seasonal_order"]  # noqa: N806
+        if m > 1:
+            kwargs.update(start_P=start_P, D=D, start_Q=start_Q)
+        return kwargs
+
+    def get_selected_order(self) -> Dict[str, Any]:
+        """Get the order of the fitted model.
+
+        Returns
+        -------
+        :
+            dictionary with ``order``, ``seasonal_order`` and ``with_intercept`` of the fitted model
+        """
+        if self._model is None:
+            raise ValueError("AutoARIMA model is not fitted! Fit the model before calling get_selected_order method!")
+        return {
+            "order": [int(value) for value in self._model.order],
+            "seasonal_order": [int(value) for value in self._model.seasonal_order],
+            "with_intercept": bool(self._model.with_intercept),
+        }
+
     def predict(self, df: pd.DataFrame, prediction_interval: bool, quantiles: Sequence[float]) -> pd.DataFrame:
         """
         Compute predictions from auto ARIMA model.
@@ -174,10 +252,25 @@ class AutoARIMAModel(PerSegmentPredictionIntervalModel):
     Notes
     -----
     We use :py:class:`pmdarima.arima.arima.ARIMA`.
+
+    By default, segments are fitted one after another and ``n_jobs`` is passed to the search of each segment.
+    If ``worker_budget`` is set, segments are fitted in parallel processes within this budget and the search of each
+    segment runs in a single process. During the backtest the budget is divided between the folds fitted in parallel.
+
+    If ``order_cache_mode`` is set, orders selected for the segments are kept in the order cache (in the model
+    and in ``order_cache_path`` file if it is given) and refits of the segments use them instead of the full search.
+    Cached order is used only if it was selected on the data that ends not later than the data of the refit,
+    so the folds of the backtest don't reuse the orders selected on their test windows. The full search is repeated
+    for the segment every ``full_search_every`` refits.
     """
 
     def __init__(
         self,
+        worker_budget: Optional[int] = None,
+        joblib_params: Optional[Dict[str, Any]] = None,
+        order_cache_mode: Optional[str] = None,
+        order_cache_path: Optional[Union[str, Path]] = None,
+        full_search_every: Optional[int] = None,
         **kwargs,
     ):
         """
@@ -185,12 +278,162 @@ class AutoARIMAModel(PerSegmentPredictionIntervalModel):
 
         Parameters
         ----------
+        worker_budget:
+            Total number of processes to fit the segments with. When provided segments are fitted in parallel
+            and ``n_jobs`` of auto_arima is set to 1
+        joblib_params:
+            Additional parameters for :py:class:`joblib.Parallel` that fits the segments
+        order_cache_mode:
+            How to use the orders selected during the previous fits of the segments:
+
+            * If "start", then differencing orders are fixed and the stepwise search starts from the previous order
+
+            * If "fix", then the model with the previous order is fitted without search
+
+            * If None, then the orders aren't cached
+        order_cache_path:
+            Path to json file to load the order cache from and to save it to after the fit,
+            if None the cache is kept only in the model. Each process also saves its cache to the file
+            ``{stem}.{host}.{pid}.{thread}{suffix}`` next to it, all of them are merged during the load,
+            so the folds fitted in parallel don't lose the orders of each other
+        full_search_every:
+            Number of refits with the cached order after which the full search is repeated for the segment,
+            if None the full search isn't repeated
         **kwargs:
             Training parameters for auto_arima from pmdarima package.
         """
+        self.worker_budget = worker_budget
+        self.joblib_params = joblib_params
+        self.order_cache_mode = OrderCacheMode(order_cache_mode) if order_cache_mode is not None else None
+        self.order_cache_path = order_cache_path
+        self.full_search_every = full_search_every
         self.kwargs = kwargs
+        self._order_cache: Dict[str, Dict[str, Any]] = {}
+        self._train_end: Optional[pd.Timestamp] = None
+        adapter_kwargs = self.kwargs if worker_budget is None else {**self.kwargs, "n_jobs": 1}
         super(AutoARIMAModel, self).__init__(
             base_model=_AutoARIMAAdapter(
-                **self.kwargs,
-            )
+                **adapter_kwargs,
+            ),
+            joblib_params=self.joblib_params,
         )
+
+    def _get_n_jobs(self) -> int:
+        """Get the number of segments to fit in parallel."""
+        return 1 if self.worker_budget is None else self.worker_budget
+
+    @log_decorator
+    def fit(self, ts: TSDataset) -> "AutoARIMAModel":
+        """Fit model.
+
+        Parameters
+        ----------
+        ts:
+            Dataset with features
+
+        Returns
+        -------
+        :
+            Model after fit
+        """
+        if self.order_cache_mode is not None and self.order_cache_path is not None:
+            self._load_order_cache()
+        self._train_end = ts.index.max()
+        super().fit(ts=ts)
+        if self.order_cache_mode is not None:
+            self._update_order_cache()
+            if self.order_cache_path is not None:
+                self._save_order_cache()
+        return self
+
+    def _init_segment_models(self, segments: List[str]) -> Dict[str, Any]:
+        """Create models for the given segments passing them the cached orders."""
+        models = super()._init_segment_models(segments=segments)
+        if self.order_cache_mode is None:
+            return models
+        for segment, model in models.items():
+            cache_entry = self._order_cache.get(segment)
+            if cache_entry is None or pd.Timestamp(cache_entry["train_end"]) > self._train_end:
+                continue
+            if self.full_search_every is not None and cache_entry["n_refits"] >= self.full_search_every:
+                continue
+            model.cached_order = {key: cache_entry[key] for key in ("order", "seasonal_order", "with_intercept")}
+            model.order_cache_mode = self.order_cache_mode
+        return models
+
+    def _update_order_cache(self):
+        """Update the order cache with the orders of the fitted models."""
+        train_end = pd.Timestamp(self._train_end).isoformat()
+        for segment, model in self._get_model().items():
+            if model.cached_order is None:
+                n_refits = 0
+            else:
+                n_refits = self._order_cache[segment]["n_refits"] + 1
+            self._order_cache[segment] = {**model.get_selected_order(), "n_refits": n_refits, "train_end": train_end}
+
+    @staticmethod
+    def _merge_order_caches(order_cache: Dict[str, Dict[str, Any]], other_cache: Dict[str, Dict[str, Any]]):
+        """Merge ``other_cache`` into ``order_cache`` keeping the entry selected on the latest data for each segment."""
+        for segment, cache_entry in other_cache.items():
+            current_entry = order_cache.get(segment)
+            if current_entry is None or pd.Timestamp(cache_entry["train_end"]) > pd.Timestamp(
+                current_entry["train_end"]
+            ):
+                order_cache[segment] = cache_entry
+
+    @staticmethod
+    def _read_order_cache_file(path: Path) -> Dict[str, Dict[str, Any]]:
+        """Read the order cache from ``path``, empty cache is returned if the file doesn't exist."""
+        if not path.exists():
+            return {}
+        with open(path, "r") as inf:
+            return json.load(inf)
+
+    def _get_order_cache_paths(self) -> Tuple[Path, Path]:
+        """Get path of the order cache file and path of the file with the order cache saved by the current process."""
+        path = Path(self.order_cache_path)  # type: ignore
+        process_path = path.with_name(
+            f"{path.stem}.{socket.gethostname()}.{os.getpid()}.{threading.get_ident()}{path.suffix}"
+        )
+        return path, process_path
+
+    def _load_order_cache(self):
+        """Load the order cache from ``order_cache_path`` and the files saved next to it by the other processes."""
+        path, _ = self._get_order_cache_paths()
+        paths = [path] + sorted(path.parent.glob(f"{glob.escape(path.stem)}.*{path.suffix}"))
+        for cache_path in paths:
+            self._merge_order_caches(self._order_cache, self._read_order_cache_file(cache_path))
+
+    def _save_order_cache(self):
+        """Save the order cache to the file of the current process and to ``order_cache_path``.
+
+        Only the current process writes its file, so the entries of the parallel fits can't be lost. The file
+        at ``order_cache_path`` holds the entries of all the fits merged during the load, it can miss the entries
+        of the fits that saved the cache at the same time, but they are merged from their files during the next load.
+        Entries selected on the later data than the data of the current fit are kept in both files.
+        """
+        path, process_path = self._get_order_cache_paths()
+        order_cache = dict(self._order_cache)
+        self._merge_order_caches(order_cache, self._read_order_cache_file(process_path))
+        for cache_path in [process_path, path]:
+            # cache is written to the temporary file first, so the parallel fits don't read a partially written one
+            file_descriptor, tmp_path = tempfile.mkstemp(dir=cache_path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(file_descriptor, "w") as ouf:
+                    json.dump(order_cache, ouf)
+                os.replace(tmp_path, cache_path)
+            finally:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+
+    def get_order_cache(self) -> Dict[str, Dict[str, Any]]:
+        """Get the order cache.
+
+        Returns
+        -------
+        :
+            dictionary where key is segment and value is dictionary with ``order``, ``seasonal_order``,
+            ``with_intercept`` of the last selected model, ``n_refits`` -- number of refits since the last full search
+            and ``train_end`` -- the last timestamp of the data the order was selected on
+        """
+        return self._order_cache
@@ -12,6 +12,8 @@ from typing import Union
 
 import numpy as np
 import pandas as pd
+from joblib import Parallel
+from joblib import delayed
 
 from etna.core.mixins import BaseMixin
 from etna.datasets.tsdataset import TSDataset
@@ -174,11 +176,18 @@ class PredictIntervalAbstractModel(ABC):
         """
         pass
 
+    def _can_predict_quantiles(self, quantiles: Sequence[float]) -> bool:
+        """Check if the model is able to build the prediction interval for given quantiles by itself."""
+        return True
+
 
 class PerSegmentBaseModel(FitAbstractModel, BaseMixin):
     """Base class for holding specific models for per-segment prediction."""
 
-    def __init__(self, base_model: Any):
+    # total number of processes to fit the segments with, it is set by the models that fit segments within a budget
+    worker_budget: Optional[int] = None
+
+    def __init__(self, base_model: Any, n_jobs: int = 1, joblib_params: Optional[Dict[str, Any]] = None):
         """
         Init PerSegmentBaseModel.
 
@@ -186,9 +195,15 @@ class PerSegmentBaseModel(FitAbstractModel, BaseMixin):
         ----------
         base_model:
             Internal model which will be used to forecast segments, expected to have fit/predict interface
+        n_jobs:
+            Number of segments to fit in parallel
+        joblib_params:
+            Additional parameters for :py:class:`joblib.Parallel`
         """
         self._base_model = base_model
         self._models: Optional[Dict[str, Any]] = None
+        self.n_jobs = n_jobs
+        self.joblib_params = joblib_params
 
     @log_decorator
     def fit(self, ts: TSDataset) -> "PerSegmentBaseModel":
@@ -204,18 +219,82 @@ class PerSegmentBaseModel(FitAbstractModel, BaseMixin):
         :
             Model after fit
         """
-        self._models = {}
-        for segment in ts.segments:
-            self._models[segment] = deepcopy(self._base_model)
-
-        for segment, model in self._models.items():
-            segment_features = ts[:, segment, :]
-            segment_features = segment_features.dropna()  # TODO: https://github.com/tinkoff-ai/etna/issues/557
-            segment_features = segment_features.droplevel("segment", axis=1)
-            segment_features = segment_features.reset_index()
-            model.fit(df=segment_features, regressors=ts.regressors)
+        models = self._init_segment_models(segments=ts.segments)
+
+        fitted_models = Parallel(n_jobs=self._get_n_jobs(), **self._get_joblib_params())(
+            delayed(self._fit_segment_model)(
+                model=model, df=self._get_segment_train_df(ts=ts, segment=segment), regressors=ts.regressors
+            )
+            for segment, model in models.items()
+        )
+        self._models = dict(zip(models.keys(), fitted_models))
+        return self
+
+    def _get_n_jobs(self) -> int:
+        """Get the number of segments to fit in parallel."""
+        return self.n_jobs
+
+    def _get_joblib_params(self) -> Dict[str, Any]:
+        """Get parameters for :py:class:`joblib.Parallel` that fits the segments."""
+        if self.joblib_params is None:
+            return dict(verbose=0, backend="multiprocessing", mmap_mode="c")
+        return self.joblib_params
+
+    @staticmethod
+    def _get_segment_train_df(ts: TSDataset, segment: str) -> pd.DataFrame:
+        """Get dataframe to fit the model of one segment on."""
+        segment_features = ts[:, segment, :]
+        segment_features = segment_features.dropna()  # TODO: https://github.com/tinkoff-ai/etna/issues/557
+        segment_features = segment_features.droplevel("segment", axis=1)
+        segment_features = segment_features.reset_index()
+        return segment_features
+
+    @staticmethod
+    def _fit_segment_model(model: Any, df: pd.DataFrame, regressors: List[str]) -> Any:
+        """Fit the model of one segment."""
+        model.fit(df=df, regressors=regressors)
+        return model
+
+    @log_decorator
+    def update(self, ts: TSDataset) -> "PerSegmentBaseModel":
+        """Update fitted models with new observations without refitting them.
+
+        Parameters
+        ----------
+        ts:
+            Dataset with features, timestamps that aren't later than the end of the fitted data are ignored
+
+        Returns
+        -------
+        :
+            Model after update
+
+        Raises
+        ------
+        NotImplementedError:
+            if base model doesn't support update
+        """
+        if not hasattr(self._base_model, "update"):
+            raise NotImplementedError(f"update method is not implemented for {self._base_model.__class__.__name__}")
+        for segment, model in self._get_model().items():
+            model.update(df=self._get_segment_train_df(ts=ts, segment=segment))
         return self
 
+    def _init_segment_models(self, segments: List[str]) -> Dict[str, Any]:
+        """Create unfitted copies of the base model for the given segments.
+
+        Parameters
+        ----------
+        segments:
+            Segments to create models for
+
+        Returns
+        -------
+        :
+           dictionary where key is segment and value is a copy of the base model
+        """
+        return {segment: deepcopy(self._base_model) for segment in segments}
+
     def _get_model(self) -> Dict[str, Any]:
         """Get internal etna base models that are used inside etna class.
 
@@ -267,16 +346,20 @@ class PerSegmentBaseModel(FitAbstractModel, BaseMixin):
 class PerSegmentModel(PerSegmentBaseModel, ForecastAbstractModel):
     """Class for holding specific models for per-segment prediction."""
 
-    def __init__(self, base_model: Any):
+    def __init__(self, base_model: Any, n_jobs: int = 1, joblib_params: Optional[Dict[str, Any]] = None):
         """
-        Init PerSegmentBaseModel.
+        Init PerSegmentModel.
 
         Parameters
         ----------
         base_model:
             Internal model which will be used to forecast segments, expected to have fit/predict interface
+        n_jobs:
+            Number of segments to fit in parallel
+        joblib_params:
+            Additional parameters for :py:class:`joblib.Parallel`
         """
-        super().__init__(base_model=base_model)
+        super().__init__(base_model=base_model, n_jobs=n_jobs, joblib_params=joblib_params)
 
     @log_decorator
     def forecast(self, ts: TSDataset) -> TSDataset:
@@ -311,7 +394,7 @@ class PerSegmentModel(PerSegmentBaseModel, ForecastAbstractModel):
 class PerSegmentPredictionIntervalModel(PerSegmentBaseModel, PredictIntervalAbstractModel):
     """Class for holding specific models for per-segment prediction which are able to build prediction intervals."""
 
-    def __init__(self, base_model: Any):
+    def __init__(self, base_model: Any, n_jobs: int = 1, joblib_params: Optional[Dict[str, Any]] = None):
         """
         Init PerSegmentPredictionIntervalModel.
 
@@ -319,8 +402,12 @@ class PerSegmentPredictionIntervalModel(PerSegmentBaseModel, PredictIntervalAbst
         ----------
         base_model:
             Internal model which will be used to forecast segments, expected to have fit/predict interface
+        n_jobs:
+            Number of segments to fit in parallel
+        joblib_params:
+            Additional parameters for :py:class:`joblib.Parallel`
         """
-        super().__init__(base_model=base_model)
+        super().__init__(base_model=base_model, n_jobs=n_jobs, joblib_params=joblib_params)
 
     @log_decorator
     def forecast(
@@ -1,15 +1,37 @@
+import os
+import tempfile
+from pathlib import Path
+from typing import Any
+from typing import Dict
 from typing import List
 from typing import Optional
+from typing import Sequence
+from typing import Union
 
+import catboost
 import numpy as np
 import pandas as pd
 from catboost import CatBoostRegressor
+from catboost import FeaturesData
 from catboost import Pool
 from deprecated import deprecated
 
+from etna.datasets.tsdataset import TSDataset
 from etna.models.base import BaseAdapter
 from etna.models.base import MultiSegmentModel
-from etna.models.base import PerSegmentModel
+from etna.models.base import PerSegmentPredictionIntervalModel
+from etna.models.base import PredictIntervalAbstractModel
+from etna.models.base import log_decorator
+
+_QUANTIZATION_PARAMS = (
+    "border_count",
+    "feature_border_type",
+    "per_float_feature_quantization",
+    "nan_mode",
+)
+
+# MultiQuantile loss is available since catboost 1.1
+_MULTI_QUANTILE_AVAILABLE = tuple(int(part) for part in catboost.__version__.split(".")[:2]) >= (1, 1)
 
 
 class _CatBoostAdapter(BaseAdapter):
@@ -21,10 +43,26 @@ class _CatBoostAdapter(BaseAdapter):
         logging_level: Optional[str] = "Silent",
         l2_leaf_reg: Optional[float] = None,
         thread_count: Optional[int] = None,
+        predict_thread_count: Optional[int] = None,
+        borders_path: Optional[str] = None,
+        quantiles: Optional[Sequence[float]] = None,
         **kwargs,
     ):
-
-        self.model = CatBoostRegressor(
+        self.quantiles = quantiles
+        self._alphas: Optional[List[float]] = None
+        if quantiles is not None:
+            if "loss_function" in kwargs:
+                raise ValueError("Loss function can't be set if quantiles are given, MultiQuantile loss is used!")
+            if not all(0 < quantile < 1 for quantile in quantiles):
+                raise ValueError("Quantile should be a number from (0,1).")
+            # the median goes first to be the point forecast
+            self._alphas = [0.5] + sorted({quantile for quantile in quantiles if not np.isclose(quantile, 0.5)})
+            if _MULTI_QUANTILE_AVAILABLE:
+                kwargs["loss_function"] = "MultiQuantile:alpha=" + ",".join(f"{alpha:.4g}" for alpha in self._alphas)
+            else:
+                kwargs["loss_function"] = "Quantile:alpha=0.5"
+
+        model_params = dict(
             iterations=iterations,
             depth=depth,
             learning_rate=learning_rate,
@@ -33,7 +71,83 @@ class _CatBoostAdapter(BaseAdapter):
             l2_leaf_reg=l2_leaf_reg,
             **kwargs,
         )
-        self._categorical = None
+        self.model = CatBoostRegressor(**model_params)
+        # older catboost trains a separate model with Quantile loss for each quantile except the median
+        self._quantile_models: List[CatBoostRegressor] = []
+        if self._alphas is not None and not _MULTI_QUANTILE_AVAILABLE:
+            self._quantile_models = [
+                CatBoostRegressor(**{**model_params, "loss_function": f"Quantile:alpha={alpha:.4g}"})
+                for alpha in self._alphas[1:]
+            ]
+        self.thread_count = thread_count
+        self.predict_thread_count = predict_thread_count
+        self.borders_path = borders_path
+        self._categorical: List[str] = []
+
+    def _make_pool(self, df: pd.DataFrame, target: Optional[np.ndarray], thread_count: Optional[int]) -> Pool:
+        """Make pool from contiguous arrays of numerical features and labels of categorical features."""
+        features = df.drop(columns=["timestamp", "target"])
+        numerical = [column for column in features.columns if column not in self._categorical]
+
+        if any(isinstance(features[column].dtype, pd.SparseDtype) for column in numerical):
+            # sparse columns are passed in the dataframe, so catboost doesn't convert them to dense
+            cat_features = {column: self._get_labels(features[column]) for column in self._categorical}
+            features = features.assign(**cat_features)
+            return Pool(
+                features,
+                label=target,
+                cat_features=self._categorical,
+                thread_count=-1 if thread_count is None else thread_count,
+            )
+
+        num_feature_data = None
+        if len(numerical) > 0:
+            num_feature_data = np.ascontiguousarray(features[numerical].to_numpy(dtype=np.float32))
+
+        cat_feature_data = None
+        if len(self._categorical) > 0:
+            cat_feature_data = np.empty((len(features), len(self._categorical)), dtype=object)
+            for i, column in enumerate(self._categorical):
+                cat_feature_data[:, i] = self._get_labels(features[column])
+
+        data = FeaturesData(
+            num_feature_data=num_feature_data,
+            cat_feature_data=cat_feature_data,
+            num_feature_names=numerical if len(numerical) > 0 else None,
+            cat_feature_names=self._categorical if len(self._categorical) > 0 else None,
+        )
+        return Pool(data, label=target, thread_count=-1 if thread_count is None else thread_count)
+
+    @staticmethod
+    def _get_labels(column: pd.Series) -> np.ndarray:
+        """Get string labels of categorical column."""
+        codes = column.cat.codes.to_numpy()
+        if np.any(codes == -1):
+            raise ValueError(f"Categorical column {column.name} contains NaNs!")
+        labels = column.cat.categories.astype(str).to_numpy(dtype=object)
+        return labels[codes]
+
+    def _quantize(self, pool: Pool, borders_path: Path):
+        """Quantize pool with borders from ``borders_path`` or save there the borders computed on the pool."""
+        model_params = self.model.get_params()
+        quantization_params = {
+            param: model_params[param] for param in _QUANTIZATION_PARAMS if model_params.get(param) is not None
+        }
+        if borders_path.exists():
+            pool.quantize(input_borders=str(borders_path), **quantization_params)
+            return
+
+        pool.quantize(**quantization_params)
+        # borders are written to the temporary file first, so the parallel folds don't read a partially written one
+        borders_path.parent.mkdir(parents=True, exist_ok=True)
+        file_descriptor, tmp_path = tempfile.mkstemp(dir=borders_path.parent, suffix=".tmp")
+        os.close(file_descriptor)
+        try:
+            pool.save_quantization_borders(tmp_path)
+            os.replace(tmp_path, borders_path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
 
     def fit(self, df: pd.DataFrame, regressors: List[str]) -> "_CatBoostAdapter":
         """
@@ -52,13 +166,18 @@ class _CatBoostAdapter(BaseAdapter):
             Fitted model
         """
         features = df.drop(columns=["timestamp", "target"])
-        target = df["target"]
         self._categorical = features.select_dtypes(include=["category"]).columns.to_list()
-        train_pool = Pool(features, target.values, cat_features=self._categorical)
+        train_pool = self._make_pool(df=df, target=df["target"].to_numpy(), thread_count=self.thread_count)
+        if self.borders_path is not None:
+            self._quantize(pool=train_pool, borders_path=Path(self.borders_path))
         self.model.fit(train_pool)
+        for quantile_model in self._quantile_models:
+            quantile_model.fit(train_pool)
         return self
 
-    def predict(self, df: pd.DataFrame) -> np.ndarray:
+    def predict(
+        self, df: pd.DataFrame, prediction_interval: bool = False, quantiles: Sequence[float] = ()
+    ) -> Union[np.ndarray, pd.DataFrame]:
         """
         Compute predictions from a Catboost model.
 
@@ -66,16 +185,43 @@ class _CatBoostAdapter(BaseAdapter):
         ----------
         df:
             Features dataframe
+        prediction_interval:
+            If True returns prediction interval for forecast, requires the model to be trained with ``quantiles``
+        quantiles:
+            Levels of prediction distribution, each of them should be trained
 
         Returns
         -------
         :
-            Array with predictions
+            Array with predictions or dataframe with predictions and quantiles if ``prediction_interval`` is set
         """
-        features = df.drop(columns=["timestamp", "target"])
-        predict_pool = Pool(features, cat_features=self._categorical)
-        pred = self.model.predict(predict_pool)
-        return pred
+        thread_count = -1 if self.predict_thread_count is None else self.predict_thread_count
+        predict_pool = self._make_pool(df=df, target=None, thread_count=thread_count)
+        pred = self.model.predict(predict_pool, thread_count=thread_count)
+        if self._alphas is None:
+            if prediction_interval:
+                raise ValueError("Prediction interval is available only for the model trained with quantiles!")
+            return pred
+
+        if pred.ndim == 1:
+            quantile_preds = [model.predict(predict_pool, thread_count=thread_count) for model in self._quantile_models]
+            pred = np.column_stack([pred] + quantile_preds)
+
+        # rearrangement of the predicted quantiles in ascending order removes their crossing
+        order = np.argsort(self._alphas)
+        sorted_alphas = np.array(self._alphas)[order]
+        sorted_pred = np.sort(pred[:, order], axis=1)
+        point = sorted_pred[:, np.argmax(np.isclose(sorted_alphas, 0.5))]
+        if not prediction_interval:
+            return point
+
+        y_pred = pd.DataFrame({"target": point})
+        for quantile in quantiles:
+            matches = np.isclose(sorted_alphas, quantile)
+            if not matches.any():
+                raise ValueError(f"Quantile {quantile} wasn't used in training of the model!")
+            y_pred[f"target_{quantile:.4g}"] = sorted_pred[:, np.argmax(matches)]
+        return y_pred
 
     def get_model(self) -> CatBoostRegressor:
         """Get internal catboost.CatBoostRegressor model that is used inside etna class.
@@ -88,7 +234,7 @@ class _CatBoostAdapter(BaseAdapter):
         return self.model
 
 
-class CatBoostPerSegmentModel(PerSegmentModel):
+class CatBoostPerSegmentModel(PerSegmentPredictionIntervalModel):
     """Class for holding per segment Catboost model.
 
     Examples
@@ -115,7 +261,8 @@ class CatBoostPerSegmentModel(PerSegmentModel):
     >>> model = CatBoostPerSegmentModel()
     >>> model.fit(ts=ts)
     CatBoostPerSegmentModel(iterations = None, depth = None, learning_rate = None,
-    logging_level = 'Silent', l2_leaf_reg = None, thread_count = None, )
+    logging_level = 'Silent', l2_leaf_reg = None, thread_count = None, predict_thread_count = None,
+    borders_path = None, quantiles = None, )
     >>> forecast = model.forecast(future)
     >>> pd.options.display.float_format = '{:,.2f}'.format
     >>> forecast[:, :, "target"]
@@ -139,6 +286,9 @@ class CatBoostPerSegmentModel(PerSegmentModel):
         logging_level: Optional[str] = "Silent",
         l2_leaf_reg: Optional[float] = None,
         thread_count: Optional[int] = None,
+        predict_thread_count: Optional[int] = None,
+        borders_path: Optional[str] = None,
+        quantiles: Optional[Sequence[float]] = None,
         **kwargs,
     ):
         """Create instance of CatBoostPerSegmentModel with given parameters.
@@ -189,6 +339,20 @@ class CatBoostPerSegmentModel(PerSegmentModel):
             * For GPU. The given value is used for reading the data from the hard drive and does
               not affect the training.
               During the training one main thread and one thread for each GPU are used.
+        predict_thread_count:
+            The number of threads to use during the prediction, all the available threads are used if not set.
+        borders_path:
+            Path to the file with quantization borders of the numerical features.
+            If the file exists, borders are loaded from it instead of being computed on fit,
+            otherwise the borders computed on fit are saved there to be reused by the next fits,
+            e.g. in the other folds of backtest. Features should be the same for all these fits.
+            Each segment has its own file: borders of ``segment`` are kept in ``<stem>_<segment><suffix>``
+            next to the given path, e.g. ``borders_segment_0.tsv`` for ``borders.tsv``.
+        quantiles:
+            Levels of prediction distribution to build prediction intervals for. If set, a single model
+            with MultiQuantile loss is trained to predict the median and all these quantiles,
+            the median is used as a point forecast in this case. On catboost older than 1.1, which doesn't have
+            MultiQuantile loss, a separate model with Quantile loss is trained for each of them.
         """
         self.iterations = iterations
         self.depth = depth
@@ -196,6 +360,9 @@ class CatBoostPerSegmentModel(PerSegmentModel):
         self.logging_level = logging_level
         self.l2_leaf_reg = l2_leaf_reg
         self.thread_count = thread_count
+        self.predict_thread_count = predict_thread_count
+        self.borders_path = borders_path
+        self.quantiles = quantiles
         self.kwargs = kwargs
         super().__init__(
             base_model=_CatBoostAdapter(
@@ -205,12 +372,31 @@ class CatBoostPerSegmentModel(PerSegmentModel):
                 logging_level=logging_level,
                 thread_count=thread_count,
                 l2_leaf_reg=l2_leaf_reg,
+                predict_thread_count=predict_thread_count,
+                borders_path=borders_path,
+                quantiles=quantiles,
                 **kwargs,
             )
         )
 
+    def _init_segment_models(self, segments: List[str]) -> Dict[str, Any]:
+        """Create models for the given segments, each of them keeps quantization borders in its own file."""
+        models = super()._init_segment_models(segments=segments)
+        if self.borders_path is None:
+            return models
+        borders_path = Path(self.borders_path)
+        for segment, model in models.items():
+            model.borders_path = str(borders_path.with_name(f"{borders_path.stem}_{segment}{borders_path.suffix}"))
+        return models
+
+    def _can_predict_quantiles(self, quantiles: Sequence[float]) -> bool:
+        """Check if all the given quantiles were used in training of the model."""
+        if self.quantiles is None:
+            return False
+        return all(np.isclose(quantile, self.quantiles).any() for quantile in quantiles)
 
-class CatBoostMultiSegmentModel(MultiSegmentModel):
+
+class CatBoostMultiSegmentModel(MultiSegmentModel, PredictIntervalAbstractModel):
     """Class for holding Catboost model for all segments.
 
     Examples
@@ -237,7 +423,8 @@ class CatBoostMultiSegmentModel(MultiSegmentModel):
     >>> model = CatBoostMultiSegmentModel()
     >>> model.fit(ts=ts)
     CatBoostMultiSegmentModel(iterations = None, depth = None, learning_rate = None,
-    logging_level = 'Silent', l2_leaf_reg = None, thread_count = None, )
+    logging_level = 'Silent', l2_leaf_reg = None, thread_count = None, predict_thread_count = None,
+    borders_path = None, quantiles = None, )
     >>> forecast = model.forecast(future)
     >>> pd.options.display.float_format = '{:,.2f}'.format
     >>> forecast[:, :, "target"].round()
@@ -261,6 +448,9 @@ class CatBoostMultiSegmentModel(MultiSegmentModel):
         logging_level: Optional[str] = "Silent",
         l2_leaf_reg: Optional[float] = None,
         thread_count: Optional[int] = None,
+        predict_thread_count: Optional[int] = None,
+        borders_path: Optional[str] = None,
+        quantiles: Optional[Sequence[float]] = None,
         **kwargs,
     ):
         """Create instance of CatBoostMultiSegmentModel with given parameters.
@@ -311,6 +501,18 @@ class CatBoostMultiSegmentModel(MultiSegmentModel):
             * For GPU. The given value is used for reading the data from the hard drive and does
               not affect the training.
               During the training one main thread and one thread for each GPU are used.
+        predict_thread_count:
+            The number of threads to use during the prediction, all the available threads are used if not set.
+        borders_path:
+            Path to the file with quantization borders of the numerical features.
+            If the file exists, borders are loaded from it instead of being computed on fit,
+            otherwise the borders computed on fit are saved there to be reused by the next fits,
+            e.g. in the other folds of backtest. Features should be the same for all these fits.
+        quantiles:
+            Levels of prediction distribution to build prediction intervals for. If set, a single model
+            with MultiQuantile loss is trained to predict the median and all these quantiles,
+            the median is used as a point forecast in this case. On catboost older than 1.1, which doesn't have
+            MultiQuantile loss, a separate model with Quantile loss is trained for each of them.
         """
         self.iterations = iterations
         self.depth = depth
@@ -318,6 +520,9 @@ class CatBoostMultiSegmentModel(MultiSegmentModel):
         self.logging_level = logging_level
         self.l2_leaf_reg = l2_leaf_reg
         self.thread_count = thread_count
+        self.predict_thread_count = predict_thread_count
+        self.borders_path = borders_path
+        self.quantiles = quantiles
         self.kwargs = kwargs
         super().__init__(
             base_model=_CatBoostAdapter(
@@ -327,10 +532,56 @@ class CatBoostMultiSegmentModel(MultiSegmentModel):
                 logging_level=logging_level,
                 thread_count=thread_count,
                 l2_leaf_reg=l2_leaf_reg,
+                predict_thread_count=predict_thread_count,
+                borders_path=borders_path,
+                quantiles=quantiles,
                 **kwargs,
             )
         )
 
+    def _can_predict_quantiles(self, quantiles: Sequence[float]) -> bool:
+        """Check if all the given quantiles were used in training of the model."""
+        if self.quantiles is None:
+            return False
+        return all(np.isclose(quantile, self.quantiles).any() for quantile in quantiles)
+
+    @log_decorator
+    def forecast(
+        self, ts: TSDataset, prediction_interval: bool = False, quantiles: Sequence[float] = (0.025, 0.975)
+    ) -> TSDataset:
+        """Make predictions.
+
+        Parameters
+        ----------
+        ts:
+            Dataset with features
+        prediction_interval:
+            If True returns prediction interval for forecast, requires the model to be trained with ``quantiles``
+        quantiles:
+            Levels of prediction distribution, each of them should be used in training of the model
+
+        Returns
+        -------
+        :
+            Dataset with predictions
+        """
+        if not prediction_interval:
+            return super().forecast(ts=ts)
+
+        horizon = len(ts.df)
+        x = ts.to_pandas(flatten=True).drop(["segment"], axis=1)
+        y_pred = self._base_model.predict(x, prediction_interval=True, quantiles=quantiles)
+        ts.loc[:, pd.IndexSlice[:, "target"]] = y_pred["target"].values.reshape(-1, horizon).T
+        borders = []
+        for quantile in quantiles:
+            border = ts[:, :, "target"].copy()
+            border.loc[:, :] = y_pred[f"target_{quantile:.4g}"].values.reshape(-1, horizon).T
+            border.rename({"target": f"target_{quantile:.4g}"}, inplace=True, axis=1)
+            borders.append(border)
+        ts.df = pd.concat([ts.df] + borders, axis=1).sort_index(axis=1, level=(0, 1))
+        ts.inverse_transform()
+        return ts
+
 
 @deprecated(
     reason="CatBoostModelPerSegment is deprecated; will be deleted in etna==2.0. Use CatBoostPerSegmentModel instead."
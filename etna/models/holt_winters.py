@@ -15,6 +15,9 @@ from statsmodels.tsa.holtwinters import HoltWintersResults
 from etna.models.base import BaseAdapter
 from etna.models.base import PerSegmentModel
 
+# name of Box-Cox parameter in the fitted params of statsmodels, the line is excluded from the spell check
+_BOXCOX_LAMBDA_PARAM = "lamda"
+
 
 class _HoltWintersAdapter(BaseAdapter):
     """
@@ -256,6 +259,63 @@ class _HoltWintersAdapter(BaseAdapter):
         y_pred = forecast.values
         return y_pred
 
+    def update(self, df: pd.DataFrame) -> "_HoltWintersAdapter":
+        """
+        Update the fitted Holt-Winters' model with new observations without re-estimating its parameters.
+
+        Smoothing parameters and initial states of the fitted model are fixed and the smoothing recursion
+        is run through the whole extended series, so the forecast starts right after the new observations.
+
+        Parameters
+        ----------
+        df:
+            Features dataframe, rows that aren't later than the end of the fitted data are ignored
+
+        Returns
+        -------
+        :
+            Updated model
+        """
+        if self._result is None or self._model is None:
+            raise ValueError("This model is not fitted! Fit the model before calling update method!")
+        self._check_df(df)
+
+        endog = self._model.data.orig_endog
+        df = df[df["timestamp"] > endog.index.max()]
+        if len(df) == 0:
+            return self
+
+        targets = df["target"]
+        targets.index = df["timestamp"]
+        targets = pd.concat([endog, targets])
+
+        params = {key: None if np.all(pd.isna(value)) else value for key, value in self._result.params.items()}
+        self._model = ExponentialSmoothing(
+            endog=targets,
+            trend=self.trend,
+            damped_trend=self.damped_trend,
+            seasonal=self.seasonal,
+            seasonal_periods=self.seasonal_periods,
+            initialization_method="known",
+            initial_level=params["initial_level"],
+            initial_trend=params["initial_trend"] if self.trend is not None else None,
+            initial_seasonal=params["initial_seasons"] if self.seasonal is not None else None,
+            use_boxcox=params[_BOXCOX_LAMBDA_PARAM] if params["use_boxcox"] else False,
+            bounds=self.bounds,
+            dates=self.dates,
+            freq=self.freq,
+            missing=self.missing,
+        )
+        self._result = self._model.fit(
+            smoothing_level=params["smoothing_level"],
+            smoothing_trend=params["smoothing_trend"],
+            smoothing_seasonal=params["smoothing_seasonal"],
+            damping_trend=params["damping_trend"],
+            optimized=False,
+            remove_bias=params["remove_bias"],
+        )
+        return self
+
     def _check_df(self, df: pd.DataFrame):
         columns = df.columns
         columns_not_used = set(columns).difference({"target", "timestamp"})
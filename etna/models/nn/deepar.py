@@ -14,6 +14,7 @@ from etna.models.base import Model
 from etna.models.base import PredictIntervalAbstractModel
 from etna.models.base import log_decorator
 from etna.models.nn.utils import _DeepCopyMixin
+from etna.models.nn.utils import _torch_num_threads
 from etna.transforms import PytorchForecastingTransform
 
 if SETTINGS.torch_required:
@@ -49,6 +50,9 @@ class DeepARModel(Model, PredictIntervalAbstractModel, _DeepCopyMixin):
         loss: Optional["DistributionLoss"] = None,
         trainer_kwargs: Optional[Dict[str, Any]] = None,
         quantiles_kwargs: Optional[Dict[str, Any]] = None,
+        predict_batch_size: Optional[int] = None,
+        predict_num_workers: int = 0,
+        predict_num_threads: Optional[int] = None,
     ):
         """
         Initialize DeepAR wrapper.
@@ -83,6 +87,13 @@ class DeepARModel(Model, PredictIntervalAbstractModel, _DeepCopyMixin):
             Additional arguments for pytorch_lightning Trainer.
         quantiles_kwargs:
             Additional arguments for computing quantiles, look at ``to_quantiles()`` method for your loss.
+        predict_batch_size:
+            Batch size for prediction, if None it is equal to doubled ``batch_size``.
+        predict_num_workers:
+            Number of workers of the prediction dataloader, 0 means that the data is loaded in the main process.
+        predict_num_threads:
+            Number of threads used by torch for intra-op parallelism during prediction on CPU,
+            if None the current torch setting is used.
         """
         if loss is None:
             loss = NormalDistributionLoss()
@@ -99,6 +110,9 @@ class DeepARModel(Model, PredictIntervalAbstractModel, _DeepCopyMixin):
         self.loss = loss
         self.trainer_kwargs = trainer_kwargs if trainer_kwargs is not None else dict()
         self.quantiles_kwargs = quantiles_kwargs if quantiles_kwargs is not None else dict()
+        self.predict_batch_size = predict_batch_size
+        self.predict_num_workers = predict_num_workers
+        self.predict_num_threads = predict_num_threads
         self.model: Optional[Union[LightningModule, DeepAR]] = None
         self.trainer: Optional[pl.Trainer] = None
 
@@ -192,18 +206,23 @@ class DeepARModel(Model, PredictIntervalAbstractModel, _DeepCopyMixin):
                 "The future is not generated! Generate future using TSDataset make_future before calling forecast method!"
             )
         prediction_dataloader = pf_transform.pf_dataset_predict.to_dataloader(
-            train=False, batch_size=self.batch_size * 2
+            train=False,
+            batch_size=self.batch_size * 2 if self.predict_batch_size is None else self.predict_batch_size,
+            num_workers=self.predict_num_workers,
         )
 
-        predicts = self.model.predict(prediction_dataloader).numpy()  # type: ignore
+        # network is run once, point forecast and quantiles are both derived from its raw output
+        with _torch_num_threads(self.predict_num_threads):
+            raw_predicts = self.model.predict(prediction_dataloader, mode="raw")  # type: ignore
+        # raw output of DeepAR holds samples instead of distribution parameters, so the loss can't be used on it,
+        # it is the same as in DeepAR.predict
+        predicts = self.model.to_prediction(raw_predicts, use_metric=False).numpy()  # type: ignore
         # shape (segments, encoder_length)
         ts.loc[:, pd.IndexSlice[:, "target"]] = predicts.T[-len(ts.df) :]
 
         if prediction_interval:
-            quantiles_predicts = self.model.predict(  # type: ignore
-                prediction_dataloader,
-                mode="quantiles",
-                mode_kwargs={"quantiles": quantiles, **self.quantiles_kwargs},
+            quantiles_predicts = self.model.to_quantiles(  # type: ignore
+                raw_predicts, quantiles=quantiles, **{**self.quantiles_kwargs, "use_metric": False}
             ).numpy()
             # shape (segments, encoder_length, len(quantiles))
             quantiles_predicts = quantiles_predicts.transpose((1, 0, 2))
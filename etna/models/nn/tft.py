@@ -15,6 +15,7 @@ from etna.models.base import Model
 from etna.models.base import PredictIntervalAbstractModel
 from etna.models.base import log_decorator
 from etna.models.nn.utils import _DeepCopyMixin
+from etna.models.nn.utils import _torch_num_threads
 from etna.transforms import PytorchForecastingTransform
 
 if SETTINGS.torch_required:
@@ -51,6 +52,9 @@ class TFTModel(Model, PredictIntervalAbstractModel, _DeepCopyMixin):
         loss: "MultiHorizonMetric" = None,
         trainer_kwargs: Optional[Dict[str, Any]] = None,
         quantiles_kwargs: Optional[Dict[str, Any]] = None,
+        predict_batch_size: Optional[int] = None,
+        predict_num_workers: int = 0,
+        predict_num_threads: Optional[int] = None,
         *args,
         **kwargs,
     ):
@@ -88,6 +92,13 @@ class TFTModel(Model, PredictIntervalAbstractModel, _DeepCopyMixin):
             Additional arguments for pytorch_lightning Trainer.
         quantiles_kwargs:
             Additional arguments for computing quantiles, look at ``to_quantiles()`` method for your loss.
+        predict_batch_size:
+            Batch size for prediction, if None it is equal to doubled ``batch_size``.
+        predict_num_workers:
+            Number of workers of the prediction dataloader, 0 means that the data is loaded in the main process.
+        predict_num_threads:
+            Number of threads used by torch for intra-op parallelism during prediction on CPU,
+            if None the current torch setting is used.
         """
         if loss is None:
             loss = QuantileLoss()
@@ -106,6 +117,9 @@ class TFTModel(Model, PredictIntervalAbstractModel, _DeepCopyMixin):
         self.loss = loss
         self.trainer_kwargs = trainer_kwargs if trainer_kwargs is not None else dict()
         self.quantiles_kwargs = quantiles_kwargs if quantiles_kwargs is not None else dict()
+        self.predict_batch_size = predict_batch_size
+        self.predict_num_workers = predict_num_workers
+        self.predict_num_threads = predict_num_threads
         self.model: Optional[Union[LightningModule, TemporalFusionTransformer]] = None
         self.trainer: Optional[pl.Trainer] = None
 
@@ -199,10 +213,15 @@ class TFTModel(Model, PredictIntervalAbstractModel, _DeepCopyMixin):
                 "The future is not generated! Generate future using TSDataset make_future before calling forecast method!"
             )
         prediction_dataloader = pf_transform.pf_dataset_predict.to_dataloader(
-            train=False, batch_size=self.batch_size * 2
+            train=False,
+            batch_size=self.batch_size * 2 if self.predict_batch_size is None else self.predict_batch_size,
+            num_workers=self.predict_num_workers,
         )
 
-        predicts = self.model.predict(prediction_dataloader).numpy()  # type: ignore
+        # network is run once, point forecast and quantiles are both derived from its raw output
+        with _torch_num_threads(self.predict_num_threads):
+            raw_predicts = self.model.predict(prediction_dataloader, mode="raw")  # type: ignore
+        predicts = self.model.to_prediction(raw_predicts).numpy()  # type: ignore
         # shape (segments, encoder_length)
         ts.loc[:, pd.IndexSlice[:, "target"]] = predicts.T[-len(ts.df) :]
 
@@ -212,10 +231,8 @@ class TFTModel(Model, PredictIntervalAbstractModel, _DeepCopyMixin):
                     "Quantiles can't be computed because TFTModel supports this only if QunatileLoss is chosen"
                 )
             else:
-                quantiles_predicts = self.model.predict(  # type: ignore
-                    prediction_dataloader,
-                    mode="quantiles",
-                    mode_kwargs={"quantiles": quantiles, **self.quantiles_kwargs},
+                quantiles_predicts = self.model.to_quantiles(  # type: ignore
+                    raw_predicts, quantiles=quantiles, **self.quantiles_kwargs
                 ).numpy()
                 # shape (segments, encoder_length, len(quantiles))
 
@@ -1,4 +1,11 @@
+from contextlib import contextmanager
 from copy import deepcopy
+from typing import Optional
+
+from etna import SETTINGS
+
+if SETTINGS.torch_required:
+    import torch
 
 
 class _DeepCopyMixin:
@@ -15,3 +22,17 @@ class _DeepCopyMixin:
             setattr(obj, k, deepcopy(v, memo))
             pass
         return obj
+
+
+@contextmanager
+def _torch_num_threads(num_threads: Optional[int]):
+    """Set the number of threads used by torch for intra-op parallelism inside the context."""
+    if num_threads is None:
+        yield
+        return
+    previous_num_threads = torch.get_num_threads()
+    torch.set_num_threads(num_threads)
+    try:
+        yield
+    finally:
+        torch.set_num_threads(previous_num_threads)
@@ -1,4 +1,7 @@
+import logging
+from contextlib import contextmanager
 from datetime import datetime
+from typing import Any
 from typing import Dict
 from typing import Iterable
 from typing import List
@@ -6,6 +9,7 @@ from typing import Optional
 from typing import Sequence
 from typing import Union
 
+import numpy as np
 import pandas as pd
 
 from etna import SETTINGS
@@ -16,6 +20,69 @@ if SETTINGS.prophet_required:
     from prophet import Prophet
 
 
+class _StanOutputFilter(logging.Filter):
+    """Filter out the messages of the Stan backend that are less important than warnings."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        return record.levelno >= logging.WARNING
+
+
+@contextmanager
+def _silence_stan():
+    """Hide the informational messages of the ``cmdstanpy`` logger during fit."""
+    logger = logging.getLogger("cmdstanpy")
+    stan_filter = _StanOutputFilter()
+    logger.addFilter(stan_filter)
+    try:
+        yield
+    finally:
+        logger.removeFilter(stan_filter)
+
+
+def _merge_init_params(stan_init: Dict[str, Any], init_params: Dict[str, Any]) -> Dict[str, Any]:
+    """Replace the default initialization of Stan with ``init_params``.
+
+    ``delta`` and ``beta`` are replaced only if their lengths match the number of changepoints and features of the fit.
+    """
+    merged_init = dict(stan_init)
+    for name in ["k", "m", "sigma_obs"]:
+        merged_init[name] = float(init_params[name])
+    for name in ["delta", "beta"]:
+        value = np.asarray(init_params[name], dtype=float)
+        if value.shape == np.shape(stan_init[name]):
+            merged_init[name] = value
+    return merged_init
+
+
+@contextmanager
+def _warm_start_stan(model: "Prophet", init_params: Optional[Dict[str, Any]]):
+    """Initialize optimization and sampling of the Stan backend of ``model`` from ``init_params`` during fit.
+
+    The default initialization is replaced in the backend, because ``init`` keyword of ``Prophet.fit``
+    isn't handled consistently across the versions of Prophet and its backends.
+    """
+    if init_params is None:
+        yield
+        return
+    backend = model.stan_backend
+    backend_fit = backend.fit
+    backend_sampling = backend.sampling
+
+    def fit(stan_init, stan_data, **kwargs):
+        return backend_fit(_merge_init_params(stan_init, init_params), stan_data, **kwargs)
+
+    def sampling(stan_init, stan_data, samples, **kwargs):
+        return backend_sampling(_merge_init_params(stan_init, init_params), stan_data, samples, **kwargs)
+
+    backend.fit = fit
+    backend.sampling = sampling
+    try:
+        yield
+    finally:
+        del backend.fit
+        del backend.sampling
+
+
 class _ProphetAdapter(BaseAdapter):
     """Class for holding Prophet model."""
 
@@ -81,6 +148,9 @@ class _ProphetAdapter(BaseAdapter):
             self.model.add_seasonality(**seasonality_params)
 
         self.regressor_columns: Optional[List[str]] = None
+        self.init_params: Optional[Dict[str, Any]] = None
+        self.init_scaling: Optional[Dict[str, Any]] = None
+        self._is_fitted = False
 
     def fit(self, df: pd.DataFrame, regressors: List[str]) -> "_ProphetAdapter":
         """
@@ -100,9 +170,74 @@ class _ProphetAdapter(BaseAdapter):
         prophet_df[self.regressor_columns] = df[self.regressor_columns]
         for regressor in self.regressor_columns:
             self.model.add_regressor(regressor)
-        self.model.fit(prophet_df)
+        init_params = self._get_init_params(prophet_df)
+        with _silence_stan(), _warm_start_stan(self.model, init_params):
+            self.model.fit(prophet_df)
+        self._is_fitted = True
         return self
 
+    def _get_init_params(self, prophet_df: pd.DataFrame) -> Optional[Dict[str, Any]]:
+        """Get parameters to initialize optimization from rescaled to the target of ``prophet_df``.
+
+        Parameters are kept only if the model is fitted on the same regressors. Trend parameters ``k``, ``m`` and
+        ``delta`` are in units of the target only for the linear growth, so they are rescaled only in this case.
+        """
+        if self.init_params is None or self.init_scaling is None:
+            return None
+        if self.init_scaling["regressors"] != self.regressor_columns:
+            return None
+        # parameters are fitted on the target divided by the scale, it is computed the same way as in Prophet
+        floor = prophet_df["floor"] if self.model.growth == "logistic" and "floor" in prophet_df else 0.0
+        y_scale = float((prophet_df["y"] - floor).abs().max())
+        if np.isnan(y_scale) or y_scale == 0:
+            y_scale = 1.0
+        ratio = self.init_scaling["y_scale"] / y_scale
+
+        trend_ratio = ratio if self.model.growth == "linear" else 1.0
+        init_params = {name: self.init_params[name] * trend_ratio for name in ["k", "m", "delta"]}
+        init_params["sigma_obs"] = self.init_params["sigma_obs"] * ratio
+        beta = np.array(self.init_params["beta"], dtype=float)
+        additive_terms = self.init_scaling["additive_terms"]
+        if beta.shape == additive_terms.shape:
+            beta[additive_terms] *= ratio
+        init_params["beta"] = beta
+        return init_params
+
+    def get_scaling(self) -> Dict[str, Any]:
+        """Get scaling of the fitted model needed to initialize optimization of another fit with its parameters.
+
+        Returns
+        -------
+        :
+            Dictionary with the scale of target ``y_scale``, mask of additive seasonality features ``additive_terms``
+            and the list of ``regressors``
+        """
+        if not self._is_fitted:
+            raise ValueError("Prophet model is not fitted! Fit the model before calling get_scaling method!")
+        return {
+            "y_scale": self.model.y_scale,
+            "additive_terms": self.model.train_component_cols["additive_terms"].to_numpy().astype(bool),
+            "regressors": self.regressor_columns,
+        }
+
+    def get_fitted_params(self) -> Dict[str, Any]:
+        """Get parameters of the fitted model in a form suitable to initialize optimization of another fit.
+
+        In case of MCMC sampling parameters are averaged over the samples.
+
+        Returns
+        -------
+        :
+            Dictionary with values of ``k``, ``m``, ``sigma_obs``, ``delta`` and ``beta`` parameters
+        """
+        if not self._is_fitted:
+            raise ValueError("Prophet model is not fitted! Fit the model before calling get_fitted_params method!")
+        params = self.model.params
+        fitted_params: Dict[str, Any] = {name: float(np.mean(params[name])) for name in ["k", "m", "sigma_obs"]}
+        for name in ["delta", "beta"]:
+            fitted_params[name] = np.mean(params[name], axis=0)
+        return fitted_params
+
     def predict(self, df: pd.DataFrame, prediction_interval: bool, quantiles: Sequence[float]) -> pd.DataFrame:
         """
         Compute predictions from a Prophet model.
@@ -158,6 +293,12 @@ class ProphetModel(PerSegmentPredictionIntervalModel):
     Original Prophet can use features 'cap' and 'floor',
     they should be added to the known_future list on dataset initialization.
 
+    Segments are fitted independently, so they can be fitted in parallel processes with ``n_jobs`` greater than 1.
+
+    If ``warm_start`` is enabled, each refit of the model initializes optimization for a segment from the parameters
+    fitted on this segment during the previous fit. During the backtest folds are chained in this case,
+    so each fold starts from the parameters of the previous one.
+
     Examples
     --------
     >>> from etna.datasets import generate_periodic_df
@@ -180,7 +321,7 @@ class ProphetModel(PerSegmentPredictionIntervalModel):
     daily_seasonality = 'auto', holidays = None, seasonality_mode = 'additive',
     seasonality_prior_scale = 10.0, holidays_prior_scale = 10.0, changepoint_prior_scale = 0.05,
     mcmc_samples = 0, interval_width = 0.8, uncertainty_samples = 1000, stan_backend = None,
-    additional_seasonality_params = (), )
+    additional_seasonality_params = (), n_jobs = 1, joblib_params = None, warm_start = False, )
     >>> forecast = model.forecast(future)
     >>> forecast
     segment    segment_0 segment_1 segment_2 segment_3
@@ -214,6 +355,9 @@ class ProphetModel(PerSegmentPredictionIntervalModel):
         uncertainty_samples: Union[int, bool] = 1000,
         stan_backend: Optional[str] = None,
         additional_seasonality_params: Iterable[Dict[str, Union[str, float, int]]] = (),
+        n_jobs: int = 1,
+        joblib_params: Optional[Dict[str, Any]] = None,
+        warm_start: bool = False,
     ):
         """
         Create instance of Prophet model.
@@ -289,6 +433,12 @@ class ProphetModel(PerSegmentPredictionIntervalModel):
             parameters that describe additional (not 'daily', 'weekly', 'yearly') seasonality that should be
             added to model; dict with required keys 'name', 'period', 'fourier_order' and optional ones 'prior_scale',
             'mode', 'condition_name' will be used for :py:meth:`prophet.Prophet.add_seasonality` method call.
+        n_jobs:
+            Number of processes to fit the segments in parallel
+        joblib_params:
+            Additional parameters for :py:class:`joblib.Parallel`
+        warm_start:
+            If True, initialize optimization from the parameters of the previous fit for each segment
         """
         self.growth = growth
         self.n_changepoints = n_changepoints
@@ -307,6 +457,7 @@ class ProphetModel(PerSegmentPredictionIntervalModel):
         self.uncertainty_samples = uncertainty_samples
         self.stan_backend = stan_backend
         self.additional_seasonality_params = additional_seasonality_params
+        self.warm_start = warm_start
 
         super(ProphetModel, self).__init__(
             base_model=_ProphetAdapter(
@@ -327,5 +478,19 @@ class ProphetModel(PerSegmentPredictionIntervalModel):
                 uncertainty_samples=self.uncertainty_samples,
                 stan_backend=self.stan_backend,
                 additional_seasonality_params=self.additional_seasonality_params,
-            )
+            ),
+            n_jobs=n_jobs,
+            joblib_params=joblib_params,
         )
+
+    def _init_segment_models(self, segments: List[str]) -> Dict[str, Any]:
+        """Create models for the given segments passing them parameters of the previous fit if ``warm_start`` is set."""
+        models = super()._init_segment_models(segments=segments)
+        if not self.warm_start or self._models is None:
+            return models
+        for segment, model in models.items():
+            previous_model = self._models.get(segment)
+            if previous_model is not None and previous_model._is_fitted:
+                model.init_params = previous_model.get_fitted_params()
+                model.init_scaling = previous_model.get_scaling()
+        return models
@@ -1,10 +1,13 @@
 import warnings
 from datetime import datetime
+from typing import Any
+from typing import Dict
 from typing import List
 from typing import Optional
 from typing import Sequence
 from typing import Tuple
 
+import numpy as np
 import pandas as pd
 from statsmodels.tools.sm_exceptions import ValueWarning
 from statsmodels.tsa.statespace.sarimax import SARIMAX
@@ -31,6 +34,10 @@ class _SARIMAXAdapter(BaseAdapter):
     additional features what is not known in future, and regressors for features we do know in
     future.
 
+    If ``start_params`` attribute is set (e.g. to the parameters of the previous fit of the model on the same segment),
+    optimization starts from them instead of the default statsmodels initialization. Parameters are ignored
+    if they don't match the parameters of the model being fitted.
+
     .. `SARIMAX: <https://www.statsmodels.org/stable/generated/statsmodels.tsa.statespace.sarimax.SARIMAX.html>_`
 
     """
@@ -161,6 +168,7 @@ class _SARIMAXAdapter(BaseAdapter):
         self.missing = missing
         self.validate_specification = validate_specification
         self.kwargs = kwargs
+        self.start_params: Optional[pd.Series] = None
         self._model: Optional[SARIMAX] = None
         self._result: Optional[SARIMAX] = None
         self.regressor_columns: Optional[List[str]] = None
@@ -182,14 +190,7 @@ class _SARIMAXAdapter(BaseAdapter):
             Fitted model
         """
         self.regressor_columns = regressors
-        categorical_cols = df.select_dtypes(include=["category"]).columns.tolist()
-        try:
-            df.loc[:, categorical_cols] = df[categorical_cols].astype(int)
-        except ValueError:
-            raise ValueError(
-                f"Categorical columns {categorical_cols} can not been converted to int.\n "
-                "Try to encode this columns manually."
-            )
+        df = self._encode_categoricals(df)
 
         self._check_df(df)
 
@@ -220,9 +221,78 @@ class _SARIMAXAdapter(BaseAdapter):
             validate_specification=self.validate_specification,
             **self.kwargs,
         )
-        self._result = self._model.fit()
+        self._result = self._model.fit(start_params=self._get_start_params())
         return self
 
+    def update(self, df: pd.DataFrame) -> "_SARIMAXAdapter":
+        """
+        Update the fitted SARIMAX model with new observations without re-estimating its parameters.
+
+        Filter of the model is advanced through the new observations, so the forecast starts right after them.
+
+        Parameters
+        ----------
+        df:
+            Features dataframe, rows that aren't later than the end of the fitted data are ignored
+
+        Returns
+        -------
+        :
+            Updated model
+        """
+        if self._result is None or self._model is None:
+            raise ValueError("SARIMAX model is not fitted! Fit the model before calling update method!")
+        df = df[df["timestamp"] > self._model.data.orig_endog.index.max()]
+        if len(df) == 0:
+            return self
+
+        df = self._encode_categoricals(df)
+
+        self._check_df(df)
+
+        targets = df["target"]
+        targets.index = df["timestamp"]
+
+        exog_new = self._select_regressors(df)
+
+        self._result = self._result.append(endog=targets, exog=exog_new, refit=False)
+        self._model = self._result.model
+        return self
+
+    @staticmethod
+    def _encode_categoricals(df: pd.DataFrame) -> pd.DataFrame:
+        """Get copy of the dataframe with categorical columns converted to int."""
+        df = df.copy()
+        categorical_cols = df.select_dtypes(include=["category"]).columns.tolist()
+        try:
+            df.loc[:, categorical_cols] = df[categorical_cols].astype(int)
+        except ValueError:
+            raise ValueError(
+                f"Categorical columns {categorical_cols} can not been converted to int.\n "
+                "Try to encode this columns manually."
+            )
+        return df
+
+    def _get_start_params(self) -> Optional[np.ndarray]:
+        """Get parameters to start optimization from if they are valid for the current model."""
+        if self.start_params is None or self._model is None:
+            return None
+        if list(self.start_params.index) != list(self._model.param_names):
+            return None
+        return self.start_params.values
+
+    def get_fitted_params(self) -> pd.Series:
+        """Get parameters of the fitted model.
+
+        Returns
+        -------
+        :
+            Series with fitted parameters indexed by their names
+        """
+        if self._result is None:
+            raise ValueError("SARIMAX model is not fitted! Fit the model before calling get_fitted_params method!")
+        return self._result.params
+
     def predict(self, df: pd.DataFrame, prediction_interval: bool, quantiles: Sequence[float]) -> pd.DataFrame:
         """
         Compute predictions from a SARIMAX model.
@@ -246,14 +316,7 @@ class _SARIMAXAdapter(BaseAdapter):
         horizon = len(df)
         self._check_df(df, horizon)
 
-        categorical_cols = df.select_dtypes(include=["category"]).columns.tolist()
-        try:
-            df.loc[:, categorical_cols] = df[categorical_cols].astype(int)
-        except ValueError:
-            raise ValueError(
-                f"Categorical columns {categorical_cols} can not been converted to int.\n "
-                "Try to encode this columns manually."
-            )
+        df = self._encode_categoricals(df)
 
         exog_future = self._select_regressors(df)
         if prediction_interval:
@@ -332,6 +395,10 @@ class SARIMAXModel(PerSegmentPredictionIntervalModel):
     `exogenous regressors` which should be known in future, however we use exogenous for
     additional features what is not known in future, and regressors for features we do know in
     future.
+
+    If ``warm_start`` is enabled, each refit of the model starts optimization for a segment from the parameters
+    fitted on this segment during the previous fit. During the backtest folds are chained in this case,
+    so each fold starts from the parameters of the previous one.
     """
 
     def __init__(
@@ -353,6 +420,7 @@ class SARIMAXModel(PerSegmentPredictionIntervalModel):
         freq: Optional[str] = None,
         missing: str = "none",
         validate_specification: bool = True,
+        warm_start: bool = False,
         **kwargs,
     ):
         """
@@ -441,6 +509,8 @@ class SARIMAXModel(PerSegmentPredictionIntervalModel):
             If 'raise', an error is raised. Default is 'none'.
         validate_specification:
             If True, validation of hyperparameters is performed.
+        warm_start:
+            If True, start optimization from the parameters of the previous fit for each segment
         """
         self.order = order
         self.seasonal_order = seasonal_order
@@ -459,6 +529,7 @@ class SARIMAXModel(PerSegmentPredictionIntervalModel):
         self.freq = freq
         self.missing = missing
         self.validate_specification = validate_specification
+        self.warm_start = warm_start
         self.kwargs = kwargs
         super(SARIMAXModel, self).__init__(
             base_model=_SARIMAXAdapter(
@@ -482,3 +553,14 @@ class SARIMAXModel(PerSegmentPredictionIntervalModel):
                 **self.kwargs,
             )
         )
+
+    def _init_segment_models(self, segments: List[str]) -> Dict[str, Any]:
+        """Create models for the given segments passing them parameters of the previous fit if ``warm_start`` is set."""
+        models = super()._init_segment_models(segments=segments)
+        if not self.warm_start or self._models is None:
+            return models
+        for segment, model in models.items():
+            previous_model = self._models.get(segment)
+            if previous_model is not None and previous_model._result is not None:
+                model.start_params = previous_model.get_fitted_params()
+        return models
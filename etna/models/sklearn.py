@@ -1,8 +1,10 @@
 from typing import List
 from typing import Optional
+from typing import Union
 
 import numpy as np
 import pandas as pd
+from scipy import sparse
 from sklearn.base import RegressorMixin
 
 from etna.models.base import BaseAdapter
@@ -32,10 +34,7 @@ class _SklearnAdapter(BaseAdapter):
             Fitted model
         """
         self.regressor_columns = regressors
-        try:
-            features = df[self.regressor_columns].apply(pd.to_numeric)
-        except ValueError:
-            raise ValueError("Only convertible to numeric features are accepted!")
+        features = self._make_features(df)
         target = df["target"]
         self.model.fit(features, target)
         return self
@@ -54,12 +53,30 @@ class _SklearnAdapter(BaseAdapter):
         :
             Array with predictions
         """
+        features = self._make_features(df)
+        pred = self.model.predict(features)
+        return pred
+
+    def _make_features(self, df: pd.DataFrame) -> Union[pd.DataFrame, sparse.csr_matrix]:
+        """Make features for the model.
+
+        If there are sparse columns, features are returned as a sparse matrix to avoid converting them to dense.
+        """
         try:
             features = df[self.regressor_columns].apply(pd.to_numeric)
         except ValueError:
             raise ValueError("Only convertible to numeric features are accepted!")
-        pred = self.model.predict(features)
-        return pred
+
+        is_sparse = np.array([isinstance(dtype, pd.SparseDtype) for dtype in features.dtypes])
+        if not is_sparse.any():
+            return features
+
+        # keep the order of the columns
+        order = np.argsort(np.concatenate([np.flatnonzero(~is_sparse), np.flatnonzero(is_sparse)]), kind="stable")
+        dense_features = sparse.csr_matrix(features.loc[:, ~is_sparse].values.astype(float))
+        sparse_features = features.loc[:, is_sparse].sparse.to_coo()
+        features = sparse.hstack([dense_features, sparse_features], format="csc")[:, order].tocsr()
+        return features
 
     def get_model(self) -> RegressorMixin:
         """Get internal sklearn model that is used inside etna class.
@@ -1,3 +1,5 @@
+from typing import Any
+from typing import Dict
 from typing import Iterable
 from typing import Optional
 from typing import Tuple
@@ -45,7 +47,13 @@ class _TBATSAdapter(BaseAdapter):
 
 
 class BATSModel(PerSegmentPredictionIntervalModel):
-    """Class for holding segment interval BATS model."""
+    """Class for holding segment interval BATS model.
+
+    By default, segments are fitted one after another and each estimator parallelizes its fit on its own.
+    If ``worker_budget`` is set, segments are fitted in parallel processes within this budget and each estimator
+    is fitted in a single process, so the cores aren't oversubscribed. During the backtest the budget is divided
+    between the folds fitted in parallel.
+    """
 
     def __init__(
         self,
@@ -59,6 +67,8 @@ class BATSModel(PerSegmentPredictionIntervalModel):
         n_jobs: Optional[int] = None,
         multiprocessing_start_method: str = "spawn",
         context: Optional[ContextInterface] = None,
+        worker_budget: Optional[int] = None,
+        joblib_params: Optional[Dict[str, Any]] = None,
     ):
         """Create BATSModel with given parameters.
 
@@ -95,7 +105,22 @@ class BATSModel(PerSegmentPredictionIntervalModel):
             See https://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods
         context: abstract.ContextInterface, optional (default=None)
             For advanced users only. Provide this to override default behaviors
+        worker_budget: int, optional (default=None)
+            Total number of processes to fit the segments with. When provided segments are fitted in parallel
+            and ``n_jobs`` is ignored, each estimator is fitted in a single process.
+        joblib_params: dict, optional (default=None)
+            Additional parameters for :py:class:`joblib.Parallel` that fits the segments
         """
+        self.use_box_cox = use_box_cox
+        self.box_cox_bounds = box_cox_bounds
+        self.use_trend = use_trend
+        self.use_damped_trend = use_damped_trend
+        self.seasonal_periods = seasonal_periods
+        self.use_arma_errors = use_arma_errors
+        self.show_warnings = show_warnings
+        self.multiprocessing_start_method = multiprocessing_start_method
+        self.context = context
+        self.worker_budget = worker_budget
         self.model = BATS(
             use_box_cox=use_box_cox,
             box_cox_bounds=box_cox_bounds,
@@ -104,15 +129,25 @@ class BATSModel(PerSegmentPredictionIntervalModel):
             seasonal_periods=seasonal_periods,
             use_arma_errors=use_arma_errors,
             show_warnings=show_warnings,
-            n_jobs=n_jobs,
+            n_jobs=n_jobs if worker_budget is None else 1,
             multiprocessing_start_method=multiprocessing_start_method,
             context=context,
         )
-        super().__init__(base_model=_TBATSAdapter(self.model))
+        super().__init__(base_model=_TBATSAdapter(self.model), joblib_params=joblib_params)
+
+    def _get_n_jobs(self) -> int:
+        """Get the number of segments to fit in parallel."""
+        return 1 if self.worker_budget is None else self.worker_budget
 
 
 class TBATSModel(PerSegmentPredictionIntervalModel):
-    """Class for holding segment interval TBATS model."""
+    """Class for holding segment interval TBATS model.
+
+    By default, segments are fitted one after another and each estimator parallelizes its fit on its own.
+    If ``worker_budget`` is set, segments are fitted in parallel processes within this budget and each estimator
+    is fitted in a single process, so the cores aren't oversubscribed. During the backtest the budget is divided
+    between the folds fitted in parallel.
+    """
 
     def __init__(
         self,
@@ -126,6 +161,8 @@ class TBATSModel(PerSegmentPredictionIntervalModel):
         n_jobs: Optional[int] = None,
         multiprocessing_start_method: str = "spawn",
         context: Optional[ContextInterface] = None,
+        worker_budget: Optional[int] = None,
+        joblib_params: Optional[Dict[str, Any]] = None,
     ):
         """Create TBATSModel with given parameters.
 
@@ -162,7 +199,22 @@ class TBATSModel(PerSegmentPredictionIntervalModel):
             See https://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods
         context: abstract.ContextInterface, optional (default=None)
             For advanced users only. Provide this to override default behaviors
+        worker_budget: int, optional (default=None)
+            Total number of processes to fit the segments with. When provided segments are fitted in parallel
+            and ``n_jobs`` is ignored, each estimator is fitted in a single process.
+        joblib_params: dict, optional (default=None)
+            Additional parameters for :py:class:`joblib.Parallel` that fits the segments
         """
+        self.use_box_cox = use_box_cox
+        self.box_cox_bounds = box_cox_bounds
+        self.use_trend = use_trend
+        self.use_damped_trend = use_damped_trend
+        self.seasonal_periods = seasonal_periods
+        self.use_arma_errors = use_arma_errors
+        self.show_warnings = show_warnings
+        self.multiprocessing_start_method = multiprocessing_start_method
+        self.context = context
+        self.worker_budget = worker_budget
         self.model = TBATS(
             use_box_cox=use_box_cox,
             box_cox_bounds=box_cox_bounds,
@@ -171,8 +223,12 @@ class TBATSModel(PerSegmentPredictionIntervalModel):
             seasonal_periods=seasonal_periods,
             use_arma_errors=use_arma_errors,
             show_warnings=show_warnings,
-            n_jobs=n_jobs,
+            n_jobs=n_jobs if worker_budget is None else 1,
             multiprocessing_start_method=multiprocessing_start_method,
             context=context,
         )
-        super().__init__(base_model=_TBATSAdapter(self.model))
+        super().__init__(base_model=_TBATSAdapter(self.model), joblib_params=joblib_params)
+
+    def _get_n_jobs(self) -> int:
+        """Get the number of segments to fit in parallel."""
+        return 1 if self.worker_budget is None else self.worker_budget
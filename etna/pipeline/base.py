@@ -1,7 +1,11 @@
+import json
+import os
+import tempfile
 from abc import ABC
 from abc import abstractmethod
 from copy import deepcopy
 from enum import Enum
+from pathlib import Path
 from typing import Any
 from typing import Dict
 from typing import Generator
@@ -15,6 +19,7 @@ import numpy as np
 import pandas as pd
 from joblib import Parallel
 from joblib import delayed
+from joblib import effective_n_jobs
 from scipy.stats import norm
 
 from etna.core import BaseMixin
@@ -26,6 +31,9 @@ from etna.metrics import MetricAggregationMode
 
 Timestamp = Union[str, pd.Timestamp]
 
+_FOLD_COLUMN = "fold_number"
+_BACKTEST_MANIFEST_NAME = "backtest_manifest.json"
+
 
 class CrossValidationMode(Enum):
     """Enum for different cross-validation modes."""
@@ -161,7 +169,9 @@ class AbstractPipeline(ABC):
         n_jobs: int = 1,
         joblib_params: Optional[Dict[str, Any]] = None,
         forecast_params: Optional[Dict[str, Any]] = None,
-    ) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+        forecasts_dir: Optional[Union[str, Path]] = None,
+        return_forecasts: bool = True,
+    ) -> Tuple[pd.DataFrame, Optional[pd.DataFrame], pd.DataFrame]:
         """Run backtest with the pipeline.
 
         Parameters
@@ -182,10 +192,19 @@ class AbstractPipeline(ABC):
             Additional parameters for :py:class:`joblib.Parallel`
         forecast_params:
             Additional parameters for :py:func:`~etna.pipeline.base.BasePipeline.forecast`
+        forecasts_dir:
+            Directory to save forecasts of folds to, each fold is saved to ``fold_{fold_number}.pkl`` by the worker
+            that runs it and only the path is sent back. Folds of the run are listed in the manifest file written
+            to the same directory. Forecasts are still read back to build the forecast dataframe, to keep them out
+            of memory set ``return_forecasts=False`` and load them later with
+            :py:meth:`~etna.pipeline.base.BasePipeline.load_backtest_forecasts`
+        return_forecasts:
+            If False forecast dataframe isn't built and None is returned instead, so forecasts of folds
+            aren't kept in memory
 
         Returns
         -------
-        metrics_df, forecast_df, fold_info_df: Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]
+        metrics_df, forecast_df, fold_info_df: Tuple[pd.DataFrame, Optional[pd.DataFrame], pd.DataFrame]
             Metrics dataframe, forecast dataframe and dataframe with information about folds
         """
 
@@ -217,6 +236,22 @@ class BasePipeline(AbstractPipeline, BaseMixin):
         """Make predictions."""
         pass
 
+    def _is_warm_started(self) -> bool:
+        """Check if the refits of the pipeline should start from the results of its previous fit."""
+        return False
+
+    def _reset_warm_start(self) -> None:
+        """Forget the results of the previous fit, so the next refit of the pipeline starts cold."""
+        pass
+
+    def _share_workers(self, n_parallel_folds: int) -> None:
+        """Divide the workers available to the pipeline between ``n_parallel_folds`` folds fitted at the same time."""
+        pass
+
+    def _has_nested_workers(self) -> bool:
+        """Check if the fit of the pipeline runs workers of its own."""
+        return False
+
     def _forecast_prediction_interval(
         self, predictions: TSDataset, quantiles: Sequence[float], n_folds: int
     ) -> TSDataset:
@@ -279,7 +314,7 @@ class BasePipeline(AbstractPipeline, BaseMixin):
 
     def _init_backtest(self):
         self._folds: Optional[Dict[int, Any]] = None
-        self._fold_column = "fold_number"
+        self._fold_column = _FOLD_COLUMN
 
     @staticmethod
     def _validate_backtest_n_folds(n_folds: int):
@@ -383,11 +418,24 @@ class BasePipeline(AbstractPipeline, BaseMixin):
         mask: FoldMask,
         metrics: List[Metric],
         forecast_params: Dict[str, Any],
+        pipeline: Optional["BasePipeline"] = None,
+        n_parallel_folds: int = 1,
+        forecasts_dir: Optional[Union[str, Path]] = None,
+        return_forecasts: bool = True,
     ) -> Dict[str, Any]:
-        """Run fit-forecast pipeline of model for one fold."""
+        """Run fit-forecast pipeline of model for one fold.
+
+        If ``pipeline`` is given, it is fitted in place instead of the copy of the current pipeline.
+        Otherwise, the copy gets its share of workers assuming that ``n_parallel_folds`` folds are run at the same time.
+
+        Only the forecast dataframe is returned with the fold, it is replaced with the path to the file if
+        ``forecasts_dir`` is given or dropped if it isn't needed.
+        """
         tslogger.start_experiment(job_type="crossval", group=str(fold_number))
 
-        pipeline = deepcopy(self)
+        if pipeline is None:
+            pipeline = deepcopy(self)
+            pipeline._share_workers(n_parallel_folds=n_parallel_folds)
         pipeline.fit(ts=train)
         forecast = pipeline.forecast(**forecast_params)
         fold: Dict[str, Any] = {}
@@ -399,8 +447,15 @@ class BasePipeline(AbstractPipeline, BaseMixin):
         forecast.df = forecast.df.loc[mask.target_timestamps]
         test.df = test.df.loc[mask.target_timestamps]
 
-        fold["forecast"] = forecast
         fold["metrics"] = deepcopy(self._compute_metrics(metrics=metrics, y_true=test, y_pred=forecast))
+        if forecasts_dir is not None:
+            forecast_path = Path(forecasts_dir) / f"fold_{fold_number}.pkl"
+            forecast.df.to_pickle(forecast_path)
+            fold["forecast"] = forecast_path
+        elif return_forecasts:
+            fold["forecast"] = forecast.df
+        else:
+            fold["forecast"] = None
 
         tslogger.log_backtest_run(pd.DataFrame(fold["metrics"]), forecast.to_pandas(), test.to_pandas())
         tslogger.finish_experiment()
@@ -444,20 +499,89 @@ class BasePipeline(AbstractPipeline, BaseMixin):
         """Get forecasts from different folds."""
         if self._folds is None:
             raise ValueError("Something went wrong during backtest initialization!")
-        forecasts_list = []
+        forecasts = {}
         for fold_number, fold_info in self._folds.items():
-            forecast_ts = fold_info["forecast"]
-            segments = forecast_ts.segments
-            forecast = forecast_ts.df
+            forecast = fold_info["forecast"]
+            if isinstance(forecast, Path):
+                forecast = pd.read_pickle(forecast)
+            forecasts[fold_number] = forecast
+        return self._join_backtest_forecasts(forecasts=forecasts, fold_column=self._fold_column)
+
+    @staticmethod
+    def _join_backtest_forecasts(forecasts: Dict[int, pd.DataFrame], fold_column: str) -> pd.DataFrame:
+        """Join forecasts of folds into one dataframe marking each of them with its fold number."""
+        forecasts_list = []
+        for fold_number, forecast in forecasts.items():
+            segments = sorted(set(forecast.columns.get_level_values("segment")))
             fold_number_df = pd.DataFrame(
                 np.tile(fold_number, (forecast.index.shape[0], len(segments))),
-                columns=pd.MultiIndex.from_product([segments, [self._fold_column]], names=("segment", "feature")),
+                columns=pd.MultiIndex.from_product([segments, [fold_column]], names=("segment", "feature")),
                 index=forecast.index,
             )
             forecast = forecast.join(fold_number_df)
             forecasts_list.append(forecast)
-        forecasts = pd.concat(forecasts_list)
-        return forecasts
+        forecasts_df = pd.concat(forecasts_list)
+        return forecasts_df
+
+    @staticmethod
+    def _write_backtest_manifest(forecasts_dir: Union[str, Path], fold_numbers: List[int], complete: bool):
+        """Write the list of folds of the backtest run to ``forecasts_dir``.
+
+        Only the folds listed in the manifest are loaded, so forecasts of folds left by the previous runs are ignored.
+        """
+        path = Path(forecasts_dir) / _BACKTEST_MANIFEST_NAME
+        file_descriptor, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(file_descriptor, "w") as ouf:
+                json.dump({"fold_numbers": fold_numbers, "complete": complete}, ouf)
+            os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    @staticmethod
+    def load_backtest_forecasts(forecasts_dir: Union[str, Path]) -> pd.DataFrame:
+        """Load forecast dataframe of backtest from the forecasts of folds saved to ``forecasts_dir``.
+
+        Only the folds of the last backtest run listed in its manifest are loaded.
+
+        Parameters
+        ----------
+        forecasts_dir:
+            Directory that was passed to :py:meth:`~etna.pipeline.base.BasePipeline.backtest`
+
+        Returns
+        -------
+        :
+            Forecast dataframe in the same format as the one returned by backtest
+
+        Raises
+        ------
+        ValueError:
+            if there is no manifest of backtest in ``forecasts_dir``
+        ValueError:
+            if backtest that saved forecasts to ``forecasts_dir`` didn't finish
+        ValueError:
+            if forecast of some fold listed in the manifest is missing
+        """
+        manifest_path = Path(forecasts_dir) / _BACKTEST_MANIFEST_NAME
+        if not manifest_path.exists():
+            raise ValueError(
+                f"There are no forecasts of folds in {forecasts_dir}, {_BACKTEST_MANIFEST_NAME} is missing!"
+            )
+        with open(manifest_path, "r") as inf:
+            manifest = json.load(inf)
+        if not manifest["complete"]:
+            raise ValueError(f"Backtest that saved forecasts to {forecasts_dir} didn't finish!")
+
+        paths = {
+            fold_number: Path(forecasts_dir) / f"fold_{fold_number}.pkl" for fold_number in manifest["fold_numbers"]
+        }
+        missing_folds = [fold_number for fold_number, path in paths.items() if not path.exists()]
+        if len(missing_folds) > 0:
+            raise ValueError(f"Forecasts of folds {missing_folds} are missing in {forecasts_dir}!")
+        forecasts = {fold_number: pd.read_pickle(path) for fold_number, path in paths.items()}
+        return BasePipeline._join_backtest_forecasts(forecasts=forecasts, fold_column=_FOLD_COLUMN)
 
     def _prepare_fold_masks(self, ts: TSDataset, masks: Union[int, List[FoldMask]], mode: str) -> List[FoldMask]:
         """Prepare and validate fold masks."""
@@ -482,7 +606,9 @@ class BasePipeline(AbstractPipeline, BaseMixin):
         n_jobs: int = 1,
         joblib_params: Optional[Dict[str, Any]] = None,
         forecast_params: Optional[Dict[str, Any]] = None,
-    ) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+        forecasts_dir: Optional[Union[str, Path]] = None,
+        return_forecasts: bool = True,
+    ) -> Tuple[pd.DataFrame, Optional[pd.DataFrame], pd.DataFrame]:
         """Run backtest with the pipeline.
 
         Parameters
@@ -498,19 +624,35 @@ class BasePipeline(AbstractPipeline, BaseMixin):
         aggregate_metrics:
             If True aggregate metrics above folds, return raw metrics otherwise
         n_jobs:
-            Number of jobs to run in parallel
+            Number of jobs to run in parallel. If the pipeline is warm started and ``n_jobs=1``,
+            folds are fitted one after another by the same copy of the pipeline, so each fold starts
+            from the results of the previous one. If the model has a ``worker_budget`` or fits segments
+            with ``n_jobs`` greater than 1, its workers are divided between the folds fitted in parallel
         joblib_params:
-            Additional parameters for :py:class:`joblib.Parallel`
+            Additional parameters for :py:class:`joblib.Parallel`. By default folds are run by the "multiprocessing"
+            backend, or by the "loky" backend if the model fits segments in parallel (it has a ``worker_budget`` or
+            ``n_jobs`` greater than 1): workers of the "multiprocessing" backend can't start the workers of their own,
+            so the segments inside the fold would be fitted one by one
         forecast_params:
             Additional parameters for :py:func:`~etna.pipeline.base.BasePipeline.forecast`
+        forecasts_dir:
+            Directory to save forecasts of folds to, each fold is saved to ``fold_{fold_number}.pkl`` by the worker
+            that runs it and only the path is sent back. Folds of the run are listed in the manifest file written
+            to the same directory. Forecasts are still read back to build the forecast dataframe, to keep them out
+            of memory set ``return_forecasts=False`` and load them later with
+            :py:meth:`~etna.pipeline.base.BasePipeline.load_backtest_forecasts`
+        return_forecasts:
+            If False forecast dataframe isn't built and None is returned instead, so forecasts of folds
+            aren't kept in memory
 
         Returns
         -------
-        metrics_df, forecast_df, fold_info_df: Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]
+        metrics_df, forecast_df, fold_info_df: Tuple[pd.DataFrame, Optional[pd.DataFrame], pd.DataFrame]
             Metrics dataframe, forecast dataframe and dataframe with information about folds
         """
         if joblib_params is None:
-            joblib_params = dict(verbose=11, backend="multiprocessing", mmap_mode="c")
+            backend = "loky" if self._has_nested_workers() else "multiprocessing"
+            joblib_params = dict(verbose=11, backend=backend, mmap_mode="c")
 
         if forecast_params is None:
             forecast_params = dict()
@@ -519,23 +661,56 @@ class BasePipeline(AbstractPipeline, BaseMixin):
         self._validate_backtest_metrics(metrics=metrics)
         masks = self._prepare_fold_masks(ts=ts, masks=n_folds, mode=mode)
 
-        folds = Parallel(n_jobs=n_jobs, **joblib_params)(
-            delayed(self._run_fold)(
-                train=train,
-                test=test,
-                fold_number=fold_number,
-                mask=masks[fold_number],
-                metrics=metrics,
-                forecast_params=forecast_params,
+        if forecasts_dir is not None:
+            Path(forecasts_dir).mkdir(parents=True, exist_ok=True)
+            self._write_backtest_manifest(
+                forecasts_dir=forecasts_dir, fold_numbers=list(range(len(masks))), complete=False
             )
-            for fold_number, (train, test) in enumerate(
-                self._generate_folds_datasets(ts=ts, masks=masks, horizon=self.horizon)
+
+        if n_jobs == 1 and self._is_warm_started():
+            pipeline = deepcopy(self)
+            # the first fold mustn't start from the fit on the whole series, it has seen the test windows
+            pipeline._reset_warm_start()
+            folds = [
+                self._run_fold(
+                    train=train,
+                    test=test,
+                    fold_number=fold_number,
+                    mask=masks[fold_number],
+                    metrics=metrics,
+                    forecast_params=forecast_params,
+                    pipeline=pipeline,
+                    forecasts_dir=forecasts_dir,
+                    return_forecasts=return_forecasts,
+                )
+                for fold_number, (train, test) in enumerate(
+                    self._generate_folds_datasets(ts=ts, masks=masks, horizon=self.horizon)
+                )
+            ]
+        else:
+            n_parallel_folds = min(effective_n_jobs(n_jobs), len(masks))
+            folds = Parallel(n_jobs=n_jobs, **joblib_params)(
+                delayed(self._run_fold)(
+                    train=train,
+                    test=test,
+                    fold_number=fold_number,
+                    mask=masks[fold_number],
+                    metrics=metrics,
+                    forecast_params=forecast_params,
+                    n_parallel_folds=n_parallel_folds,
+                    forecasts_dir=forecasts_dir,
+                    return_forecasts=return_forecasts,
+                )
+                for fold_number, (train, test) in enumerate(
+                    self._generate_folds_datasets(ts=ts, masks=masks, horizon=self.horizon)
+                )
             )
-        )
         self._folds = {i: fold for i, fold in enumerate(folds)}
+        if forecasts_dir is not None:
+            self._write_backtest_manifest(forecasts_dir=forecasts_dir, fold_numbers=list(self._folds), complete=True)
 
         metrics_df = self._get_backtest_metrics(aggregate_metrics=aggregate_metrics)
-        forecast_df = self._get_backtest_forecasts()
+        forecast_df = self._get_backtest_forecasts() if return_forecasts else None
         fold_info_df = self._get_fold_info()
 
         tslogger.start_experiment(job_type="crossval_results", group="all")
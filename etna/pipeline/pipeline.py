@@ -1,7 +1,11 @@
 from typing import Sequence
 
+import pandas as pd
+from joblib import effective_n_jobs
+
 from etna.datasets import TSDataset
 from etna.models.base import BaseModel
+from etna.models.base import PerSegmentBaseModel
 from etna.models.base import PredictIntervalAbstractModel
 from etna.pipeline.base import BasePipeline
 from etna.transforms.base import Transform
@@ -48,6 +52,83 @@ class Pipeline(BasePipeline):
         self.ts.inverse_transform()
         return self
 
+    def update(self, ts: TSDataset) -> "Pipeline":
+        """Update the fitted Pipeline with new observations without refitting it.
+
+        New observations are appended to the fitted dataset and processed by the already fitted transforms,
+        then the model extends its state with them without re-estimating its parameters.
+        After the update the forecast starts right after the new observations.
+
+        Parameters
+        ----------
+        ts:
+            Dataset with new observations, it should continue the dataset the Pipeline is fitted on;
+            timestamps that are already present in the fitted dataset are ignored
+
+        Returns
+        -------
+        :
+            Updated Pipeline instance
+
+        Raises
+        ------
+        NotImplementedError:
+            if the model of the Pipeline doesn't support update
+        """
+        if self.ts is None:
+            raise ValueError(
+                f"{self.__class__.__name__} is not fitted! Fit the {self.__class__.__name__} "
+                f"before calling update method."
+            )
+        if not isinstance(self.model, PerSegmentBaseModel):
+            raise NotImplementedError(f"update method is not implemented for {self.model.__class__.__name__}")
+
+        new_timestamps = ts.raw_df.index.difference(self.ts.raw_df.index)
+        df = pd.concat([self.ts.raw_df, ts.raw_df.loc[new_timestamps]])
+        df_exog = self.ts.df_exog
+        if ts.df_exog is not None:
+            df_exog = ts.df_exog if df_exog is None else ts.df_exog.combine_first(df_exog)
+        updated_ts = TSDataset(df=df, freq=self.ts.freq, df_exog=df_exog, known_future=self.ts.known_future)
+
+        updated_ts.transform(self.transforms)
+        self.model.update(updated_ts)
+        updated_ts.inverse_transform()
+        self.ts = updated_ts
+        return self
+
+    def _is_warm_started(self) -> bool:
+        """Check if the model of the pipeline starts its refits from the results of the previous fit."""
+        return getattr(self.model, "warm_start", False)
+
+    def _reset_warm_start(self) -> None:
+        """Forget the fitted models of the segments, so the next refit of the model starts cold."""
+        if self._is_warm_started() and isinstance(self.model, PerSegmentBaseModel):
+            self.model._models = None
+
+    def _share_workers(self, n_parallel_folds: int) -> None:
+        """Divide the workers of the model between ``n_parallel_folds`` folds fitted at the same time.
+
+        Worker budget of the model is divided if it is set, otherwise the number of segments fitted in parallel.
+        """
+        if not isinstance(self.model, PerSegmentBaseModel) or not self._has_nested_workers():
+            return
+        model = self.model
+        if model.worker_budget is not None:
+            model.worker_budget = max(1, model.worker_budget // n_parallel_folds)
+        else:
+            model.n_jobs = max(1, effective_n_jobs(model.n_jobs) // n_parallel_folds)
+        # inside the fold workers only the nested pools of "loky" backend aren't run sequentially
+        joblib_params = model._get_joblib_params()
+        if n_parallel_folds > 1 and joblib_params.get("backend") == "multiprocessing":
+            model.joblib_params = {**joblib_params, "backend": "loky"}
+
+    def _has_nested_workers(self) -> bool:
+        """Check if the model fits segments in workers of its own."""
+        if getattr(self.model, "worker_budget", None) is not None:
+            return True
+        get_n_jobs = getattr(self.model, "_get_n_jobs", None)
+        return get_n_jobs is not None and effective_n_jobs(get_n_jobs()) > 1
+
     def _forecast(self) -> TSDataset:
         """Make predictions."""
         if self.ts is None:
@@ -84,7 +165,11 @@ class Pipeline(BasePipeline):
         self._validate_quantiles(quantiles=quantiles)
         self._validate_backtest_n_folds(n_folds=n_folds)
 
-        if prediction_interval and isinstance(self.model, PredictIntervalAbstractModel):
+        if (
+            prediction_interval
+            and isinstance(self.model, PredictIntervalAbstractModel)
+            and self.model._can_predict_quantiles(quantiles=quantiles)
+        ):
             future = self.ts.make_future(self.horizon)
             predictions = self.model.forecast(ts=future, prediction_interval=prediction_interval, quantiles=quantiles)
         else:
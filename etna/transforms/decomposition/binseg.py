@@ -1,3 +1,5 @@
+from typing import Any
+from typing import Dict
 from typing import Optional
 
 from ruptures.base import BaseCost
@@ -28,6 +30,9 @@ class BinsegTrendTransform(ChangePointsTrendTransform):
         n_bkps: int = 5,
         pen: Optional[float] = None,
         epsilon: Optional[float] = None,
+        n_jobs: int = 1,
+        joblib_params: Optional[Dict[str, Any]] = None,
+        cache_change_points: bool = False,
     ):
         """Init BinsegTrendTransform.
 
@@ -52,6 +57,12 @@ class BinsegTrendTransform(ChangePointsTrendTransform):
             penalty value (>0)
         epsilon:
             reconstruction budget (>0)
+        n_jobs:
+            number of segments to find change points in parallel
+        joblib_params:
+            additional parameters for :py:class:`joblib.Parallel`
+        cache_change_points:
+            if True, change points found on the segments are cached and reused by the fits on the same data
         """
         self.model = model
         self.custom_cost = custom_cost
@@ -67,6 +78,9 @@ class BinsegTrendTransform(ChangePointsTrendTransform):
                 model=self.model, custom_cost=self.custom_cost, min_size=self.min_size, jump=self.jump
             ),
             detrend_model=detrend_model,
+            n_jobs=n_jobs,
+            joblib_params=joblib_params,
+            cache_change_points=cache_change_points,
             n_bkps=self.n_bkps,
             pen=self.pen,
             epsilon=self.epsilon,
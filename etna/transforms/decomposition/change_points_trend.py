@@ -1,4 +1,5 @@
 from copy import deepcopy
+from typing import Any
 from typing import Dict
 from typing import List
 from typing import Optional
@@ -9,8 +10,11 @@ import numpy as np
 import pandas as pd
 from ruptures.base import BaseEstimator
 from sklearn.base import RegressorMixin
+from sklearn.linear_model import LinearRegression
 
+from etna.analysis.change_points_trend.search import _ChangePointsCache
 from etna.analysis.change_points_trend.search import _find_change_points_segment
+from etna.analysis.change_points_trend.search import _find_change_points_segments
 from etna.transforms.base import PerSegmentWrapper
 from etna.transforms.base import Transform
 from etna.transforms.utils import match_target_quantiles
@@ -20,7 +24,12 @@ TDetrendModel = Type[RegressorMixin]
 
 
 class _OneSegmentChangePointsTrendTransform(Transform):
-    """_OneSegmentChangePointsTransform subtracts multiple linear trend from series."""
+    """_OneSegmentChangePointsTransform subtracts multiple linear trend from series.
+
+    If ``detrend_model`` is :py:class:`sklearn.linear_model.LinearRegression` with intercept,
+    trends of all the intervals are fitted at once by closed-form least squares and predicted at once,
+    other regressors are fitted and predicted interval by interval.
+    """
 
     def __init__(
         self,
@@ -49,6 +58,8 @@ class _OneSegmentChangePointsTrendTransform(Transform):
         self.per_interval_models: Optional[Dict[TTimestampInterval, TDetrendModel]] = None
         self.intervals: Optional[List[TTimestampInterval]] = None
         self.change_point_model_predict_params = change_point_model_predict_params
+        # intercepts and slopes of linear trends of the intervals fitted at once
+        self._linear_trends: Optional[Tuple[np.ndarray, np.ndarray]] = None
 
     @staticmethod
     def _build_trend_intervals(change_points: List[pd.Timestamp]) -> List[TTimestampInterval]:
@@ -70,16 +81,76 @@ class _OneSegmentChangePointsTrendTransform(Transform):
         per_interval_models = {interval: deepcopy(self.detrend_model) for interval in intervals}
         return per_interval_models
 
+    @staticmethod
+    def _get_seconds(index: pd.Index) -> np.ndarray:
+        """Convert timestamps to seconds from epoch in the same way as :py:meth:`pandas.Timestamp.timestamp`."""
+        return np.round(pd.DatetimeIndex(index).asi8 / 1e9, 6)
+
     def _get_timestamps(self, series: pd.Series) -> np.ndarray:
         """Convert ETNA timestamp-index to a list of timestamps to fit regression models."""
-        timestamps = series.index
-        timestamps = np.array([[ts.timestamp()] for ts in timestamps])
-        return timestamps
+        return self._get_seconds(series.index).reshape(-1, 1)
+
+    def _is_linear_detrend_model(self) -> bool:
+        """Check if detrend model is the linear regression with intercept that can be fitted at once for intervals."""
+        return (
+            type(self.detrend_model) is LinearRegression
+            and self.detrend_model.fit_intercept
+            and not getattr(self.detrend_model, "positive", False)
+        )
+
+    def _get_change_points(self) -> pd.DatetimeIndex:
+        """Get change points from the borders of intervals."""
+        if self.intervals is None:
+            raise ValueError("Something went wrong on fit! Check the parameters of the transform.")
+        return pd.DatetimeIndex([right_border for _, right_border in self.intervals[:-1]])
+
+    def _fit_linear_trends(self, series: pd.Series) -> bool:
+        """Fit linear trends of all the intervals at once, return False if it isn't possible.
+
+        Each interval contains its borders as in the fit interval by interval, so the change points belong to both
+        neighbouring intervals. Time is shifted to the beginning of the series to reduce rounding errors.
+        """
+        if self.per_interval_models is None:
+            raise ValueError("Something went wrong on fit! Check the parameters of the transform.")
+        change_points = self._get_change_points()
+        starts = np.concatenate([[0], series.index.searchsorted(change_points, side="left")])
+        stops = np.concatenate([series.index.searchsorted(change_points, side="right"), [len(series)]])
+        lengths = stops - starts
+        if np.any(lengths <= 0):
+            return False
+
+        seconds = self._get_seconds(series.index)
+        shift = seconds[0]
+        # positions of the values of all the intervals one after another
+        interval_ids = np.repeat(np.arange(len(lengths)), lengths)
+        offsets = np.concatenate([[0], np.cumsum(lengths)[:-1]])
+        positions = starts[interval_ids] + np.arange(lengths.sum()) - offsets[interval_ids]
+        x = seconds[positions] - shift
+        y = series.values[positions].astype(float)
+
+        mean_x = np.bincount(interval_ids, weights=x) / lengths
+        mean_y = np.bincount(interval_ids, weights=y) / lengths
+        x_centered = x - mean_x[interval_ids]
+        variance = np.bincount(interval_ids, weights=x_centered**2)
+        covariance = np.bincount(interval_ids, weights=x_centered * (y - mean_y[interval_ids]))
+        slopes = np.divide(covariance, variance, out=np.zeros_like(covariance), where=variance > 0)
+        intercepts = mean_y - slopes * mean_x - slopes * shift
+        self._linear_trends = (intercepts, slopes)
+
+        for interval, intercept, slope in zip(self.intervals, intercepts, slopes):  # type: ignore
+            model = self.per_interval_models[interval]
+            model.coef_ = np.array([slope])
+            model.intercept_ = intercept
+            model.n_features_in_ = 1
+        return True
 
     def _fit_per_interval_model(self, series: pd.Series):
         """Fit per-interval models with corresponding data from series."""
         if self.intervals is None or self.per_interval_models is None:
             raise ValueError("Something went wrong on fit! Check the parameters of the transform.")
+        self._linear_trends = None
+        if self._is_linear_detrend_model() and self._fit_linear_trends(series=series):
+            return
         for interval in self.intervals:
             tmp_series = series[interval[0] : interval[1]]
             x = self._get_timestamps(series=tmp_series)
@@ -90,7 +161,14 @@ class _OneSegmentChangePointsTrendTransform(Transform):
         """Apply per-interval detrending to series."""
         if self.intervals is None or self.per_interval_models is None:
             raise ValueError("Transform is not fitted! Fit the Transform before calling transform method.")
-        trend_series = pd.Series(index=series.index)
+        if self._linear_trends is not None:
+            intercepts, slopes = self._linear_trends
+            # change point belongs to the interval that starts from it
+            interval_ids = self._get_change_points().searchsorted(series.index, side="right")
+            trend = self._get_seconds(series.index) * slopes[interval_ids] + intercepts[interval_ids]
+            return pd.Series(trend, index=series.index)
+
+        trend_series = pd.Series(index=series.index, dtype=float)
         for interval in self.intervals:
             tmp_series = series[interval[0] : interval[1]]
             if tmp_series.empty:
@@ -112,16 +190,25 @@ class _OneSegmentChangePointsTrendTransform(Transform):
         -------
         :
         """
-        series = df.loc[df[self.in_column].first_valid_index() : df[self.in_column].last_valid_index(), self.in_column]
-        if series.isnull().values.any():
-            raise ValueError("The input column contains NaNs in the middle of the series! Try to use the imputer.")
+        series = self._get_series(df=df)
         change_points = _find_change_points_segment(
             series=series, change_point_model=self.change_point_model, **self.change_point_model_predict_params
         )
+        self._fit_with_change_points(series=series, change_points=change_points)
+        return self
+
+    def _get_series(self, df: pd.DataFrame) -> pd.Series:
+        """Get series of ``in_column`` to fit on without NaNs in the beginning and in the end."""
+        series = df.loc[df[self.in_column].first_valid_index() : df[self.in_column].last_valid_index(), self.in_column]
+        if series.isnull().values.any():
+            raise ValueError("The input column contains NaNs in the middle of the series! Try to use the imputer.")
+        return series
+
+    def _fit_with_change_points(self, series: pd.Series, change_points: List[pd.Timestamp]):
+        """Fit detrend models with data from intervals of stable trend between given change points."""
         self.intervals = self._build_trend_intervals(change_points=change_points)
         self.per_interval_models = self._init_detrend_models(intervals=self.intervals)
         self._fit_per_interval_model(series=series)
-        return self
 
     def transform(self, df: pd.DataFrame) -> pd.DataFrame:
         """Split df to intervals of stable trend and subtract trend from each one.
@@ -166,9 +253,53 @@ class _OneSegmentChangePointsTrendTransform(Transform):
         return df
 
 
-class ChangePointsTrendTransform(PerSegmentWrapper):
+class _ChangePointsPerSegmentWrapper(PerSegmentWrapper):
+    """PerSegmentWrapper that finds change points of all the segments at once before fitting segment transforms.
+
+    Change points are found in parallel. If ``cache_change_points`` is set, they are cached by the data of segment
+    and the state of the change point model in the cache of the wrapper, which is shared by its copies.
+    """
+
+    def __init__(
+        self,
+        transform: _OneSegmentChangePointsTrendTransform,
+        n_jobs: int = 1,
+        joblib_params: Optional[Dict[str, Any]] = None,
+        cache_change_points: bool = False,
+    ):
+        super().__init__(transform=transform)
+        self._n_jobs = n_jobs
+        self._joblib_params = joblib_params
+        self._change_points_cache = _ChangePointsCache() if cache_change_points else None
+
+    def fit(self, df: pd.DataFrame) -> "_ChangePointsPerSegmentWrapper":
+        """Find change points of all the segments and fit transform on each segment."""
+        self.segments = df.columns.get_level_values(0).unique()
+        series = {segment: self._base_transform._get_series(df=df[segment]) for segment in self.segments}
+        change_points = _find_change_points_segments(
+            series=series,
+            change_point_model=self._base_transform.change_point_model,
+            n_jobs=self._n_jobs,
+            joblib_params=self._joblib_params,
+            cache=self._change_points_cache,
+            **self._base_transform.change_point_model_predict_params,
+        )
+        for segment in self.segments:
+            self.segment_transforms[segment] = deepcopy(self._base_transform)
+            self.segment_transforms[segment]._fit_with_change_points(
+                series=series[segment], change_points=change_points[segment]
+            )
+        return self
+
+
+class ChangePointsTrendTransform(_ChangePointsPerSegmentWrapper):
     """ChangePointsTrendTransform subtracts multiple linear trend from series.
 
+    Change points of segments can be found in parallel with ``n_jobs``. If ``cache_change_points`` is set,
+    found change points are cached: refit of the transform or its copy in the same process on the identical data
+    with the same model doesn't run ``change_point_model`` again. Folds of backtest are fitted on different data,
+    so they don't reuse the cached change points.
+
     Warning
     -------
     This transform can suffer from look-ahead bias. For transforming data at some timestamp
@@ -180,6 +311,9 @@ class ChangePointsTrendTransform(PerSegmentWrapper):
         in_column: str,
         change_point_model: BaseEstimator,
         detrend_model: TDetrendModel,
+        n_jobs: int = 1,
+        joblib_params: Optional[Dict[str, Any]] = None,
+        cache_change_points: bool = False,
         **change_point_model_predict_params,
     ):
         """Init ChangePointsTrendTransform.
@@ -192,12 +326,21 @@ class ChangePointsTrendTransform(PerSegmentWrapper):
             model to get trend change points
         detrend_model:
             model to get trend in data
+        n_jobs:
+            number of segments to find change points in parallel
+        joblib_params:
+            additional parameters for :py:class:`joblib.Parallel`
+        cache_change_points:
+            if True, change points found on the segments are cached and reused by the fits on the same data
         change_point_model_predict_params:
             params for ``change_point_model.predict`` method
         """
         self.in_column = in_column
         self.change_point_model = change_point_model
         self.detrend_model = detrend_model
+        self.n_jobs = n_jobs
+        self.joblib_params = joblib_params
+        self.cache_change_points = cache_change_points
         self.change_point_model_predict_params = change_point_model_predict_params
         super().__init__(
             transform=_OneSegmentChangePointsTrendTransform(
@@ -205,5 +348,8 @@ class ChangePointsTrendTransform(PerSegmentWrapper):
                 change_point_model=self.change_point_model,
                 detrend_model=self.detrend_model,
                 **self.change_point_model_predict_params,
-            )
+            ),
+            n_jobs=self.n_jobs,
+            joblib_params=self.joblib_params,
+            cache_change_points=self.cache_change_points,
         )
@@ -1,14 +1,18 @@
+from copy import deepcopy
 from typing import Any
 from typing import Dict
 from typing import Optional
 from typing import Union
 
+import numpy as np
 import pandas as pd
+from joblib import Parallel
+from joblib import delayed
 from statsmodels.tsa.arima.model import ARIMA
 from statsmodels.tsa.base.tsa_model import TimeSeriesModel
 from statsmodels.tsa.exponential_smoothing.ets import ETSModel
-from statsmodels.tsa.forecasting.stl import STLForecast
-from statsmodels.tsa.forecasting.stl import STLForecastResults
+from statsmodels.tsa.seasonal import STL
+from statsmodels.tsa.seasonal import DecomposeResult
 
 from etna.transforms.base import PerSegmentWrapper
 from etna.transforms.base import Transform
@@ -24,6 +28,7 @@ class _OneSegmentSTLTransform(Transform):
         robust: bool = False,
         model_kwargs: Optional[Dict[str, Any]] = None,
         stl_kwargs: Optional[Dict[str, Any]] = None,
+        reuse_seasonal: bool = False,
     ):
         """
         Init _OneSegmentSTLTransform.
@@ -49,6 +54,9 @@ class _OneSegmentSTLTransform(Transform):
             parameters for the model like in :py:class:`statsmodels.tsa.seasonal.STLForecast`
         stl_kwargs:
             additional parameters for :py:class:`statsmodels.tsa.seasonal.STLForecast`
+        reuse_seasonal:
+            if True, reuse seasonal component of the previous decomposition when the series extends
+            the decomposed one by less than ``period`` points
         """
         if model_kwargs is None:
             model_kwargs = {}
@@ -77,7 +85,38 @@ class _OneSegmentSTLTransform(Transform):
         self.robust = robust
         self.model_kwargs = model_kwargs
         self.stl_kwargs = stl_kwargs
-        self.fit_results: Optional[STLForecastResults] = None
+        self.reuse_seasonal = reuse_seasonal
+        self._seasonal: Optional[pd.Series] = None
+        self._trend_results: Any = None
+        self._decomposition: Optional[DecomposeResult] = None
+
+    def _forecast_seasonal(self, seasonal: np.ndarray, steps: int) -> np.ndarray:
+        """Get seasonal component of ``steps`` points after the series repeating its last season like STLForecast."""
+        last_season = seasonal[-self.period :]
+        return np.tile(last_season, steps // self.period + 1)[:steps]
+
+    def _get_reused_seasonal(self, series: pd.Series) -> Optional[pd.Series]:
+        """Get seasonal component of series from the previous decomposition if it can be reused.
+
+        Seasonal component can be reused if the series starts with exactly the previously decomposed series
+        and extends it by less than ``period`` points, the seasonal component of new points is the one of the
+        last decomposed season.
+        """
+        if not self.reuse_seasonal or self._decomposition is None:
+            return None
+        observed = self._decomposition.observed
+        n_observed = len(observed)
+        n_new = len(series) - n_observed
+        if not (0 <= n_new < self.period) or n_observed < self.period:
+            return None
+        if not series.index[:n_observed].equals(observed.index) or not np.array_equal(
+            series.values[:n_observed], observed.values
+        ):
+            return None
+
+        seasonal = np.asarray(self._decomposition.seasonal)
+        seasonal = np.concatenate([seasonal, self._forecast_seasonal(seasonal=seasonal, steps=n_new)])
+        return pd.Series(seasonal, index=series.index, name="season")
 
     def fit(self, df: pd.DataFrame) -> "_OneSegmentSTLTransform":
         """
@@ -96,17 +135,40 @@ class _OneSegmentSTLTransform(Transform):
         df = df.loc[df[self.in_column].first_valid_index() : df[self.in_column].last_valid_index()]
         if df[self.in_column].isnull().values.any():
             raise ValueError("The input column contains NaNs in the middle of the series! Try to use the imputer.")
-        model = STLForecast(
-            df[self.in_column],
-            self.model,
-            model_kwargs=self.model_kwargs,
-            period=self.period,
-            robust=self.robust,
-            **self.stl_kwargs,
-        )
-        self.fit_results = model.fit()
+        series = df[self.in_column]
+        seasonal = self._get_reused_seasonal(series=series)
+        if seasonal is None:
+            decomposition = STL(series, period=self.period, robust=self.robust, **self.stl_kwargs).fit()
+            seasonal = decomposition.seasonal
+            deseasonalized = decomposition.trend + decomposition.resid
+            if self.reuse_seasonal:
+                self._decomposition = decomposition
+        else:
+            deseasonalized = series - seasonal
+
+        # trend model is fitted on the series without seasonal component as in STLForecast
+        self._trend_results = self.model(deseasonalized, **self.model_kwargs).fit()
+        self._seasonal = seasonal
         return self
 
+    def _get_season_trend(self, df: pd.DataFrame, seasonal: pd.Series) -> pd.Series:
+        """Get sum of seasonal component and trend predicted by the model on the timestamps of ``df``.
+
+        Seasonal component of the points after the fitted series is its last season repeated like in STLForecast.
+        """
+        trend = self._trend_results.get_prediction(
+            start=df[self.in_column].first_valid_index(), end=df[self.in_column].last_valid_index()
+        ).predicted_mean
+        last_timestamp = seasonal.index[-1]
+        out_of_sample_index = trend.index[trend.index > last_timestamp]
+        if len(out_of_sample_index) > 0:
+            steps = len(pd.date_range(start=last_timestamp, end=out_of_sample_index[-1], freq=trend.index.freq)) - 1
+            seasonal_forecast = self._forecast_seasonal(seasonal=seasonal.values, steps=steps)
+            seasonal = pd.concat(
+                [seasonal, pd.Series(seasonal_forecast[-len(out_of_sample_index) :], index=out_of_sample_index)]
+            )
+        return trend + seasonal.loc[trend.index].values
+
     def transform(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Subtract trend and seasonal component.
@@ -122,12 +184,9 @@ class _OneSegmentSTLTransform(Transform):
             Dataframe with extracted features
         """
         result = df.copy()
-        if self.fit_results is not None:
-            season_trend = self.fit_results.get_prediction(
-                start=df[self.in_column].first_valid_index(), end=df[self.in_column].last_valid_index()
-            ).predicted_mean
-        else:
+        if self._seasonal is None:
             raise ValueError("Transform is not fitted! Fit the Transform before calling transform method.")
+        season_trend = self._get_season_trend(df=df, seasonal=self._seasonal)
         result[self.in_column] -= season_trend
         return result
 
@@ -146,11 +205,9 @@ class _OneSegmentSTLTransform(Transform):
             Dataframe with extracted features
         """
         result = df.copy()
-        if self.fit_results is None:
+        if self._seasonal is None:
             raise ValueError("Transform is not fitted! Fit the Transform before calling inverse_transform method.")
-        season_trend = self.fit_results.get_prediction(
-            start=df[self.in_column].first_valid_index(), end=df[self.in_column].last_valid_index()
-        ).predicted_mean
+        season_trend = self._get_season_trend(df=df, seasonal=self._seasonal)
         result[self.in_column] += season_trend
         if self.in_column == "target":
             quantiles = match_target_quantiles(set(result.columns))
@@ -159,9 +216,53 @@ class _OneSegmentSTLTransform(Transform):
         return result
 
 
-class STLTransform(PerSegmentWrapper):
+def _fit_segment_transform(transform: _OneSegmentSTLTransform, df: pd.DataFrame) -> _OneSegmentSTLTransform:
+    """Fit transform on the segment."""
+    return transform.fit(df)
+
+
+class _STLPerSegmentWrapper(PerSegmentWrapper):
+    """PerSegmentWrapper that fits segment transforms in parallel and keeps their previous decompositions."""
+
+    def __init__(
+        self,
+        transform: _OneSegmentSTLTransform,
+        n_jobs: int = 1,
+        joblib_params: Optional[Dict[str, Any]] = None,
+    ):
+        super().__init__(transform=transform)
+        self._n_jobs = n_jobs
+        self._joblib_params = joblib_params
+
+    def fit(self, df: pd.DataFrame) -> "_STLPerSegmentWrapper":
+        """Fit transform on each segment in parallel."""
+        joblib_params = self._joblib_params
+        if joblib_params is None:
+            joblib_params = dict(verbose=0, backend="multiprocessing", mmap_mode="c")
+
+        self.segments = df.columns.get_level_values(0).unique()
+        transforms = []
+        for segment in self.segments:
+            if self._base_transform.reuse_seasonal and segment in self.segment_transforms:
+                transforms.append(self.segment_transforms[segment])
+            else:
+                transforms.append(deepcopy(self._base_transform))
+        fitted_transforms = Parallel(n_jobs=self._n_jobs, **joblib_params)(
+            delayed(_fit_segment_transform)(transform=transform, df=df[segment])
+            for segment, transform in zip(self.segments, transforms)
+        )
+        self.segment_transforms = dict(zip(self.segments, fitted_transforms))
+        return self
+
+
+class STLTransform(_STLPerSegmentWrapper):
     """Transform that uses :py:class:`statsmodels.tsa.seasonal.STL` to subtract season and trend from the data.
 
+    Segments can be fitted in parallel with ``n_jobs``. With ``reuse_seasonal`` refit of the same transform
+    on the series that starts with exactly the previously decomposed one and extends it by less than ``period``
+    points doesn't run STL again: seasonal component of new points is taken from the last decomposed season
+    and only trend model is fitted. Folds of backtest fit their own copies of the transform, so they don't reuse it.
+
     Warning
     -------
     This transform can suffer from look-ahead bias. For transforming data at some timestamp
@@ -176,6 +277,9 @@ class STLTransform(PerSegmentWrapper):
         robust: bool = False,
         model_kwargs: Optional[Dict[str, Any]] = None,
         stl_kwargs: Optional[Dict[str, Any]] = None,
+        reuse_seasonal: bool = False,
+        n_jobs: int = 1,
+        joblib_params: Optional[Dict[str, Any]] = None,
     ):
         """
         Init STLTransform.
@@ -201,6 +305,13 @@ class STLTransform(PerSegmentWrapper):
             parameters for the model like in :py:class:`statsmodels.tsa.seasonal.STLForecast`
         stl_kwargs:
             additional parameters for :py:class:`statsmodels.tsa.seasonal.STLForecast`
+        reuse_seasonal:
+            if True, reuse seasonal component of the previous decomposition when the series extends
+            the decomposed one by less than ``period`` points
+        n_jobs:
+            number of segments to fit in parallel
+        joblib_params:
+            additional parameters for :py:class:`joblib.Parallel`
         """
         self.in_column = in_column
         self.period = period
@@ -208,6 +319,9 @@ class STLTransform(PerSegmentWrapper):
         self.robust = robust
         self.model_kwargs = model_kwargs
         self.stl_kwargs = stl_kwargs
+        self.reuse_seasonal = reuse_seasonal
+        self.n_jobs = n_jobs
+        self.joblib_params = joblib_params
         super().__init__(
             transform=_OneSegmentSTLTransform(
                 in_column=self.in_column,
@@ -216,5 +330,8 @@ class STLTransform(PerSegmentWrapper):
                 robust=self.robust,
                 model_kwargs=self.model_kwargs,
                 stl_kwargs=self.stl_kwargs,
-            )
+                reuse_seasonal=self.reuse_seasonal,
+            ),
+            n_jobs=self.n_jobs,
+            joblib_params=self.joblib_params,
         )
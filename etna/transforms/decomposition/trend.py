@@ -6,9 +6,9 @@ from ruptures.base import BaseCost
 from sklearn.linear_model import LinearRegression
 
 from etna.transforms.base import FutureMixin
-from etna.transforms.base import PerSegmentWrapper
 from etna.transforms.decomposition.change_points_trend import BaseEstimator
 from etna.transforms.decomposition.change_points_trend import TDetrendModel
+from etna.transforms.decomposition.change_points_trend import _ChangePointsPerSegmentWrapper
 from etna.transforms.decomposition.change_points_trend import _OneSegmentChangePointsTrendTransform
 
 
@@ -81,7 +81,7 @@ class _OneSegmentTrendTransform(_OneSegmentChangePointsTrendTransform):
         return df
 
 
-class _TrendTransform(PerSegmentWrapper):
+class _TrendTransform(_ChangePointsPerSegmentWrapper):
     """_TrendTransform adds trend as a feature. Creates column '<in_column>_trend'."""
 
     def __init__(
@@ -1,11 +1,10 @@
 from enum import Enum
+from typing import List
 from typing import Optional
 
 import numpy as np
 import pandas as pd
 from sklearn import preprocessing
-from sklearn.utils._encode import _check_unknown
-from sklearn.utils._encode import _encode
 
 from etna.datasets import TSDataset
 from etna.transforms.base import Transform
@@ -21,18 +20,20 @@ class ImputerMode(str, Enum):
 
 class _LabelEncoder(preprocessing.LabelEncoder):
     def transform(self, y: pd.Series, strategy: str):
-        diff = _check_unknown(y, known_values=self.classes_)
-
-        index = np.where(np.isin(y, diff))[0]
-
-        encoded = _encode(y, uniques=self.classes_, check_unknown=False).astype(float)
+        classes = pd.Index(self.classes_)
+        known_classes = classes.notna()
+        # values are encoded by codes of categorical with fitted classes, unknown values get code -1
+        encoded = pd.Categorical(y, categories=classes[known_classes]).codes.astype(float)
+        if not known_classes.all():
+            encoded[pd.isna(y)] = np.flatnonzero(~known_classes)[0]
+        index = encoded == -1
 
         if strategy == ImputerMode.none:
             filling_value = None
         elif strategy == ImputerMode.new_value:
             filling_value = -1
         elif strategy == ImputerMode.mean:
-            filling_value = np.mean(encoded[~np.isin(y, diff)])
+            filling_value = np.mean(encoded[~index])
         else:
             raise ValueError(f"The strategy '{strategy}' doesn't exist")
 
@@ -40,6 +41,17 @@ class _LabelEncoder(preprocessing.LabelEncoder):
         return encoded
 
 
+def _to_categorical_columns(df: pd.DataFrame, features: List[str]) -> pd.DataFrame:
+    """Convert columns of each feature to categorical with the same categories for all the segments."""
+    dtypes = {}
+    for feature in features:
+        columns = df.loc[:, pd.IndexSlice[:, feature]].columns
+        categories = pd.unique(df[columns].values.ravel()).astype(float)
+        dtype = pd.CategoricalDtype(np.sort(categories[~np.isnan(categories)]))
+        dtypes.update({column: dtype for column in columns})
+    return df.astype(dtypes)
+
+
 class LabelEncoderTransform(Transform):
     """Encode categorical feature with value between 0 and n_classes-1."""
 
@@ -100,10 +112,13 @@ class LabelEncoderTransform(Transform):
             Dataframe with column with encoded values
         """
         out_column = self._get_column_name()
-        result_df = TSDataset.to_flatten(df)
-        result_df[out_column] = self.le.transform(result_df[self.in_column], self.strategy)
-        result_df[out_column] = result_df[out_column].astype("category")
-        result_df = TSDataset.to_dataset(result_df)
+        segments = sorted(set(df.columns.get_level_values("segment")))
+        x = df.loc[:, pd.IndexSlice[segments, self.in_column]].values
+        encoded = self.le.transform(x.ravel(), self.strategy).reshape(x.shape)
+        encoded_df = pd.DataFrame(encoded, index=df.index, columns=pd.MultiIndex.from_product([segments, [out_column]]))
+        encoded_df = _to_categorical_columns(encoded_df, features=[out_column])
+        result_df = pd.concat([df, encoded_df], axis=1)
+        result_df = result_df.sort_index(axis=1)
         return result_df
 
     def _get_column_name(self) -> str:
@@ -118,9 +133,13 @@ class OneHotEncoderTransform(Transform):
 
     If unknown category is encountered during transform, the resulting one-hot
     encoded columns for this feature will be all zeros.
+
+    In sparse mode the encoded columns are numeric columns of :py:class:`pandas.SparseDtype` instead of categorical
+    ones, so high-cardinality features don't take memory for zeros. Sklearn and CatBoost models use them
+    without converting to dense.
     """
 
-    def __init__(self, in_column: str, out_column: Optional[str] = None):
+    def __init__(self, in_column: str, out_column: Optional[str] = None, sparse: bool = False):
         """
         Init OneHotEncoderTransform.
 
@@ -129,11 +148,14 @@ class OneHotEncoderTransform(Transform):
         in_column:
             Name of column to be encoded
         out_column:
-            Prefix of names of added columns. If not given, use ``self.__repr__()``
+            Prefix of names of added columns. If not given, use ``self.__repr__()`` without ``sparse`` parameter
+        sparse:
+            If True, encoded columns are stored as sparse numeric columns
         """
         self.in_column = in_column
         self.out_column = out_column
-        self.ohe = preprocessing.OneHotEncoder(handle_unknown="ignore", sparse=False)
+        self.sparse = sparse
+        self.ohe = preprocessing.OneHotEncoder(handle_unknown="ignore", sparse=sparse)
 
     def fit(self, df: pd.DataFrame) -> "OneHotEncoderTransform":
         """
@@ -168,15 +190,37 @@ class OneHotEncoderTransform(Transform):
         """
         out_column = self._get_column_name()
         out_columns = [out_column + "_" + str(i) for i in range(len(self.ohe.categories_[0]))]
-        result_df = TSDataset.to_flatten(df)
-        x = result_df[self.in_column].values.reshape(-1, 1)
-        result_df[out_columns] = self.ohe.transform(X=x)
-        result_df[out_columns] = result_df[out_columns].astype("category")
-        result_df = TSDataset.to_dataset(result_df)
+        segments = sorted(set(df.columns.get_level_values("segment")))
+        x = df.loc[:, pd.IndexSlice[segments, self.in_column]].values
+        # values are encoded segment by segment, so rows of each segment form a contiguous block
+        encoded = self.ohe.transform(X=x.T.reshape(-1, 1))
+        n_timestamps = len(df)
+
+        if self.sparse:
+            encoded = encoded.tocsr()
+            encoded_dfs = []
+            for i, segment in enumerate(segments):
+                segment_encoded = encoded[i * n_timestamps : (i + 1) * n_timestamps]
+                encoded_dfs.append(
+                    pd.DataFrame.sparse.from_spmatrix(
+                        segment_encoded, index=df.index, columns=pd.MultiIndex.from_product([[segment], out_columns])
+                    )
+                )
+            encoded_df = pd.concat(encoded_dfs, axis=1)
+        else:
+            encoded = encoded.reshape(len(segments), n_timestamps, -1).transpose(1, 0, 2).reshape(n_timestamps, -1)
+            encoded_df = pd.DataFrame(
+                encoded, index=df.index, columns=pd.MultiIndex.from_product([segments, out_columns])
+            )
+            encoded_df = _to_categorical_columns(encoded_df, features=out_columns)
+
+        result_df = pd.concat([df, encoded_df], axis=1)
+        result_df = result_df.sort_index(axis=1)
         return result_df
 
     def _get_column_name(self) -> str:
         """Get the ``out_column`` depending on the transform's parameters."""
         if self.out_column:
             return self.out_column
-        return self.__repr__()
+        # ``sparse`` doesn't take part in the name, so the names are the same as before it was added
+        return self._get_repr(exclude=["sparse"])
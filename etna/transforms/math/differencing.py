@@ -1,8 +1,6 @@
 from typing import Dict
 from typing import List
 from typing import Optional
-from typing import Set
-from typing import Union
 
 import numpy as np
 import pandas as pd
@@ -11,6 +9,30 @@ from etna.transforms.base import Transform
 from etna.transforms.utils import match_target_quantiles
 
 
+def _get_values(df: pd.DataFrame, segments: List[str], column: str) -> np.ndarray:
+    """Get values of column for given segments as array with shape (n_timestamps, n_segments)."""
+    return df.loc[:, pd.MultiIndex.from_product([segments, [column]])].values.astype(float)
+
+
+def _set_values(
+    df: pd.DataFrame, segments: List[str], columns_values: Dict[str, np.ndarray], inplace: bool
+) -> pd.DataFrame:
+    """Set values of columns for given segments: replace the columns if ``inplace`` or add them otherwise."""
+    if inplace:
+        result_df = df.copy()
+        for column, values in columns_values.items():
+            columns = pd.MultiIndex.from_product([segments, [column]])
+            result_df.loc[:, columns] = pd.DataFrame(values, index=df.index, columns=columns)
+    else:
+        new_features = [
+            pd.DataFrame(values, index=df.index, columns=pd.MultiIndex.from_product([segments, [column]]))
+            for column, values in columns_values.items()
+        ]
+        result_df = pd.concat([df] + new_features, axis=1)
+        result_df = result_df.sort_index(axis=1)
+    return result_df
+
+
 class _SingleDifferencingTransform(Transform):
     """Calculate a time series differences of order 1.
 
@@ -64,8 +86,10 @@ class _SingleDifferencingTransform(Transform):
         self.out_column = out_column
 
         self._train_timestamp: Optional[pd.DatetimeIndex] = None
-        self._train_init_dict: Optional[Dict[str, pd.Series]] = None
-        self._test_init_df: Optional[pd.DataFrame] = None
+        self._train_segments: Optional[pd.Index] = None
+        self._train_init_positions: Optional[np.ndarray] = None
+        self._train_init_values: Optional[np.ndarray] = None
+        self._test_init_values: Optional[np.ndarray] = None
 
     def _get_column_name(self) -> str:
         if self.out_column is None:
@@ -73,6 +97,35 @@ class _SingleDifferencingTransform(Transform):
         else:
             return self.out_column
 
+    def _check_is_fitted(self):
+        if self._train_timestamp is None or self._train_init_values is None or self._test_init_values is None:
+            raise AttributeError("Transform is not fitted")
+
+    def _fit(self, values: np.ndarray, timestamp: pd.DatetimeIndex, segments: List[str]):
+        """Fit the transform on values of segments with shape (n_timestamps, n_segments)."""
+        is_valid = ~np.isnan(values)
+        # segments without valid values start at zero and fail the check
+        start_positions = is_valid.argmax(axis=0)
+        if np.any(~is_valid & (np.arange(values.shape[0])[:, np.newaxis] >= start_positions)):
+            raise ValueError(f"There should be no NaNs inside the segments")
+
+        init_positions = start_positions + np.arange(self.period)[:, np.newaxis]
+        init_values = np.full(init_positions.shape, np.nan)
+        is_init_inside = init_positions < values.shape[0]
+        init_values[is_init_inside] = values[init_positions[is_init_inside], np.nonzero(is_init_inside)[1]]
+
+        self._train_timestamp = timestamp
+        self._train_segments = pd.Index(segments)
+        self._train_init_positions = start_positions
+        self._train_init_values = init_values
+        self._test_init_values = values[-self.period :]
+
+    def _diff(self, values: np.ndarray) -> np.ndarray:
+        """Make a differentiation of values with shape (n_timestamps, n_segments)."""
+        result = np.full(values.shape, np.nan)
+        result[self.period :] = values[self.period :] - values[: -self.period]
+        return result
+
     def fit(self, df: pd.DataFrame) -> "_SingleDifferencingTransform":
         """Fit the transform.
 
@@ -86,21 +139,7 @@ class _SingleDifferencingTransform(Transform):
         result: _SingleDifferencingTransform
         """
         segments = sorted(set(df.columns.get_level_values("segment")))
-        fit_df = df.loc[:, pd.IndexSlice[segments, self.in_column]].copy()
-
-        self._train_timestamp = fit_df.index
-        self._train_init_dict = {}
-        for current_segment in segments:
-            cur_series = fit_df.loc[:, pd.IndexSlice[current_segment, self.in_column]]
-            cur_series = cur_series.loc[cur_series.first_valid_index() :]
-
-            if cur_series.isna().sum() > 0:
-                raise ValueError(f"There should be no NaNs inside the segments")
-
-            self._train_init_dict[current_segment] = cur_series[: self.period]
-        self._test_init_df = fit_df.iloc[-self.period :, :]
-        # make multiindex levels consistent
-        self._test_init_df.columns = self._test_init_df.columns.remove_unused_levels()
+        self._fit(values=_get_values(df, segments, self.in_column), timestamp=df.index, segments=segments)
         return self
 
     def transform(self, df: pd.DataFrame) -> pd.DataFrame:
@@ -116,85 +155,80 @@ class _SingleDifferencingTransform(Transform):
         result: pd.Dataframe
             transformed dataframe
         """
-        if self._train_init_dict is None or self._test_init_df is None or self._train_timestamp is None:
-            raise AttributeError("Transform is not fitted")
-
+        self._check_is_fitted()
         segments = sorted(set(df.columns.get_level_values("segment")))
-        transformed = df.loc[:, pd.IndexSlice[segments, self.in_column]].copy()
-        for current_segment in segments:
-            to_transform = transformed.loc[:, pd.IndexSlice[current_segment, self.in_column]]
-            start_idx = to_transform.first_valid_index()
-            # make a differentiation
-            transformed.loc[start_idx:, pd.IndexSlice[current_segment, self.in_column]] = to_transform.loc[
-                start_idx:
-            ].diff(periods=self.period)
-
-        if self.inplace:
-            result_df = df.copy()
-            result_df.loc[:, pd.IndexSlice[segments, self.in_column]] = transformed
-        else:
-            transformed_features = pd.DataFrame(
-                transformed, columns=df.loc[:, pd.IndexSlice[segments, self.in_column]].columns, index=df.index
-            )
-            column_name = self._get_column_name()
-            transformed_features.columns = pd.MultiIndex.from_product([segments, [column_name]])
-            result_df = pd.concat((df, transformed_features), axis=1)
-            result_df = result_df.sort_index(axis=1)
-
-        return result_df
-
-    def _make_inv_diff(self, to_transform: Union[pd.DataFrame, pd.Series]) -> Union[pd.DataFrame, pd.Series]:
-        """Make inverse difference transform."""
-        for i in range(self.period):
-            to_transform.iloc[i :: self.period] = to_transform.iloc[i :: self.period].cumsum()
-        return to_transform
-
-    def _reconstruct_train(self, df: pd.DataFrame, columns_to_inverse: Set[str]) -> pd.DataFrame:
+        transformed = self._diff(_get_values(df, segments, self.in_column))
+        column = self.in_column if self.inplace else self._get_column_name()
+        return _set_values(df, segments, {column: transformed}, inplace=self.inplace)
+
+    def _make_inv_diff(self, values: np.ndarray) -> np.ndarray:
+        """Make inverse difference transform: cumulative sum over each of ``period`` strides skipping NaNs."""
+        n_timestamps = values.shape[0]
+        n_strides = -(-n_timestamps // self.period)
+        strided = np.full((n_strides * self.period, values.shape[1]), np.nan)
+        strided[:n_timestamps] = values
+        strided = strided.reshape(n_strides, self.period, values.shape[1])
+        result = np.nancumsum(strided, axis=0)
+        result[np.isnan(strided)] = np.nan
+        return result.reshape(-1, values.shape[1])[:n_timestamps]
+
+    def _get_segments_idx(self, segments: List[str]) -> np.ndarray:
+        """Get indices of segments in fitted state, fail on segments unseen in fit."""
+        segments_idx = self._train_segments.get_indexer(segments)  # type: ignore
+        if np.any(segments_idx == -1):
+            unknown_segments = [segment for segment, idx in zip(segments, segments_idx) if idx == -1]
+            raise ValueError(f"Segments {unknown_segments} were not seen during fit")
+        return segments_idx
+
+    def _reconstruct_train(self, values: np.ndarray, segments: List[str]) -> np.ndarray:
         """Reconstruct the train in ``inverse_transform``."""
-        segments = sorted(set(df.columns.get_level_values("segment")))
-        result_df = df.copy()
+        segments_idx = self._get_segments_idx(segments)
+        init_positions = self._train_init_positions[segments_idx] + np.arange(self.period)[:, np.newaxis]  # type: ignore
+        init_values = self._train_init_values[:, segments_idx]  # type: ignore
+        is_init_inside = init_positions < values.shape[0]
 
         # impute values for reconstruction and run reconstruction
-        for current_segment in segments:
-            init_segment = self._train_init_dict[current_segment]  # type: ignore
-            for column in columns_to_inverse:
-                cur_series = result_df.loc[:, pd.IndexSlice[current_segment, column]]
-                cur_series[init_segment.index] = init_segment.values
-                cur_series = self._make_inv_diff(cur_series)
-                result_df.loc[cur_series.index, pd.IndexSlice[current_segment, column]] = cur_series
-        return result_df
-
-    def _reconstruct_test(self, df: pd.DataFrame, columns_to_inverse: Set[str]) -> pd.DataFrame:
-        """Reconstruct the test in ``inverse_transform``."""
-        segments = sorted(set(df.columns.get_level_values("segment")))
-        result_df = df.copy()
+        result = values.copy()
+        result[init_positions[is_init_inside], np.nonzero(is_init_inside)[1]] = init_values[is_init_inside]
+        return self._make_inv_diff(result)
 
+    def _reconstruct_test(self, values: np.ndarray, timestamp: pd.DatetimeIndex, segments: List[str]) -> np.ndarray:
+        """Reconstruct the test in ``inverse_transform``."""
         # check that test is right after the train
         expected_min_test_timestamp = pd.date_range(
-            start=self._test_init_df.index.max(),  # type: ignore
+            start=self._train_timestamp.max(),  # type: ignore
             periods=2,
             freq=pd.infer_freq(self._train_timestamp),
             closed="right",
         )[0]
-        if expected_min_test_timestamp != df.index.min():
+        if expected_min_test_timestamp != timestamp.min():
             raise ValueError("Test should go after the train without gaps")
 
         # we can reconstruct the values by concatenating saved fit values before test values
-        for column in columns_to_inverse:
-            to_transform = df.loc[:, pd.IndexSlice[segments, column]].copy()
-            init_df = self._test_init_df.copy()  # type: ignore
-            init_df.columns.set_levels([column], level="feature", inplace=True)
-            to_transform = pd.concat([init_df, to_transform])
+        init_values = self._test_init_values[:, self._get_segments_idx(segments)]  # type: ignore
+        to_transform = np.concatenate([init_values, values])
 
-            # validate values inside the series to transform
-            if to_transform.isna().sum().sum() > 0:
-                raise ValueError(f"There should be no NaNs inside the segments")
+        # validate values inside the series to transform
+        if np.isnan(to_transform).any():
+            raise ValueError(f"There should be no NaNs inside the segments")
 
-            # run reconstruction and save the result
-            to_transform = self._make_inv_diff(to_transform)
-            result_df.loc[:, pd.IndexSlice[segments, column]] = to_transform
+        return self._make_inv_diff(to_transform)[init_values.shape[0] :]
 
-        return result_df
+    def _inverse_diff(self, values: np.ndarray, timestamp: pd.DatetimeIndex, segments: List[str]) -> np.ndarray:
+        """Make inverse differentiation of train or test values with shape (n_timestamps, n_segments)."""
+        # determine if we are working with train or test
+        if self._train_timestamp.shape[0] == timestamp.shape[0] and np.all(  # type: ignore
+            self._train_timestamp == timestamp
+        ):
+            # we are on the train
+            return self._reconstruct_train(values, segments)
+
+        elif timestamp.min() > self._train_timestamp.max():  # type: ignore
+            # we are on the test
+            return self._reconstruct_test(values, timestamp, segments)
+
+        else:
+            raise ValueError("Inverse transform can be applied only to full train or test that should be in the future")
 
     def inverse_transform(self, df: pd.DataFrame) -> pd.DataFrame:
         """Apply inverse transformation to DataFrame.
@@ -209,8 +243,7 @@ class _SingleDifferencingTransform(Transform):
         result: pd.DataFrame
             transformed DataFrame.
         """
-        if self._train_init_dict is None or self._test_init_df is None or self._train_timestamp is None:
-            raise AttributeError("Transform is not fitted")
+        self._check_is_fitted()
 
         if not self.inplace:
             return df
@@ -221,19 +254,12 @@ class _SingleDifferencingTransform(Transform):
         if self.in_column == "target":
             columns_to_inverse.update(match_target_quantiles(set(df.columns.get_level_values("feature"))))
 
-        # determine if we are working with train or test
-        if self._train_timestamp.shape[0] == df.index.shape[0] and np.all(self._train_timestamp == df.index):
-            # we are on the train
-            result_df = self._reconstruct_train(df, columns_to_inverse)
-
-        elif df.index.min() > self._train_timestamp.max():
-            # we are on the test
-            result_df = self._reconstruct_test(df, columns_to_inverse)
-
-        else:
-            raise ValueError("Inverse transform can be applied only to full train or test that should be in the future")
-
-        return result_df
+        segments = sorted(set(df.columns.get_level_values("segment")))
+        columns_values = {
+            column: self._inverse_diff(_get_values(df, segments, column), df.index, segments)
+            for column in columns_to_inverse
+        }
+        return _set_values(df, segments, columns_values, inplace=True)
 
 
 class DifferencingTransform(Transform):
@@ -332,10 +358,12 @@ class DifferencingTransform(Transform):
         -------
         result: DifferencingTransform
         """
-        # this is made because transforms of high order may need some columns created by transforms of lower order
-        result_df = df.copy()
+        # transforms of high order are fitted on the differences made by transforms of lower order
+        segments = sorted(set(df.columns.get_level_values("segment")))
+        values = _get_values(df, segments, self.in_column)
         for transform in self._differencing_transforms:
-            result_df = transform.fit_transform(result_df)
+            transform._fit(values=values, timestamp=df.index, segments=segments)
+            values = transform._diff(values)
         return self
 
     def transform(self, df: pd.DataFrame) -> pd.DataFrame:
@@ -351,10 +379,12 @@ class DifferencingTransform(Transform):
         result: pd.Dataframe
             transformed dataframe
         """
-        result_df = df.copy()
+        segments = sorted(set(df.columns.get_level_values("segment")))
+        values = _get_values(df, segments, self.in_column)
         for transform in self._differencing_transforms:
-            result_df = transform.transform(result_df)
-        return result_df
+            transform._check_is_fitted()
+            values = transform._diff(values)
+        return _set_values(df, segments, {self._get_column_name(): values}, inplace=self.inplace)
 
     def inverse_transform(self, df: pd.DataFrame) -> pd.DataFrame:
         """Apply inverse transformation to DataFrame.
@@ -372,7 +402,20 @@ class DifferencingTransform(Transform):
         if not self.inplace:
             return df
 
-        result_df = df.copy()
-        for transform in self._differencing_transforms[::-1]:
-            result_df = transform.inverse_transform(result_df)
-        return result_df
+        for transform in self._differencing_transforms:
+            transform._check_is_fitted()
+
+        columns_to_inverse = {self.in_column}
+
+        # if we are working with in_column="target" then there can be quantiles to inverse too
+        if self.in_column == "target":
+            columns_to_inverse.update(match_target_quantiles(set(df.columns.get_level_values("feature"))))
+
+        segments = sorted(set(df.columns.get_level_values("segment")))
+        columns_values = {}
+        for column in columns_to_inverse:
+            values = _get_values(df, segments, column)
+            for transform in self._differencing_transforms[::-1]:
+                values = transform._inverse_diff(values, df.index, segments)
+            columns_values[column] = values
+        return _set_values(df, segments, columns_values, inplace=True)
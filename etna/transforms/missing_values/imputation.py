@@ -2,6 +2,7 @@ from enum import Enum
 from typing import List
 from typing import Optional
 
+import numba
 import numpy as np
 import pandas as pd
 
@@ -9,16 +10,35 @@ from etna.transforms.base import PerSegmentWrapper
 from etna.transforms.base import Transform
 
 
-class ImputerMode(str, Enum, num=0):
+class ImputerMode(str, Enum):
     """Enum for different imputation strategy."""
 
+    zero = "zero"
     constant = "constant"
-    constant_dict = {constant": num}
     mean = "mean"
     running_mean = "running_mean"
     forward_fill = "forward_fill"
     seasonal = "seasonal"
-    constant = "constant"
+
+
+@numba.njit(parallel=True)
+def _fill_seasonal_mean(values: np.ndarray, positions: np.ndarray, offsets: np.ndarray, seasonality: int, history: int):
+    """Fill values of series at given positions inplace with the mean of ``history`` previous values of the season.
+
+    Values are filled one by one in the order of positions, so filled values are used to fill the next ones.
+    ``values`` has shape (n_series, n_timestamps), ``j``-th series is filled at ``positions[offsets[j]:offsets[j + 1]]``.
+    """
+    for j in numba.prange(values.shape[0]):
+        for k in range(offsets[j], offsets[j + 1]):
+            i = positions[k]
+            total, count = 0.0, 0
+            idx = i - seasonality
+            while idx >= 0 and idx > i - seasonality - history:
+                if not np.isnan(values[j, idx]):
+                    total += values[j, idx]
+                    count += 1
+                idx -= seasonality
+            values[j, i] = total / count if count > 0 else np.nan
 
 
 class _OneSegmentTimeSeriesImputerTransform(Transform):
@@ -32,7 +52,15 @@ class _OneSegmentTimeSeriesImputerTransform(Transform):
 
     """
 
-    def __init__(self, in_column: str, strategy: str, window: int, seasonality: int, default_value: Optional[float], value:int=0):
+    def __init__(
+        self,
+        in_column: str,
+        strategy: str,
+        window: int,
+        seasonality: int,
+        default_value: Optional[float],
+        value: float = 0,
+    ):
         """
         Create instance of _OneSegmentTimeSeriesImputerTransform.
 
@@ -43,7 +71,9 @@ class _OneSegmentTimeSeriesImputerTransform(Transform):
         strategy:
             filling value in missing timestamps:
 
-            - If "constant", then replace missing dates with a constant
+            - If "zero", then replace missing dates with zeros
+
+            - If "constant", then replace missing dates with ``value``
 
             - If "mean", then replace missing dates using the mean in fit stage.
 
@@ -64,6 +94,8 @@ class _OneSegmentTimeSeriesImputerTransform(Transform):
             the length of the seasonality
         default_value:
             value which will be used to impute the NaNs left after applying the imputer with the chosen strategy
+        value:
+            value to fill gaps with in "constant" strategy
 
         Raises
         ------
@@ -75,7 +107,8 @@ class _OneSegmentTimeSeriesImputerTransform(Transform):
         self.window = window
         self.seasonality = seasonality
         self.default_value = default_value
-        self.fill_value: Optional[int] = None
+        self.value = value
+        self.fill_value: Optional[float] = None
         self.nan_timestamps: Optional[List[pd.Timestamp]] = None
 
     def fit(self, df: pd.DataFrame) -> "_OneSegmentTimeSeriesImputerTransform":
@@ -97,8 +130,10 @@ class _OneSegmentTimeSeriesImputerTransform(Transform):
             raise ValueError("Series hasn't non NaN values which means it is empty and can't be filled.")
         series = raw_series[raw_series.first_valid_index() :]
         self.nan_timestamps = series[series.isna()].index
-        if self.strategy == ImputerMode.constant:
-            self.fill_value = ImputerMode.constant_dict[ImputerMode.constant]
+        if self.strategy == ImputerMode.zero:
+            self.fill_value = 0
+        elif self.strategy == ImputerMode.constant:
+            self.fill_value = self.value
         elif self.strategy == ImputerMode.mean:
             self.fill_value = series.mean()
         return self
@@ -147,6 +182,15 @@ class _OneSegmentTimeSeriesImputerTransform(Transform):
         result_df.loc[index, self.in_column] = np.nan
         return result_df
 
+    def _get_nan_positions(self, index: pd.Index) -> np.ndarray:
+        """Get positions of fitted NaN timestamps in the index."""
+        positions = index.get_indexer(self.nan_timestamps)
+        return positions[positions >= 0].astype(np.int64)
+
+    def _get_history(self, n_timestamps: int) -> int:
+        """Get the number of previous timestamps to take the mean over in "running_mean" and "seasonal" strategies."""
+        return self.seasonality * self.window if self.window != -1 else n_timestamps
+
     def _fill(self, df: pd.Series) -> pd.Series:
         """
         Create new Series taking all previous dates and adding missing dates.
@@ -165,18 +209,17 @@ class _OneSegmentTimeSeriesImputerTransform(Transform):
         if self.nan_timestamps is None:
             raise ValueError("Trying to apply the unfitted transform! First fit the transform.")
 
-        if self.strategy == ImputerMode.constant or self.strategy == ImputerMode.mean:
+        if self.strategy in (ImputerMode.zero, ImputerMode.constant, ImputerMode.mean):
             df = df.fillna(value=self.fill_value)
         elif self.strategy == ImputerMode.forward_fill:
             df = df.fillna(method="ffill")
         elif self.strategy == ImputerMode.running_mean or self.strategy == ImputerMode.seasonal:
-            history = self.seasonality * self.window if self.window != -1 else len(df)
-            timestamps = list(df.index)
-            for timestamp in self.nan_timestamps:
-                i = timestamps.index(timestamp)
-                indexes = np.arange(i - self.seasonality, i - self.seasonality - history, -self.seasonality)
-                indexes = indexes[indexes >= 0]
-                df.iloc[i] = np.nanmean(df.iloc[indexes])
+            positions = self._get_nan_positions(df.index)
+            values = df.values.astype(float).reshape(1, -1)
+            _fill_seasonal_mean(
+                values, positions, np.array([0, len(positions)]), self.seasonality, self._get_history(len(df))
+            )
+            df = pd.Series(values[0], index=df.index, name=df.name)
 
         if self.default_value:
             df = df.fillna(value=self.default_value)
@@ -196,6 +239,11 @@ class TimeSeriesImputerTransform(PerSegmentWrapper):
     -------
     This transform can suffer from look-ahead bias in 'mean' mode. For transforming data at some timestamp
     it uses information from the whole train part.
+
+    Notes
+    -----
+    In "running_mean" and "seasonal" strategies all the segments are filled at once by compiled code,
+    the number of threads is controlled by ``NUMBA_NUM_THREADS``.
     """
 
     def __init__(
@@ -205,7 +253,7 @@ class TimeSeriesImputerTransform(PerSegmentWrapper):
         window: int = -1,
         seasonality: int = 1,
         default_value: Optional[float] = None,
-        value:int = 0
+        value: float = 0,
     ):
         """
         Create instance of TimeSeriesImputerTransform.
@@ -217,7 +265,9 @@ class TimeSeriesImputerTransform(PerSegmentWrapper):
         strategy:
             filling value in missing timestamps:
 
-            - If "constant", then replace missing dates with constants
+            - If "zero", then replace missing dates with zeros
+
+            - If "constant", then replace missing dates with ``value``
 
             - If "mean", then replace missing dates using the mean in fit stage.
 
@@ -239,7 +289,7 @@ class TimeSeriesImputerTransform(PerSegmentWrapper):
         default_value:
             value which will be used to impute the NaNs left after applying the imputer with the chosen strategy
         value:
-            value
+            value to fill gaps with in "constant" strategy
 
         Raises
         ------
@@ -251,6 +301,7 @@ class TimeSeriesImputerTransform(PerSegmentWrapper):
         self.window = window
         self.seasonality = seasonality
         self.default_value = default_value
+        self.value = value
         super().__init__(
             transform=_OneSegmentTimeSeriesImputerTransform(
                 in_column=self.in_column,
@@ -258,8 +309,40 @@ class TimeSeriesImputerTransform(PerSegmentWrapper):
                 window=self.window,
                 seasonality=self.seasonality,
                 default_value=self.default_value,
+                value=self.value,
             )
         )
 
+    def transform(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Fill gaps in each segment, gaps of all the segments are filled at once in mean-based strategies."""
+        if self._base_transform.strategy not in (ImputerMode.running_mean, ImputerMode.seasonal):
+            return super().transform(df)
+
+        segments = list(self.segment_transforms.keys())
+        result_df = df.loc[:, pd.IndexSlice[segments, :]].copy()
+        values = np.ascontiguousarray(result_df.loc[:, pd.IndexSlice[segments, self.in_column]].values.T, dtype=float)
+        cur_nans = np.isnan(values)
+
+        nan_positions = [self.segment_transforms[segment]._get_nan_positions(df.index) for segment in segments]
+        offsets = np.zeros(len(segments) + 1, dtype=np.int64)
+        offsets[1:] = np.cumsum([len(positions) for positions in nan_positions])
+        positions = np.concatenate(nan_positions) if len(nan_positions) > 0 else np.empty(0, dtype=np.int64)
+        history = self._base_transform._get_history(len(df))
+        _fill_seasonal_mean(values, positions, offsets, self.seasonality, history)
+
+        if self.default_value:
+            values[np.isnan(values)] = self.default_value
+        # restore nans not in nan_timestamps of segments
+        to_fill = np.zeros_like(cur_nans)
+        for j, segment_positions in enumerate(nan_positions):
+            to_fill[j, segment_positions] = True
+        values[cur_nans & ~to_fill] = np.nan
+
+        for j, segment in enumerate(segments):
+            result_df[(segment, self.in_column)] = values[j]
+        result_df = result_df.sort_index(axis=1)
+        result_df.columns.names = ["segment", "feature"]
+        return result_df
+
 
 __all__ = ["TimeSeriesImputerTransform"]
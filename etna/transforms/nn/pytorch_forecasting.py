@@ -5,6 +5,7 @@ from typing import Optional
 from typing import Tuple
 from typing import Union
 
+import numpy as np
 import pandas as pd
 from sklearn.preprocessing import RobustScaler
 from sklearn.preprocessing import StandardScaler
@@ -90,6 +91,7 @@ class PytorchForecastingTransform(Transform):
         self.lags = lags if lags else {}
         self.scalers = scalers if scalers else {}
         self.pf_dataset_predict: Optional[TimeSeriesDataSet] = None
+        self._pf_dataset_fit: Optional[TimeSeriesDataSet] = None
 
     def fit(self, df: pd.DataFrame) -> "PytorchForecastingTransform":
         """
@@ -117,9 +119,7 @@ class PytorchForecastingTransform(Transform):
         # making time_idx feature.
         # it's needed for pytorch-forecasting for proper train-test split.
         # it should be incremented by 1 for every new timestamp.
-        df_flat["time_idx"] = (df_flat["timestamp"] - self.min_timestamp) // pd.Timedelta("1s")
-        encoded_unix_times = self._time_encoder(list(df_flat.time_idx.unique()))
-        df_flat["time_idx"] = df_flat["time_idx"].apply(lambda x: encoded_unix_times[x])
+        df_flat["time_idx"] = self._encode_time_idx(df_flat["timestamp"])
 
         pf_dataset = TimeSeriesDataSet(
             df_flat,
@@ -149,8 +149,38 @@ class PytorchForecastingTransform(Transform):
 
         self.pf_dataset_params = pf_dataset.get_parameters()
 
+        # dataset built on fit can be used for training if there are no missing values after the first timestamp,
+        # otherwise transform fills them and gets the different data
+        n_segments = len(ts.segments)
+        if len(df_flat) == (df.index >= self.min_timestamp).sum() * n_segments:
+            self._pf_dataset_fit = pf_dataset
+        else:
+            self._pf_dataset_fit = None
+
         return self
 
+    def fit_transform(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Fit TimeSeriesDataSet and transform raw df to it.
+
+        Dataset built during fit is reused for training if possible instead of building it one more time.
+
+        Parameters
+        ----------
+        df:
+            data to be fitted and transformed.
+
+        Returns
+        -------
+            DataFrame
+        """
+        self.fit(df)
+        if self._pf_dataset_fit is not None:
+            self.pf_dataset_train = self._pf_dataset_fit
+            self._pf_dataset_fit = None
+            return df
+        return self.transform(df)
+
     def transform(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Transform raw df to TimeSeriesDataSet.
@@ -168,21 +198,29 @@ class PytorchForecastingTransform(Transform):
         -----
         We save TimeSeriesDataSet in instance to use it in the model.
         It`s not right pattern of using Transforms and TSDataset.
+
+        Dataset for prediction is built only on the last timestamps that are used as encoder and decoder windows,
+        categorical encoders and normalizers fitted on training data are reused.
         """
-        ts = TSDataset(df, self.freq)
+        is_predict = inspect.stack()[1].function == "make_future"
+        df_context = df[df.index >= self.min_timestamp]
+        time_idx = self._encode_time_idx(df_context.index)
+        if is_predict:
+            context_length = self.max_encoder_length + self.max_prediction_length + self._get_max_lag()
+            df_context = df_context.iloc[max(len(df_context) - context_length, 0) :]
+            time_idx = time_idx[-len(df_context) :]
+
+        ts = TSDataset(df_context, self.freq)
         df_flat = ts.to_pandas(flatten=True)
-        df_flat = df_flat[df_flat.timestamp >= self.min_timestamp]
         df_flat["target"] = df_flat["target"].fillna(0)
-
-        df_flat["time_idx"] = (df_flat["timestamp"] - self.min_timestamp) // pd.Timedelta("1s")
-        encoded_unix_times = self._time_encoder(list(df_flat.time_idx.unique()))
-        df_flat["time_idx"] = df_flat["time_idx"].apply(lambda x: encoded_unix_times[x])
+        # flattened dataframe is sorted by segment and timestamp
+        df_flat["time_idx"] = np.tile(time_idx, len(ts.segments))
 
         if self.time_varying_known_categoricals:
             for feature_name in self.time_varying_known_categoricals:
                 df_flat[feature_name] = df_flat[feature_name].astype(str)
 
-        if inspect.stack()[1].function == "make_future":
+        if is_predict:
             pf_dataset_predict = TimeSeriesDataSet.from_parameters(
                 self.pf_dataset_params, df_flat, predict=True, stop_randomization=True
             )
@@ -192,8 +230,12 @@ class PytorchForecastingTransform(Transform):
             self.pf_dataset_train = pf_dataset_train
         return df
 
-    def _time_encoder(self, values: List[int]) -> Dict[int, int]:
-        encoded_unix_times = dict()
-        for idx, value in enumerate(sorted(values)):
-            encoded_unix_times[value] = idx
-        return encoded_unix_times
+    def _get_max_lag(self) -> int:
+        """Get the largest lag used by the dataset."""
+        return max((max(lags) for lags in self.lags.values() if len(lags) > 0), default=0)
+
+    @staticmethod
+    def _encode_time_idx(timestamps: Union[pd.Series, pd.Index]) -> np.ndarray:
+        """Encode timestamps by indices of the sorted unique timestamps."""
+        _, time_idx = np.unique(np.asarray(timestamps), return_inverse=True)
+        return time_idx
@@ -1,5 +1,7 @@
+from copy import deepcopy
 from typing import Dict
 from typing import List
+from unittest.mock import patch
 
 import numpy as np
 import pandas as pd
@@ -7,6 +9,9 @@ import pytest
 from ruptures import Binseg
 
 from etna.analysis import find_change_points
+from etna.analysis.change_points_trend.search import _ChangePointsCache
+from etna.analysis.change_points_trend.search import _detect_change_points
+from etna.analysis.change_points_trend.search import _find_change_points_segments
 from etna.datasets import TSDataset
 
 
@@ -45,3 +50,82 @@ def test_find_change_points_nans_tail(multitrend_df: pd.DataFrame, n_bkps: int):
     ts = TSDataset(df=multitrend_df, freq="D")
     change_points = find_change_points(ts=ts, in_column="target", change_point_model=Binseg(), n_bkps=n_bkps)
     check_change_points(change_points, segments=ts.segments, num_points=n_bkps)
+
+
+def test_find_change_points_parallel(multitrend_df: pd.DataFrame):
+    """Test that parallel search gives the same change points as sequential one."""
+    ts = TSDataset(df=multitrend_df, freq="D")
+    change_points = find_change_points(ts=ts, in_column="target", change_point_model=Binseg(), n_bkps=5)
+    change_points_parallel = find_change_points(
+        ts=ts, in_column="target", change_point_model=Binseg(), n_bkps=5, n_jobs=2
+    )
+    assert change_points_parallel == change_points
+
+
+@pytest.fixture
+def multitrend_series(multitrend_df: pd.DataFrame) -> Dict[str, pd.Series]:
+    ts = TSDataset(df=multitrend_df, freq="D")
+    return {segment: ts[:, segment, "target"] for segment in ts.segments}
+
+
+def test_find_change_points_not_cached_by_default(multitrend_series: Dict[str, pd.Series]):
+    """Test that search without cache runs the model every time."""
+    with patch(
+        "etna.analysis.change_points_trend.search._detect_change_points", wraps=_detect_change_points
+    ) as detect_change_points:
+        change_points = _find_change_points_segments(series=multitrend_series, change_point_model=Binseg(), n_bkps=5)
+        assert (
+            _find_change_points_segments(series=multitrend_series, change_point_model=Binseg(), n_bkps=5)
+            == change_points
+        )
+        assert detect_change_points.call_count == 2 * len(multitrend_series)
+
+
+def test_find_change_points_cache(multitrend_series: Dict[str, pd.Series]):
+    """Test that repeated search on the same data reuses change points and search with other params doesn't."""
+    cache = _ChangePointsCache()
+    change_points = _find_change_points_segments(
+        series=multitrend_series, change_point_model=Binseg(), cache=cache, n_bkps=5
+    )
+    assert len(cache) == len(multitrend_series)
+    with patch(
+        "etna.analysis.change_points_trend.search._detect_change_points", wraps=_detect_change_points
+    ) as detect_change_points:
+        assert (
+            _find_change_points_segments(series=multitrend_series, change_point_model=Binseg(), cache=cache, n_bkps=5)
+            == change_points
+        )
+        detect_change_points.assert_not_called()
+
+        _ = _find_change_points_segments(series=multitrend_series, change_point_model=Binseg(), cache=cache, n_bkps=3)
+        _ = _find_change_points_segments(
+            series=multitrend_series, change_point_model=Binseg(jump=10), cache=cache, n_bkps=5
+        )
+        assert detect_change_points.call_count == 2 * len(multitrend_series)
+
+
+def test_find_change_points_cache_detects_changed_model_state(multitrend_series: Dict[str, pd.Series]):
+    """Test that change of the model state not passed to its ``__init__`` gives another key in cache."""
+    cache = _ChangePointsCache()
+    model = Binseg()
+    _ = _find_change_points_segments(series=multitrend_series, change_point_model=model, cache=cache, n_bkps=5)
+    model.cost.min_size = 10
+    with patch(
+        "etna.analysis.change_points_trend.search._detect_change_points", wraps=_detect_change_points
+    ) as detect_change_points:
+        _ = _find_change_points_segments(series=multitrend_series, change_point_model=model, cache=cache, n_bkps=5)
+        assert detect_change_points.call_count == len(multitrend_series)
+
+
+def test_change_points_cache_lru():
+    """Test that cache drops the least recently used change points and is shared by its copies."""
+    cache = _ChangePointsCache(max_size=2)
+    for key in ["a", "b"]:
+        cache.set(key, [pd.Timestamp("2020-01-01")])
+    _ = cache.get("a")
+    cache.set("c", [])
+    assert cache.get("b") is None
+    assert cache.get("a") == [pd.Timestamp("2020-01-01")]
+    assert deepcopy(cache) is cache
+    cache.clear()
+    assert len(cache) == 0
@@ -1,10 +1,14 @@
 import numpy as np
 import pandas as pd
 import pytest
+from statsmodels.tsa.stattools import acf
+from statsmodels.tsa.stattools import pacf
 
 from etna.analysis.eda_utils import _cross_correlation
 from etna.analysis.eda_utils import _resample
 from etna.analysis.eda_utils import _seasonal_split
+from etna.analysis.eda_utils import get_acf
+from etna.analysis.eda_utils import get_pacf
 from etna.analysis.eda_utils import seasonal_plot
 from etna.datasets import TSDataset
 
@@ -107,6 +111,31 @@ def test_cross_corr_with_full_nans(a, b, normed, expected_result):
     np.testing.assert_almost_equal(result, expected_result)
 
 
+@pytest.mark.parametrize("lags", [1, 10, 50])
+def test_get_acf_same_as_statsmodels(ts_with_different_series_length, lags):
+    """Check that autocorrelations are the same as computed for each segment without NaNs by statsmodels."""
+    result = get_acf(ts=ts_with_different_series_length, lags=lags)
+    assert result.index.tolist() == list(range(lags + 1))
+    assert result.columns.tolist() == sorted(ts_with_different_series_length.segments)
+    for segment in result.columns:
+        values = ts_with_different_series_length[:, segment, "target"].dropna().values
+        np.testing.assert_allclose(result[segment].values, acf(values, nlags=lags, fft=False), atol=1e-10)
+
+
+@pytest.mark.parametrize("lags", [1, 10, 50])
+def test_get_pacf_same_as_statsmodels(ts_with_different_series_length, lags):
+    """Check that partial autocorrelations are the same as computed for each segment without NaNs by statsmodels."""
+    result = get_pacf(ts=ts_with_different_series_length, lags=lags, segments=["segment_1"])
+    assert result.columns.tolist() == ["segment_1"]
+    values = ts_with_different_series_length[:, "segment_1", "target"].dropna().values
+    np.testing.assert_allclose(result["segment_1"].values, pacf(values, nlags=lags, method="ldb"), atol=1e-10)
+
+
+def test_get_acf_fail_lags(example_tsds):
+    with pytest.raises(ValueError, match="Parameter lags should be >= 1"):
+        _ = get_acf(ts=example_tsds, lags=0)
+
+
 @pytest.mark.parametrize(
     "timestamp, cycle, expected_cycle_names, expected_in_cycle_nums, expected_in_cycle_names",
     [
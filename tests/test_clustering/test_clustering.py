@@ -106,3 +106,52 @@ def test_get_centroids_raise_error_when_clustering_is_not_fitted(clustering: Hie
     """Test that HierarchicalClustering raise error when calling get_centroids without being fit."""
     with pytest.raises(ValueError, match="HierarchicalClustering is not fitted!"):
         _ = clustering.get_centroids()
+
+
+def test_dtw_clustering_with_window(eucl_ts: TSDataset):
+    """Check that DTWClustering passes window to the distance and clusters the series."""
+    clustering = DTWClustering(window=3)
+    assert clustering.distance.window == 3
+    clustering.build_distance_matrix(ts=eucl_ts)
+    clustering.build_clustering_algo(n_clusters=4)
+    segment2clusters = clustering.fit_predict()
+    assert len(set(segment2clusters.values())) == 4
+
+
+@pytest.mark.parametrize("clustering", (EuclideanClustering(), DTWClustering()))
+def test_predict_same_clusters_for_train_segments(eucl_ts: TSDataset, clustering: HierarchicalClustering):
+    """Check that predict assigns train segments to the same clusters as fit_predict in case of separated clusters."""
+    clustering.build_distance_matrix(ts=eucl_ts)
+    clustering.build_clustering_algo(n_clusters=7)
+    segment2cluster = clustering.fit_predict()
+    assert clustering.predict(ts=eucl_ts) == segment2cluster
+
+
+def test_predict_new_segments(eucl_ts: TSDataset):
+    """Check that predict assigns new segments to the clusters with the same mean."""
+    clustering = EuclideanClustering()
+    clustering.build_distance_matrix(ts=eucl_ts)
+    clustering.build_clustering_algo(n_clusters=7)
+    segment2cluster = clustering.fit_predict()
+
+    df = eucl_ts.to_pandas()
+    new_df = df.loc[:, pd.IndexSlice[["10", "61"], "target"]] + 0.05
+    new_df.columns = pd.MultiIndex.from_product([["new_1", "new_6"], ["target"]], names=["segment", "feature"])
+    new_segment2cluster = clustering.predict(ts=TSDataset(df=new_df, freq="D"))
+    assert new_segment2cluster == {"new_1": segment2cluster["10"], "new_6": segment2cluster["61"]}
+
+
+@pytest.mark.parametrize("clustering", (EuclideanClustering(), DTWClustering()))
+def test_fit_predict_with_sample_size(eucl_ts: TSDataset, clustering: HierarchicalClustering):
+    """Check that clustering on the sample of segments assigns all the segments to clusters."""
+    clustering.build_distance_matrix(ts=eucl_ts, sample_size=14, random_state=0)
+    assert len(clustering.distance_matrix.segment2idx) == 14
+    clustering.build_clustering_algo(n_clusters=3)
+    segment2cluster = clustering.fit_predict()
+    assert list(segment2cluster.keys()) == eucl_ts.segments
+    assert len(clustering.clusters) == len(eucl_ts.segments)
+    assert set(segment2cluster.values()) == set(clustering.medoids.keys())
+    for cluster, medoid in clustering.medoids.items():
+        assert segment2cluster[medoid] == cluster
+    centroids = clustering.get_centroids()
+    assert len(centroids.columns.get_level_values("cluster").unique()) == 3
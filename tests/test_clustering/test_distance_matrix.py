@@ -1,3 +1,5 @@
+from unittest.mock import patch
+
 import numpy as np
 import pandas as pd
 import pytest
@@ -69,3 +71,91 @@ def test_distance_matrix_fails_on_predict_without_fit():
     dm = DistanceMatrix(distance=EuclideanDistance())
     with pytest.raises(ValueError, match="DistanceMatrix is not fitted!"):
         _ = dm.predict()
+
+
+@pytest.fixture
+def ragged_ts() -> TSDataset:
+    """Generate dataframe with series of different lengths and gaps."""
+    rng = np.random.default_rng(0)
+    dfs = []
+    for i in range(6):
+        tmp = pd.DataFrame({"timestamp": pd.date_range(f"2020-01-0{i + 1}", periods=20 + i)})
+        tmp["segment"] = f"segment_{i}"
+        tmp["target"] = rng.normal(size=len(tmp))
+        dfs.append(tmp)
+    df = TSDataset.to_dataset(pd.concat(dfs, ignore_index=True))
+    df.iloc[10, 0] = np.NaN
+    ts = TSDataset(df=df, freq="D")
+    return ts
+
+
+@pytest.mark.parametrize(
+    "distance",
+    (
+        EuclideanDistance(),
+        DTWDistance(),
+        DTWDistance(trim_series=True),
+    ),
+)
+def test_condensed_matrix_same_as_pairwise(ragged_ts: TSDataset, distance):
+    """Check that distances computed at once are the same as ones computed pair by pair."""
+    dm = DistanceMatrix(distance=distance)
+    with pytest.warns(UserWarning, match="Timeseries contains NaN values"):
+        matrix = dm.fit_predict(ts=ragged_ts)
+
+    assert dm.condensed_matrix.shape == (15,)
+    expected = np.array([[distance(x1, x2) for x2 in dm.series] for x1 in dm.series])
+    np.testing.assert_allclose(matrix, expected)
+
+
+def test_different_length_euclidean_without_compiled_code(ragged_ts: TSDataset):
+    """Check that euclidean distances between series of different lengths aren't computed at once without trimming."""
+    distance = EuclideanDistance(trim_series=False)
+    dm = DistanceMatrix(distance=distance)
+    packed_series = dm._pack_series(ts=ragged_ts, series=dm._get_series(ragged_ts))
+    assert distance._compute_condensed_matrix(*packed_series) is None
+
+
+@pytest.fixture
+def aligned_ts() -> TSDataset:
+    """Generate dataframe with series with the same timestamps."""
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(
+        rng.normal(loc=100, size=(50, 11)),
+        index=pd.date_range("2020-01-01", periods=50),
+        columns=pd.MultiIndex.from_product([[f"segment_{i}" for i in range(11)], ["target"]]),
+    )
+    df.index.name = "timestamp"
+    df.columns.names = ["segment", "feature"]
+    return TSDataset(df=df, freq="D")
+
+
+@pytest.mark.parametrize("chunk_size", (None, 1, 3, 10, 100))
+@pytest.mark.parametrize("trim_series", (True, False))
+def test_aligned_euclidean_matrix(aligned_ts: TSDataset, chunk_size, trim_series):
+    """Check that euclidean matrix of aligned series computed with matrix multiplication is correct."""
+    distance = EuclideanDistance(trim_series=trim_series)
+    dm = DistanceMatrix(distance=distance, chunk_size=chunk_size)
+    with patch.object(EuclideanDistance, "_compute_condensed_matrix") as compute_condensed_matrix:
+        matrix = dm.fit_predict(ts=aligned_ts)
+    compute_condensed_matrix.assert_not_called()
+
+    assert dm.condensed_matrix.shape == (55,)
+    expected = np.array([[distance(x1, x2) for x2 in dm.series] for x1 in dm.series])
+    np.testing.assert_allclose(matrix, expected, atol=1e-8)
+
+
+def test_get_aligned_values(ragged_ts: TSDataset, aligned_ts: TSDataset):
+    dm = DistanceMatrix(distance=EuclideanDistance())
+    packed_series = dm._pack_series(ts=aligned_ts, series=dm._get_series(aligned_ts))
+    assert dm._get_aligned_values(*packed_series, trim_series=True).shape == (11, 50)
+
+    packed_series = dm._pack_series(ts=ragged_ts, series=dm._get_series(ragged_ts))
+    assert dm._get_aligned_values(*packed_series, trim_series=False) is None
+
+    # series of the same length with different timestamps are aligned only without trimming
+    values = np.arange(6, dtype=float)
+    positions = np.array([0, 1, 2, 1, 2, 3])
+    offsets = np.array([0, 3, 6])
+    assert dm._get_aligned_values(values, positions, offsets, trim_series=True) is None
+    assert dm._get_aligned_values(values, positions, offsets, trim_series=False).shape == (2, 3)
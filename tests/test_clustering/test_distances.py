@@ -5,9 +5,17 @@ import numpy as np
 import pandas as pd
 import pytest
 
+from etna.clustering.distances.base import Distance
 from etna.clustering.distances.dtw_distance import DTWDistance
+from etna.clustering.distances.dtw_distance import _dtw_distance
+from etna.clustering.distances.dtw_distance import _get_envelope
+from etna.clustering.distances.dtw_distance import _get_window
+from etna.clustering.distances.dtw_distance import _lb_keogh
+from etna.clustering.distances.dtw_distance import _lb_kim
 from etna.clustering.distances.dtw_distance import simple_dist
 from etna.clustering.distances.euclidean_distance import EuclideanDistance
+from etna.clustering.distances.paa import paa
+from etna.clustering.distances.paa import paa_distance
 from etna.datasets import TSDataset
 
 
@@ -145,3 +153,182 @@ def test_dtw_get_average(dtw_ts: TSDataset):
         tmp = dtw_ts[:, segment, :][segment].dropna()
         for p in percentiles:
             assert abs(np.percentile(centroid["target"].values, p) - np.percentile(tmp["target"].values, p)) < 0.3
+
+
+@pytest.mark.parametrize("window", (None, 0, 2, 5))
+@pytest.mark.parametrize("x1_size, x2_size", ((10, 10), (10, 13), (13, 10)))
+def test_dtw_window(window, x1_size, x2_size):
+    """Check that dtw-distance with window is the last cell of the matrix and not less than without window."""
+    rng = np.random.default_rng(0)
+    x1, x2 = rng.normal(size=x1_size), rng.normal(size=x2_size)
+    dtw = DTWDistance(window=window)
+    d = dtw(pd.Series(x1), pd.Series(x2))
+    matrix = dtw._build_matrix(x1, x2, points_distance=simple_dist, window=-1 if window is None else window)
+    assert d == pytest.approx(matrix[-1][-1])
+    assert d >= DTWDistance()(pd.Series(x1), pd.Series(x2)) - 1e-10
+
+
+def test_dtw_zero_window_is_manhattan():
+    """Check that dtw-distance with zero window for the series of the same length is manhattan distance."""
+    rng = np.random.default_rng(0)
+    x1, x2 = rng.normal(size=20), rng.normal(size=20)
+    assert DTWDistance(window=0)(pd.Series(x1), pd.Series(x2)) == pytest.approx(np.abs(x1 - x2).sum())
+
+
+@pytest.mark.parametrize("window", (None, 3))
+def test_dtw_lower_bounds(window):
+    """Check that LB_Kim and LB_Keogh don't exceed dtw-distance."""
+    rng = np.random.default_rng(0)
+    for _ in range(20):
+        x1, x2 = rng.normal(size=15).cumsum(), rng.normal(size=15).cumsum()
+        window_width = _get_window(len(x1), len(x2), -1 if window is None else window)
+        distance = _dtw_distance(x1, x2, simple_dist, window_width)
+        lower, upper = _get_envelope(x2, window_width)
+        assert _lb_kim(x1, x2, simple_dist) <= distance + 1e-10
+        assert _lb_keogh(x1, lower, upper) <= distance + 1e-10
+
+
+def test_dtw_early_abandoning():
+    """Check that dtw-distance computation is abandoned if the distance is greater than max_distance."""
+    x1, x2 = np.zeros(10), np.ones(10)
+    assert _dtw_distance(x1, x2, simple_dist, -1, 5.0) == np.inf
+    assert _dtw_distance(x1, x2, simple_dist, -1, 10.0) == 10
+
+
+@pytest.mark.parametrize("window", (None, 3))
+def test_dtw_get_nearest(window):
+    """Check that nearest series found with lower bounds is the same as found by brute force."""
+    rng = np.random.default_rng(0)
+    candidates = [pd.Series(rng.normal(size=rng.integers(15, 20)).cumsum()) for _ in range(30)]
+    dtw = DTWDistance(window=window)
+    for _ in range(10):
+        x = pd.Series(rng.normal(size=17).cumsum())
+        idx, distance = dtw._get_nearest(x, candidates)
+        distances = [dtw(x, candidate) for candidate in candidates]
+        assert idx == np.argmin(distances)
+        assert distance == pytest.approx(np.min(distances))
+
+
+@pytest.mark.parametrize("window", (0, 1, 3, 20, 50))
+def test_get_envelope(window):
+    """Check that streaming envelopes are the same as min and max over the band."""
+    x = np.random.default_rng(0).normal(size=30)
+    lower, upper = _get_envelope(x, window)
+    expected_lower = [np.min(x[max(0, i - window) : i + window + 1]) for i in range(len(x))]
+    expected_upper = [np.max(x[max(0, i - window) : i + window + 1]) for i in range(len(x))]
+    np.testing.assert_array_equal(lower, expected_lower)
+    np.testing.assert_array_equal(upper, expected_upper)
+
+
+@pytest.mark.parametrize("window", (None, 3))
+def test_dtw_get_nearest_many(window):
+    """Check that the nearest series search for many series gives the same result as the search for each of them."""
+    rng = np.random.default_rng(0)
+    candidates = [pd.Series(rng.normal(size=rng.integers(15, 20)).cumsum()) for _ in range(30)]
+    xs = [pd.Series(rng.normal(size=17).cumsum()) for _ in range(10)]
+    dtw = DTWDistance(window=window)
+    nearest = dtw._get_nearest_many(xs, candidates)
+    for x, (idx, distance) in zip(xs, nearest):
+        distances = [dtw(x, candidate) for candidate in candidates]
+        assert idx == np.argmin(distances)
+        assert distance == pytest.approx(np.min(distances))
+
+
+@pytest.mark.parametrize("window", (None, 4))
+def test_dba_iteration(window):
+    """Check that compiled DBA iteration matches the values of series according to warping paths."""
+    rng = np.random.default_rng(0)
+    centroid = rng.normal(size=20).cumsum()
+    series_list = [rng.normal(size=rng.integers(15, 25)).cumsum() for _ in range(7)]
+    dtw = DTWDistance(window=window)
+
+    assoc_table, n_samples = centroid.copy(), np.ones(len(centroid))
+    for series in series_list:
+        matrix = dtw._build_matrix(centroid, series, points_distance=simple_dist, window=dtw._window)
+        for i, j in dtw._get_path(matrix=matrix):
+            if i and j:
+                assoc_table[i] += series[j]
+                n_samples[i] += 1
+    expected = assoc_table / n_samples
+
+    np.testing.assert_allclose(dtw._dba_iteration(initial_centroid=centroid, series_list=series_list), expected)
+
+
+def test_dtw_get_average_tolerance(dtw_ts: TSDataset):
+    """Check that DBA stops as soon as centroid converges."""
+    dtw = DTWDistance()
+    centroid = dtw.get_average(dtw_ts, n_iters=100, tolerance=1e-8)
+    expected = dtw.get_average(dtw_ts, n_iters=100)
+    np.testing.assert_allclose(centroid["target"], expected["target"], atol=1e-6)
+
+
+@pytest.mark.parametrize(
+    "x, n_frames, expected",
+    (
+        (np.arange(8), 4, np.array([0.5, 2.5, 4.5, 6.5])),
+        (np.arange(7), 3, np.array([0.5, 2.5, 5])),
+        (np.arange(5), 5, np.arange(5)),
+        (np.array([[0, 2, 4, 6], [1, 1, 3, 3]]), 2, np.array([[1, 5], [1, 3]])),
+    ),
+)
+def test_paa(x: np.ndarray, n_frames: int, expected: np.ndarray):
+    np.testing.assert_allclose(paa(x, n_frames=n_frames), expected)
+
+
+@pytest.mark.parametrize("n_frames", (0, 11))
+def test_paa_fails_with_wrong_n_frames(n_frames: int):
+    with pytest.raises(ValueError, match="Number of frames should be positive"):
+        _ = paa(np.arange(10), n_frames=n_frames)
+
+
+@pytest.mark.parametrize("series_length, n_frames", ((16, 4), (23, 5), (10, 10)))
+def test_paa_distance_lower_bound(series_length: int, n_frames: int):
+    """Check that distance between PAA lower bounds euclidean distance and they are equal for PAA of series itself."""
+    rng = np.random.default_rng(0)
+    x = rng.normal(size=(50, series_length))
+    y = rng.normal(size=series_length)
+    lower_bounds = paa_distance(paa(x, n_frames=n_frames), paa(y, n_frames=n_frames), series_length=series_length)
+    distances = np.sqrt(np.sum((x - y) ** 2, axis=1))
+    assert np.all(lower_bounds <= distances + 1e-12)
+    if n_frames == series_length:
+        np.testing.assert_allclose(lower_bounds, distances)
+
+
+@pytest.mark.parametrize("trim_series", (True, False))
+def test_euclidean_get_nearest(trim_series: bool):
+    """Check that pruned nearest series search gives the same result as the brute force one."""
+    rng = np.random.default_rng(0)
+    index = pd.date_range("2020-01-01", periods=100)
+    candidates = [pd.Series(rng.normal(i % 7, 1, size=100), index=index) for i in range(30)]
+    distance = EuclideanDistance(trim_series=trim_series)
+    for mean in range(7):
+        x = pd.Series(rng.normal(mean, 1, size=100), index=index)
+        expected_distances = [distance(x, candidate) for candidate in candidates]
+        idx, nearest_distance = distance._get_nearest(x, candidates)
+        assert idx == np.argmin(expected_distances)
+        assert nearest_distance == pytest.approx(np.min(expected_distances))
+
+
+@pytest.mark.parametrize("trim_series", (True, False))
+def test_euclidean_get_nearest_many(trim_series: bool):
+    """Check that the nearest series search for many series gives the same result as the search for each of them."""
+    rng = np.random.default_rng(0)
+    index = pd.date_range("2020-01-01", periods=100)
+    candidates = [pd.Series(rng.normal(i % 7, 1, size=100), index=index) for i in range(30)]
+    xs = [pd.Series(rng.normal(mean, 1, size=100), index=index) for mean in range(7)]
+    if trim_series:
+        # series that isn't aligned with the candidates is compared on the common timestamps
+        xs.append(xs[0].iloc[10:60])
+    distance = EuclideanDistance(trim_series=trim_series)
+    nearest = distance._get_nearest_many(xs, candidates)
+    for x, (idx, nearest_distance) in zip(xs, nearest):
+        expected_idx, expected_distance = Distance._get_nearest(distance, x, candidates)
+        assert idx == expected_idx
+        assert nearest_distance == pytest.approx(expected_distance)
+
+
+def test_euclidean_get_nearest_not_aligned(two_series: Tuple[pd.Series, pd.Series]):
+    x1, x2 = two_series
+    idx, nearest_distance = EuclideanDistance()._get_nearest(x1, [x1 + 1, x2])
+    assert idx == 1
+    assert nearest_distance == pytest.approx(EuclideanDistance()(x1, x2))
@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 
 from etna.datasets import TSDataset
@@ -70,3 +71,32 @@ def test_using_not_presented_quantiles(metric, tsdataset_with_zero_width_quantil
     ts_train, ts_test = tsdataset_with_zero_width_quantiles
     with pytest.raises(AssertionError, match="Quantile .* is not presented in tsdataset."):
         _ = metric(ts_train, ts_test)
+
+
+@pytest.mark.parametrize("metric", [Coverage(quantiles=(0.1, 0.9)), Width(quantiles=(0.1, 0.9))])
+def test_interval_metrics_all_segments_at_once(metric, example_df):
+    """Check that interval metrics computed for all the segments at once are equal to ones computed per segment."""
+    rng = np.random.default_rng(0)
+    ts_true = TSDataset(TSDataset.to_dataset(example_df), freq="H")
+    example_df["target_0.1"] = example_df["target"] + rng.normal(-1, 1, size=len(example_df))
+    example_df["target_0.9"] = example_df["target"] + rng.normal(1, 1, size=len(example_df))
+    ts_pred = TSDataset(TSDataset.to_dataset(example_df), freq="H")
+
+    segments = sorted(ts_true.segments)
+    values = metric._compute_all_segments(y_true=ts_true, y_pred=ts_pred, segments=segments)
+    expected_values = [metric._compute_segment(y_true=ts_true, y_pred=ts_pred, segment=segment) for segment in segments]
+    np.testing.assert_allclose(values, expected_values)
+    assert metric(y_true=ts_true, y_pred=ts_pred) == dict(zip(segments, values))
+
+
+def test_width_metric_skips_nan_quantiles(example_df):
+    """Check that Width skips NaNs in quantiles like the computation per segment does."""
+    ts_true = TSDataset(TSDataset.to_dataset(example_df), freq="H")
+    example_df["target_0.1"] = example_df["target"] - 1
+    example_df["target_0.9"] = example_df["target"] + 1
+    example_df.loc[example_df.index[:2], "target_0.9"] = np.nan
+    ts_pred = TSDataset(TSDataset.to_dataset(example_df), freq="H")
+
+    metric_values = Width(quantiles=(0.1, 0.9))(y_true=ts_true, y_pred=ts_pred)
+
+    assert metric_values == dict.fromkeys(ts_true.segments, 2.0)
@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -11,6 +12,14 @@ from etna.metrics import r2_score
 from etna.metrics import sign
 from etna.metrics import smape
 from etna.metrics.base import MetricAggregationMode
+from etna.metrics.functional_metrics import _mae_per_column
+from etna.metrics.functional_metrics import _mape_per_column
+from etna.metrics.functional_metrics import _medae_per_column
+from etna.metrics.functional_metrics import _mse_per_column
+from etna.metrics.functional_metrics import _msle_per_column
+from etna.metrics.functional_metrics import _r2_score_per_column
+from etna.metrics.functional_metrics import _sign_per_column
+from etna.metrics.functional_metrics import _smape_per_column
 from etna.metrics.metrics import MAE
 from etna.metrics.metrics import MAPE
 from etna.metrics.metrics import MSE
@@ -216,3 +225,44 @@ def test_multiple_calls():
     assert sorted(metric_value_2.keys()) == ["B", "C"]
     assert metric_value_2["C"] == 1
     assert metric_value_2["B"] == 0
+
+
+@pytest.mark.parametrize(
+    "metric_fn, metric_fn_per_column",
+    (
+        (mae, _mae_per_column),
+        (mse, _mse_per_column),
+        (medae, _medae_per_column),
+        (msle, _msle_per_column),
+        (mape, _mape_per_column),
+        (smape, _smape_per_column),
+        (r2_score, _r2_score_per_column),
+        (sign, _sign_per_column),
+    ),
+)
+def test_metrics_per_column(metric_fn, metric_fn_per_column):
+    """Check that metrics computed for all the columns at once are equal to the metrics computed for each column."""
+    rng = np.random.default_rng(0)
+    y_true = rng.uniform(0, 10, size=(20, 4))
+    y_pred = rng.uniform(0, 10, size=(20, 4))
+    y_true[:, 0] = 5
+    y_pred[:, 1] = y_true[:, 1]
+    values = metric_fn_per_column(y_true, y_pred)
+    expected_values = [metric_fn(y_true=y_true[:, i], y_pred=y_pred[:, i]) for i in range(y_true.shape[1])]
+    np.testing.assert_allclose(values, expected_values)
+
+
+@pytest.mark.parametrize(
+    "metric, expected_vectorized",
+    ((MAPE(eps=1e-3), True), (SMAPE(eps=1e-3), True), (MAE(), True), (MAE(sample_weight=None), False)),
+)
+def test_metrics_vectorized_with_kwargs(metric, expected_vectorized, train_test_dfs):
+    """Check that metrics are computed at once only if they support the given kwargs and give the same values."""
+    forecast_df, true_df = train_test_dfs
+    assert (metric._metric_fn_per_column is not None) == expected_vectorized
+    metric_values = metric(y_pred=forecast_df, y_true=true_df)
+    for segment, value in metric_values.items():
+        true_metric_value = metric.metric_fn(
+            y_true=true_df[:, segment, "target"], y_pred=forecast_df[:, segment, "target"], **metric.kwargs
+        )
+        assert value == pytest.approx(true_metric_value)
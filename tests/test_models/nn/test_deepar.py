@@ -1,5 +1,9 @@
+from unittest.mock import patch
+
+import numpy as np
 import pandas as pd
 import pytest
+import torch
 from pytorch_forecasting.data import GroupNormalizer
 
 from etna.datasets.tsdataset import TSDataset
@@ -174,3 +178,59 @@ def test_prediction_interval_run_infuture(example_tsds):
         assert (segment_slice["target_0.975"] - segment_slice["target_0.025"] >= 0).all()
         assert (segment_slice["target"] - segment_slice["target_0.025"] >= 0).all()
         assert (segment_slice["target_0.975"] - segment_slice["target"] >= 0).all()
+
+
+def test_prediction_interval_single_predict_pass(example_tsds):
+    horizon = 10
+    transform = PytorchForecastingTransform(
+        max_encoder_length=horizon,
+        max_prediction_length=horizon,
+        time_varying_known_reals=["time_idx"],
+        time_varying_unknown_reals=["target"],
+        target_normalizer=GroupNormalizer(groups=["segment"]),
+    )
+    example_tsds.fit_transform([transform])
+    model = DeepARModel(
+        max_epochs=1, learning_rate=[0.01], gpus=0, batch_size=64, predict_batch_size=2, predict_num_threads=1
+    )
+    model.fit(example_tsds)
+    future = example_tsds.make_future(horizon)
+    num_threads = torch.get_num_threads()
+    with patch.object(model.model, "predict", wraps=model.model.predict) as predict:
+        forecast = model.forecast(future, prediction_interval=True, quantiles=[0.025, 0.975])
+    assert predict.call_count == 1
+    assert torch.get_num_threads() == num_threads
+    assert not forecast[:, :, "target"].isnull().values.any()
+
+
+def test_forecast_same_as_deepar_predict(weekly_period_df):
+    """Check that point forecast and quantiles derived from the raw output are the same as from DeepAR.predict."""
+    horizon = 7
+    quantiles = [0.025, 0.975]
+    ts = TSDataset(TSDataset.to_dataset(weekly_period_df), "D")
+    transform = PytorchForecastingTransform(
+        max_encoder_length=horizon,
+        max_prediction_length=horizon,
+        time_varying_known_reals=["time_idx"],
+        time_varying_unknown_reals=["target"],
+        target_normalizer=GroupNormalizer(groups=["segment"]),
+    )
+    ts.fit_transform([transform])
+    model = DeepARModel(max_epochs=1, learning_rate=[0.01], gpus=0, batch_size=64)
+    model.fit(ts)
+    future = ts.make_future(horizon)
+    dataloader = model._get_pf_transform(future).pf_dataset_predict.to_dataloader(train=False, batch_size=128)
+
+    torch.manual_seed(0)
+    forecast = model.forecast(future, prediction_interval=True, quantiles=quantiles)
+    torch.manual_seed(0)
+    expected_predicts = model.model.predict(dataloader, mode="prediction").numpy()
+    torch.manual_seed(0)
+    expected_quantiles = model.model.predict(dataloader, mode="quantiles", mode_kwargs={"quantiles": quantiles}).numpy()
+
+    for i, segment in enumerate(sorted(forecast.segments)):
+        np.testing.assert_allclose(forecast[:, segment, "target"].values, expected_predicts[i], rtol=1e-5)
+        for j, quantile in enumerate(quantiles):
+            np.testing.assert_allclose(
+                forecast[:, segment, f"target_{quantile:.4g}"].values, expected_quantiles[i, :, j], rtol=1e-5
+            )
@@ -1,3 +1,5 @@
+from unittest.mock import patch
+
 import pytest
 
 from etna.datasets.tsdataset import TSDataset
@@ -188,3 +190,18 @@ def test_prediction_interval_run_infuture_warning_loss(example_tsds):
         segment_slice = forecast[:, segment, :][segment]
         assert {"target"}.issubset(segment_slice.columns)
         assert {"target_0.02", "target_0.98"}.isdisjoint(segment_slice.columns)
+
+
+def test_prediction_interval_single_predict_pass(example_tsds):
+    horizon = 10
+    transform = _get_default_transform(horizon)
+    example_tsds.fit_transform([transform])
+    model = TFTModel(max_epochs=1, learning_rate=[0.1], gpus=0, batch_size=64, predict_batch_size=2)
+    model.fit(example_tsds)
+    future = example_tsds.make_future(horizon)
+    with patch.object(model.model, "predict", wraps=model.model.predict) as predict:
+        forecast = model.forecast(future, prediction_interval=True, quantiles=[0.02, 0.98])
+    assert predict.call_count == 1
+    for segment in forecast.segments:
+        segment_slice = forecast[:, segment, :][segment]
+        assert {"target_0.02", "target_0.98", "target"}.issubset(segment_slice.columns)
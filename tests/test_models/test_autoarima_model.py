@@ -1,6 +1,11 @@
+import json
+from copy import deepcopy
+
+import pandas as pd
 import pytest
 from pmdarima.arima import ARIMA
 
+from etna.datasets import TSDataset
 from etna.models import AutoARIMAModel
 from etna.pipeline import Pipeline
 
@@ -148,3 +153,125 @@ def test_autoarima_forecast_1_point(example_tsds):
     assert len(pred.df) == horizon
     pred_quantiles = model.forecast(future_ts, prediction_interval=True, quantiles=[0.025, 0.8])
     assert len(pred_quantiles.df) == horizon
+
+
+def test_autoarima_parallel_fit(example_tsds):
+    """Check that AutoARIMA fitted in parallel selects the same orders as the sequential one."""
+    sequential_model = AutoARIMAModel()
+    sequential_model.fit(example_tsds)
+    parallel_model = AutoARIMAModel(worker_budget=2)
+    parallel_model.fit(example_tsds)
+    for segment in example_tsds.segments:
+        assert sequential_model._models[segment].get_selected_order() == (
+            parallel_model._models[segment].get_selected_order()
+        )
+
+
+@pytest.mark.parametrize("order_cache_mode", ["start", "fix"])
+def test_autoarima_order_cache(example_tsds, order_cache_mode):
+    """Check that AutoARIMA reuses cached orders during refits."""
+    model = AutoARIMAModel(order_cache_mode=order_cache_mode)
+    model.fit(example_tsds)
+    first_cache = {segment: dict(entry) for segment, entry in model.get_order_cache().items()}
+    assert sorted(first_cache) == sorted(example_tsds.segments)
+    assert all(entry["n_refits"] == 0 for entry in first_cache.values())
+
+    model.fit(example_tsds)
+    for segment, segment_model in model._models.items():
+        assert segment_model.cached_order is not None
+        assert model.get_order_cache()[segment]["n_refits"] == 1
+        if order_cache_mode == "fix":
+            assert segment_model.get_selected_order()["order"] == first_cache[segment]["order"]
+
+
+def test_autoarima_order_cache_full_search(example_tsds):
+    """Check that AutoARIMA repeats the full search after the given number of refits."""
+    model = AutoARIMAModel(order_cache_mode="fix", full_search_every=1)
+    model.fit(example_tsds)
+    model.fit(example_tsds)
+    assert all(entry["n_refits"] == 1 for entry in model.get_order_cache().values())
+    model.fit(example_tsds)
+    assert all(entry["n_refits"] == 0 for entry in model.get_order_cache().values())
+    for segment_model in model._models.values():
+        assert segment_model.cached_order is None
+
+
+def test_autoarima_order_cache_persisted(example_tsds, tmp_path):
+    """Check that AutoARIMA order cache is saved to the file and loaded by the other model."""
+    path = tmp_path / "order_cache.json"
+    model = AutoARIMAModel(order_cache_mode="fix", order_cache_path=path)
+    model.fit(example_tsds)
+    assert path.exists()
+
+    new_model = AutoARIMAModel(order_cache_mode="fix", order_cache_path=path)
+    new_model.fit(example_tsds)
+    for segment, segment_model in new_model._models.items():
+        assert segment_model.cached_order["order"] == model.get_order_cache()[segment]["order"]
+
+
+def test_autoarima_order_cache_ignores_later_orders(example_tsds):
+    """Check that AutoARIMA doesn't reuse the orders selected on the data that ends later than the refit data."""
+    model = AutoARIMAModel(order_cache_mode="fix")
+    model.fit(example_tsds)
+    train_ts = TSDataset(example_tsds.to_pandas().iloc[:-7], freq=example_tsds.freq)
+    fold_model = deepcopy(model)
+    fold_model.fit(train_ts)
+    for segment, segment_model in fold_model._models.items():
+        assert segment_model.cached_order is None
+        assert fold_model.get_order_cache()[segment]["n_refits"] == 0
+        assert pd.Timestamp(fold_model.get_order_cache()[segment]["train_end"]) == train_ts.index.max()
+
+
+def test_autoarima_order_cache_loads_files_of_other_processes(example_tsds, tmp_path):
+    """Check that AutoARIMA loads the entries saved by the other processes even if the common file misses them."""
+    path = tmp_path / "order_cache.json"
+    model = AutoARIMAModel(order_cache_mode="fix", order_cache_path=path)
+    model.fit(example_tsds)
+    order_cache = json.loads(path.read_text())
+    _, process_path = model._get_order_cache_paths()
+    process_path.rename(tmp_path / "order_cache.other_host.1.1.json")
+    path.write_text("{}")
+
+    new_model = AutoARIMAModel(order_cache_mode="fix", order_cache_path=path)
+    new_model._load_order_cache()
+    assert new_model.get_order_cache() == order_cache
+
+
+def test_autoarima_order_cache_file_merged(example_tsds, tmp_path):
+    """Check that AutoARIMA keeps the entries selected on the latest data written to the file by the other fits."""
+    path = tmp_path / "order_cache.json"
+    train_ts = TSDataset(example_tsds.to_pandas().iloc[:-7], freq=example_tsds.freq)
+    first_model = AutoARIMAModel(order_cache_mode="fix", order_cache_path=path)
+    second_model = deepcopy(first_model)
+    second_model.fit(example_tsds)
+    first_model.fit(train_ts)
+    order_cache = json.loads(path.read_text())
+    assert sorted(order_cache) == sorted(example_tsds.segments)
+    for entry in order_cache.values():
+        assert pd.Timestamp(entry["train_end"]) == example_tsds.index.max()
+
+
+@pytest.mark.parametrize("worker_budget, expected_n_jobs", [(None, 2), (2, 1)])
+def test_autoarima_n_jobs_passed_to_search(worker_budget, expected_n_jobs):
+    """Check that AutoARIMA passes n_jobs to the search unless segments are fitted within the worker budget."""
+    model = AutoARIMAModel(n_jobs=2, worker_budget=worker_budget)
+    assert model._base_model.kwargs["n_jobs"] == expected_n_jobs
+    assert model._get_n_jobs() == (1 if worker_budget is None else worker_budget)
+
+
+def test_autoarima_order_cache_saved_without_temporary_files(example_tsds, tmp_path):
+    """Check that AutoARIMA replaces the order cache files and doesn't leave temporary files behind."""
+    path = tmp_path / "order_cache.json"
+    path.write_text("{}")
+    model = AutoARIMAModel(order_cache_mode="fix", order_cache_path=path)
+    model.fit(example_tsds)
+    _, process_path = model._get_order_cache_paths()
+    assert sorted(tmp_path.iterdir()) == sorted([path, process_path])
+    for cache_path in [path, process_path]:
+        assert sorted(json.loads(cache_path.read_text())) == sorted(example_tsds.segments)
+
+
+def test_autoarima_order_cache_wrong_mode():
+    """Check that AutoARIMA raises error with unknown order cache mode."""
+    with pytest.raises(NotImplementedError, match="is not a valid OrderCacheMode"):
+        _ = AutoARIMAModel(order_cache_mode="wrong_mode")
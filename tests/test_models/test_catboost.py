@@ -1,12 +1,16 @@
+from unittest.mock import patch
+
 import numpy as np
 import pandas as pd
 import pytest
 from catboost import CatBoostRegressor
 
 from etna.datasets.tsdataset import TSDataset
+from etna.metrics import MAE
 from etna.models import CatBoostMultiSegmentModel
 from etna.models import CatBoostPerSegmentModel
 from etna.pipeline import Pipeline
+from etna.transforms import SegmentEncoderTransform
 from etna.transforms.math import LagTransform
 
 
@@ -104,3 +108,150 @@ def test_get_model_per_segment_after_training(example_tsds):
     assert isinstance(models_dict, dict)
     for segment in example_tsds.segments:
         assert isinstance(models_dict[segment], CatBoostRegressor)
+
+
+@pytest.mark.parametrize("catboostmodel", [CatBoostMultiSegmentModel, CatBoostPerSegmentModel])
+def test_run_with_categorical(catboostmodel, example_tsds):
+    transforms = [LagTransform(in_column="target", lags=[7, 8]), SegmentEncoderTransform()]
+    example_tsds.fit_transform(transforms)
+    model = catboostmodel()
+    model.fit(example_tsds)
+    future_ts = example_tsds.make_future(7)
+    forecast = model.forecast(future_ts)
+    assert not forecast[:, :, "target"].isnull().values.any()
+
+
+def test_make_pool_splits_numerical_and_categorical(example_tsds):
+    example_tsds.fit_transform([LagTransform(in_column="target", lags=[7, 8]), SegmentEncoderTransform()])
+    df = example_tsds.to_pandas(flatten=True).dropna().drop(columns=["segment"])
+    adapter = CatBoostMultiSegmentModel()._base_model
+    adapter._categorical = ["segment_code"]
+    pool = adapter._make_pool(df=df, target=df["target"].values, thread_count=1)
+    assert pool.num_row() == len(df)
+    numerical = [column for column in df.columns if column not in ["timestamp", "target", "segment_code"]]
+    assert pool.get_feature_names() == numerical + ["segment_code"]
+    assert pool.get_cat_feature_indices() == [2]
+
+
+def test_borders_path_saves_and_reuses_borders(example_tsds, tmp_path):
+    borders_path = tmp_path / "borders.tsv"
+    train_ts, _ = example_tsds.train_test_split(test_size=20)
+    train_ts.fit_transform([LagTransform(in_column="target", lags=[7, 8])])
+    example_tsds.fit_transform([LagTransform(in_column="target", lags=[7, 8])])
+
+    model = CatBoostMultiSegmentModel(iterations=10, random_seed=0, borders_path=str(borders_path))
+    model.fit(train_ts)
+    assert borders_path.exists()
+    saved_borders = borders_path.read_text()
+
+    model_without_borders = CatBoostMultiSegmentModel(iterations=10, random_seed=0)
+    model_without_borders.fit(train_ts)
+    forecast = model.forecast(train_ts.make_future(7)).to_pandas()
+    forecast_without_borders = model_without_borders.forecast(train_ts.make_future(7)).to_pandas()
+    pd.testing.assert_frame_equal(forecast, forecast_without_borders)
+
+    model.fit(example_tsds)
+    assert borders_path.read_text() == saved_borders
+
+
+def test_backtest_with_borders_path(example_tsds, tmp_path):
+    borders_path = tmp_path / "borders.tsv"
+    pipeline = Pipeline(
+        model=CatBoostMultiSegmentModel(iterations=10, borders_path=str(borders_path)),
+        transforms=[LagTransform(in_column="target", lags=[7, 8])],
+        horizon=7,
+    )
+    _, forecast, _ = pipeline.backtest(ts=example_tsds, metrics=[MAE()], n_folds=3, n_jobs=2)
+    assert borders_path.exists()
+    assert not forecast.isnull().values.any()
+
+
+def test_per_segment_borders_path(example_tsds, tmp_path):
+    borders_path = tmp_path / "borders.tsv"
+    example_tsds.fit_transform([LagTransform(in_column="target", lags=[7, 8])])
+    model = CatBoostPerSegmentModel(iterations=10, borders_path=str(borders_path))
+    model.fit(example_tsds)
+
+    assert not borders_path.exists()
+    segment_borders = {}
+    for segment in example_tsds.segments:
+        segment_borders_path = tmp_path / f"borders_{segment}.tsv"
+        assert segment_borders_path.exists()
+        segment_borders[segment] = segment_borders_path.read_text()
+    assert len(set(segment_borders.values())) == len(example_tsds.segments)
+
+
+@pytest.mark.parametrize("catboostmodel", [CatBoostMultiSegmentModel, CatBoostPerSegmentModel])
+def test_prediction_interval(catboostmodel, example_tsds):
+    pipeline = Pipeline(
+        model=catboostmodel(iterations=50, quantiles=[0.025, 0.975]),
+        transforms=[LagTransform(in_column="target", lags=[7, 8])],
+        horizon=7,
+    )
+    pipeline.fit(example_tsds)
+    forecast = pipeline.forecast(prediction_interval=True, quantiles=[0.025, 0.975])
+    for segment in forecast.segments:
+        segment_slice = forecast[:, segment, :][segment]
+        assert {"target_0.025", "target_0.975", "target"}.issubset(segment_slice.columns)
+        assert (segment_slice["target_0.975"] - segment_slice["target"] >= 0).all()
+        assert (segment_slice["target"] - segment_slice["target_0.025"] >= 0).all()
+
+
+@pytest.mark.parametrize("catboostmodel", [CatBoostMultiSegmentModel, CatBoostPerSegmentModel])
+def test_prediction_interval_without_multi_quantile(catboostmodel, example_tsds, monkeypatch):
+    """Check that CatBoost models train a model per quantile if MultiQuantile loss isn't available."""
+    monkeypatch.setattr("etna.models.catboost._MULTI_QUANTILE_AVAILABLE", False)
+    model = catboostmodel(iterations=50, quantiles=[0.025, 0.975])
+    pipeline = Pipeline(model=model, transforms=[LagTransform(in_column="target", lags=[7, 8])], horizon=7)
+    pipeline.fit(example_tsds)
+    forecast = pipeline.forecast(prediction_interval=True, quantiles=[0.025, 0.975])
+
+    adapters = model._models.values() if catboostmodel is CatBoostPerSegmentModel else [model._base_model]
+    for adapter in adapters:
+        assert adapter.model.get_params()["loss_function"] == "Quantile:alpha=0.5"
+        assert [quantile_model.get_params()["loss_function"] for quantile_model in adapter._quantile_models] == [
+            "Quantile:alpha=0.025",
+            "Quantile:alpha=0.975",
+        ]
+    for segment in forecast.segments:
+        segment_slice = forecast[:, segment, :][segment]
+        assert (segment_slice["target_0.975"] - segment_slice["target"] >= 0).all()
+        assert (segment_slice["target"] - segment_slice["target_0.025"] >= 0).all()
+
+
+@pytest.mark.parametrize("catboostmodel", [CatBoostMultiSegmentModel, CatBoostPerSegmentModel])
+def test_prediction_interval_does_not_run_backtest(catboostmodel, example_tsds):
+    pipeline = Pipeline(
+        model=catboostmodel(iterations=10, quantiles=[0.1, 0.9]),
+        transforms=[LagTransform(in_column="target", lags=[7, 8])],
+        horizon=7,
+    )
+    pipeline.fit(example_tsds)
+    with patch.object(Pipeline, "backtest") as backtest:
+        _ = pipeline.forecast(prediction_interval=True, quantiles=[0.1, 0.9])
+    backtest.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "model_quantiles, quantiles, expected",
+    [(None, [0.1, 0.9], False), ([0.1, 0.9], [0.1, 0.9], True), ([0.1, 0.9], [0.9], True), ([0.1], [0.1, 0.9], False)],
+)
+@pytest.mark.parametrize("catboostmodel", [CatBoostMultiSegmentModel, CatBoostPerSegmentModel])
+def test_can_predict_quantiles(catboostmodel, model_quantiles, quantiles, expected):
+    model = catboostmodel(quantiles=model_quantiles)
+    assert model._can_predict_quantiles(quantiles=quantiles) is expected
+
+
+@pytest.mark.parametrize("catboostmodel", [CatBoostMultiSegmentModel, CatBoostPerSegmentModel])
+def test_prediction_interval_without_quantiles_falls_back_to_backtest(catboostmodel, example_tsds):
+    pipeline = Pipeline(
+        model=catboostmodel(iterations=10), transforms=[LagTransform(in_column="target", lags=[7, 8])], horizon=7
+    )
+    pipeline.fit(example_tsds)
+    forecast = pipeline.forecast(prediction_interval=True, quantiles=[0.025, 0.975])
+    assert {"target_0.025", "target_0.975"}.issubset(forecast.columns.get_level_values("feature"))
+
+
+def test_quantiles_with_loss_function_fail():
+    with pytest.raises(ValueError, match="Loss function can't be set if quantiles are given"):
+        _ = CatBoostMultiSegmentModel(quantiles=[0.1, 0.9], loss_function="RMSE")
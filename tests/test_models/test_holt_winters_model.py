@@ -113,3 +113,48 @@ def test_get_model_after_training(example_tsds, etna_model_class, expected_class
     assert isinstance(models_dict, dict)
     for segment in example_tsds.segments:
         assert isinstance(models_dict[segment], expected_class)
+
+
+@pytest.mark.parametrize(
+    "model",
+    [
+        HoltWintersModel(),
+        HoltWintersModel(trend="add", damped_trend=True, seasonal="add", seasonal_periods=7),
+        HoltModel(),
+        SimpleExpSmoothingModel(),
+    ],
+)
+def test_holt_winters_update(model, example_tsds):
+    """Test that update of Holt-Winters' models doesn't change parameters and keeps the smoothing of the old data."""
+    train_ts, test_ts = example_tsds.train_test_split(test_size=10)
+    model.fit(train_ts)
+    params_before = {segment: result.params for segment, result in _get_results(model).items()}
+    fitted_before = {segment: result.fittedvalues for segment, result in _get_results(model).items()}
+
+    model.update(example_tsds)
+
+    for segment, result in _get_results(model).items():
+        for key in ("smoothing_level", "smoothing_trend", "smoothing_seasonal", "damping_trend"):
+            np.testing.assert_allclose(
+                np.array(result.params[key], dtype=float), np.array(params_before[segment][key], dtype=float)
+            )
+        assert len(result.fittedvalues) == len(example_tsds.index)
+        np.testing.assert_allclose(
+            result.fittedvalues[: len(train_ts.index)].values, fitted_before[segment].values, rtol=1e-6
+        )
+
+    future_ts = example_tsds.make_future(future_steps=7)
+    res = model.forecast(future_ts).to_pandas(flatten=True)
+    assert not res.isnull().values.any()
+    assert res["timestamp"].min() > example_tsds.index.max()
+
+
+def test_holt_winters_update_before_training(example_tsds):
+    """Check that update method throws an error if model is not fitted yet."""
+    model = HoltWintersModel()
+    with pytest.raises(ValueError, match="the model is not fitted!"):
+        model.update(example_tsds)
+
+
+def _get_results(model):
+    return {segment: segment_model._result for segment, segment_model in model._get_model().items()}
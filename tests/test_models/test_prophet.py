@@ -1,9 +1,13 @@
+import numpy as np
 import pandas as pd
 import pytest
 from prophet import Prophet
 
 from etna.datasets.tsdataset import TSDataset
+from etna.metrics import MAE
 from etna.models import ProphetModel
+from etna.models.prophet import _merge_init_params
+from etna.models.prophet import _ProphetAdapter
 from etna.pipeline import Pipeline
 
 
@@ -86,3 +90,151 @@ def test_get_model_after_training(example_tsds):
     assert isinstance(models_dict, dict)
     for segment in example_tsds.segments:
         assert isinstance(models_dict[segment], Prophet)
+
+
+def test_prophet_parallel_fit(example_tsds):
+    """Check that fitting segments in parallel processes gives the same forecast as the sequential fit."""
+    future = example_tsds.make_future(7)
+    sequential_forecast = ProphetModel().fit(example_tsds).forecast(future).to_pandas()
+    future = example_tsds.make_future(7)
+    parallel_forecast = ProphetModel(n_jobs=2).fit(example_tsds).forecast(future).to_pandas()
+    pd.testing.assert_frame_equal(parallel_forecast, sequential_forecast)
+
+
+def test_prophet_get_fitted_params_before_training():
+    """Check that get_fitted_params method throws an error if the model is not fitted yet."""
+    model = ProphetModel()
+    with pytest.raises(ValueError, match="Prophet model is not fitted!"):
+        _ = model._base_model.get_fitted_params()
+
+
+def test_prophet_warm_start_passes_previous_params(example_tsds):
+    """Check that Prophet with warm start passes parameters of the previous fit to the next one."""
+    model = ProphetModel(warm_start=True)
+    model.fit(example_tsds)
+    previous_params = {segment: segment_model.get_fitted_params() for segment, segment_model in model._models.items()}
+    model.fit(example_tsds)
+    for segment, segment_model in model._models.items():
+        assert segment_model.init_params.keys() == previous_params[segment].keys()
+        for name, value in previous_params[segment].items():
+            np.testing.assert_array_equal(segment_model.init_params[name], value)
+
+
+def test_prophet_without_warm_start_ignores_previous_params(example_tsds):
+    """Check that Prophet without warm start doesn't pass parameters of the previous fit to the next one."""
+    model = ProphetModel()
+    model.fit(example_tsds)
+    model.fit(example_tsds)
+    for segment_model in model._models.values():
+        assert segment_model.init_params is None
+
+
+def test_prophet_warm_start_backtest(example_tsds):
+    """Check that backtest with warm started Prophet gives forecasts close to the cold one."""
+    _, cold_forecast, _ = Pipeline(model=ProphetModel(), horizon=7).backtest(
+        ts=example_tsds, metrics=[MAE()], n_folds=3
+    )
+    _, warm_forecast, _ = Pipeline(model=ProphetModel(warm_start=True), horizon=7).backtest(
+        ts=example_tsds, metrics=[MAE()], n_folds=3
+    )
+    assert warm_forecast.shape == cold_forecast.shape
+    np.testing.assert_allclose(
+        warm_forecast.loc[:, pd.IndexSlice[:, "target"]].values,
+        cold_forecast.loc[:, pd.IndexSlice[:, "target"]].values,
+        rtol=0.1,
+    )
+
+
+@pytest.mark.parametrize("init_from_regressors", [False, True])
+def test_prophet_warm_start_ignores_mismatched_params(
+    example_tsds, example_reg_tsds, init_from_regressors, monkeypatch
+):
+    """Check that Prophet with warm start starts cold if the number of features has changed since the previous fit."""
+    first_ts, second_ts = (example_reg_tsds, example_tsds) if init_from_regressors else (example_tsds, example_reg_tsds)
+    init_params = []
+    get_init_params = _ProphetAdapter._get_init_params
+
+    def _get_init_params(self, prophet_df):
+        init_params.append(get_init_params(self, prophet_df))
+        return init_params[-1]
+
+    monkeypatch.setattr(_ProphetAdapter, "_get_init_params", _get_init_params)
+    model = ProphetModel(warm_start=True)
+    model.fit(first_ts)
+    init_params.clear()
+    model.fit(second_ts)
+
+    assert init_params == [None] * len(second_ts.segments)
+    future_ts = second_ts.make_future(future_steps=7)
+    res = model.forecast(future_ts).to_pandas(flatten=True)
+    assert not res.isnull().values.any()
+
+
+@pytest.mark.parametrize("n_jobs, expected", [(1, False), (2, True)])
+def test_prophet_pipeline_has_nested_workers(n_jobs, expected):
+    """Check that pipeline detects Prophet fitting segments in parallel."""
+    pipeline = Pipeline(model=ProphetModel(n_jobs=n_jobs), horizon=7)
+    assert pipeline._has_nested_workers() is expected
+
+
+def test_prophet_warm_start_rescales_params(example_tsds):
+    """Check that Prophet with warm start rescales parameters of the previous fit to the scale of the new target."""
+    model = ProphetModel(warm_start=True)
+    model.fit(example_tsds)
+    previous_params = {segment: segment_model.get_fitted_params() for segment, segment_model in model._models.items()}
+    df = example_tsds.to_pandas()
+    df.loc[:, pd.IndexSlice[:, "target"]] *= 2
+    ts = TSDataset(df, freq=example_tsds.freq)
+    segment_model = model._init_segment_models(segments=ts.segments)["segment_1"]
+    segment_model.regressor_columns = []
+    prophet_df = pd.DataFrame({"y": ts[:, "segment_1", "target"].values})
+    init_params = segment_model._get_init_params(prophet_df)
+    for name in ["k", "m", "sigma_obs", "delta"]:
+        np.testing.assert_allclose(init_params[name], previous_params["segment_1"][name] / 2)
+
+
+def test_prophet_warm_start_keeps_trend_params_of_flat_growth(example_tsds):
+    """Check that Prophet with flat growth doesn't rescale trend parameters of the previous fit."""
+    model = ProphetModel(growth="flat", warm_start=True)
+    model.fit(example_tsds)
+    previous_params = model._models["segment_1"].get_fitted_params()
+    df = example_tsds.to_pandas()
+    df.loc[:, pd.IndexSlice[:, "target"]] *= 2
+    ts = TSDataset(df, freq=example_tsds.freq)
+    segment_model = model._init_segment_models(segments=ts.segments)["segment_1"]
+    segment_model.regressor_columns = []
+    prophet_df = pd.DataFrame({"y": ts[:, "segment_1", "target"].values})
+    init_params = segment_model._get_init_params(prophet_df)
+    for name in ["k", "m", "delta"]:
+        np.testing.assert_allclose(init_params[name], previous_params[name])
+    np.testing.assert_allclose(init_params["sigma_obs"], previous_params["sigma_obs"] / 2)
+
+
+@pytest.mark.parametrize("delta_size, beta_size", [(3, 2), (4, 2), (3, 5), (4, 5)])
+def test_merge_init_params_drops_mismatched_shapes(delta_size, beta_size):
+    """Check that only parameters with the lengths of the current fit replace the default initialization."""
+    stan_init = {"k": 0.0, "m": 0.0, "sigma_obs": 1, "delta": np.zeros(3), "beta": np.zeros(2)}
+    init_params = {"k": 1.0, "m": 2.0, "sigma_obs": 3.0, "delta": np.ones(delta_size), "beta": np.ones(beta_size)}
+    merged_init = _merge_init_params(stan_init, init_params)
+    assert (merged_init["k"], merged_init["m"], merged_init["sigma_obs"]) == (1.0, 2.0, 3.0)
+    for name, size in [("delta", 3), ("beta", 2)]:
+        expected = init_params[name] if len(init_params[name]) == size else stan_init[name]
+        np.testing.assert_array_equal(merged_init[name], expected)
+
+
+def test_prophet_warm_start_initializes_stan_backend(example_tsds, monkeypatch):
+    """Check that Prophet with warm start initializes the Stan backend with the parameters of the previous fit."""
+    model = ProphetModel(warm_start=True)
+    model.fit(example_tsds)
+    previous_params = {segment: segment_model.get_fitted_params() for segment, segment_model in model._models.items()}
+    stan_inits = []
+
+    def merge_init_params(stan_init, init_params):
+        stan_inits.append(_merge_init_params(stan_init, init_params))
+        return stan_inits[-1]
+
+    monkeypatch.setattr("etna.models.prophet._merge_init_params", merge_init_params)
+    model.fit(example_tsds)
+    assert len(stan_inits) == len(example_tsds.segments)
+    for stan_init in stan_inits:
+        assert any(np.allclose(stan_init["k"], params["k"]) for params in previous_params.values())
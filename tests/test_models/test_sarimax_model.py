@@ -1,7 +1,11 @@
+import numpy as np
+import pandas as pd
 import pytest
 from statsmodels.tsa.statespace.sarimax import SARIMAX
 
+from etna.metrics import MAE
 from etna.models import SARIMAXModel
+from etna.models.sarimax import _SARIMAXAdapter
 from etna.pipeline import Pipeline
 
 
@@ -134,3 +138,104 @@ def test_sarimax_forecast_1_point(example_tsds):
     assert len(pred.df) == horizon
     pred_quantiles = model.forecast(future_ts, prediction_interval=True, quantiles=[0.025, 0.8])
     assert len(pred_quantiles.df) == horizon
+
+
+def test_sarimax_warm_start_passes_previous_params(example_tsds):
+    """Check that SARIMAX with warm start passes parameters of the previous fit to the next one."""
+    model = SARIMAXModel(warm_start=True)
+    model.fit(example_tsds)
+    previous_params = {segment: segment_model.get_fitted_params() for segment, segment_model in model._models.items()}
+    model.fit(example_tsds)
+    for segment, segment_model in model._models.items():
+        pd.testing.assert_series_equal(segment_model.start_params, previous_params[segment])
+
+
+def test_sarimax_without_warm_start_ignores_previous_params(example_tsds):
+    """Check that SARIMAX without warm start doesn't pass parameters of the previous fit to the next one."""
+    model = SARIMAXModel()
+    model.fit(example_tsds)
+    model.fit(example_tsds)
+    for segment_model in model._models.values():
+        assert segment_model.start_params is None
+
+
+def test_sarimax_warm_start_ignores_mismatched_params(example_tsds, example_reg_tsds):
+    """Check that SARIMAX with warm start ignores parameters that don't match the model being fitted."""
+    model = SARIMAXModel(warm_start=True)
+    model.fit(example_tsds)
+    model.fit(example_reg_tsds)
+    future_ts = example_reg_tsds.make_future(future_steps=7)
+    res = model.forecast(future_ts).to_pandas(flatten=True)
+    assert not res.isnull().values.any()
+
+
+def test_sarimax_warm_start_backtest(example_tsds):
+    """Check that backtest with warm started SARIMAX chains folds and gives forecasts close to the cold one."""
+    _, cold_forecast, _ = Pipeline(model=SARIMAXModel(), horizon=7).backtest(
+        ts=example_tsds, metrics=[MAE()], n_folds=3
+    )
+    _, warm_forecast, _ = Pipeline(model=SARIMAXModel(warm_start=True), horizon=7).backtest(
+        ts=example_tsds, metrics=[MAE()], n_folds=3
+    )
+    assert warm_forecast.shape == cold_forecast.shape
+    np.testing.assert_allclose(
+        warm_forecast.loc[:, pd.IndexSlice[:, "target"]].values,
+        cold_forecast.loc[:, pd.IndexSlice[:, "target"]].values,
+        rtol=0.1,
+    )
+
+
+def test_sarimax_warm_start_backtest_chains_folds_from_cold_start(example_tsds, monkeypatch):
+    """Check that backtest of fitted warm started SARIMAX starts the first fold cold and others from the previous fold."""
+    fits = []
+    adapter_fit = _SARIMAXAdapter.fit
+
+    def fit(self, df, regressors):
+        start_params = self.start_params
+        adapter_fit(self, df=df, regressors=regressors)
+        fits.append((start_params, self.get_fitted_params()))
+        return self
+
+    monkeypatch.setattr(_SARIMAXAdapter, "fit", fit)
+    pipeline = Pipeline(model=SARIMAXModel(warm_start=True), horizon=7)
+    pipeline.fit(example_tsds)
+    fits.clear()
+
+    pipeline.backtest(ts=example_tsds, metrics=[MAE()], n_folds=3)
+
+    n_segments = len(example_tsds.segments)
+    assert len(fits) == 3 * n_segments
+    for fold_number in range(3):
+        for segment_number in range(n_segments):
+            start_params, _ = fits[fold_number * n_segments + segment_number]
+            if fold_number == 0:
+                assert start_params is None
+            else:
+                _, previous_params = fits[(fold_number - 1) * n_segments + segment_number]
+                pd.testing.assert_series_equal(start_params, previous_params)
+
+
+def test_sarimax_update(example_reg_tsds):
+    """Check that SARIMAX update extends the data without changing the parameters."""
+    train_ts, _ = example_reg_tsds.train_test_split(test_size=10)
+    model = SARIMAXModel()
+    model.fit(train_ts)
+    params_before = {segment: segment_model.get_fitted_params() for segment, segment_model in model._models.items()}
+
+    model.update(example_reg_tsds)
+
+    for segment, segment_model in model._models.items():
+        pd.testing.assert_series_equal(segment_model.get_fitted_params(), params_before[segment])
+        assert segment_model.get_model().nobs == len(example_reg_tsds.index)
+
+    future_ts = example_reg_tsds.make_future(future_steps=7)
+    res = model.forecast(future_ts).to_pandas(flatten=True)
+    assert not res.isnull().values.any()
+    assert res["timestamp"].min() > example_reg_tsds.index.max()
+
+
+def test_sarimax_update_before_training(example_tsds):
+    """Check that update method throws an error if model is not fitted yet."""
+    model = SARIMAXModel()
+    with pytest.raises(ValueError, match="the model is not fitted!"):
+        model.update(example_tsds)
@@ -6,6 +6,7 @@ from etna.datasets import TSDataset
 from etna.metrics import MAE
 from etna.models.tbats import BATSModel
 from etna.models.tbats import TBATSModel
+from etna.pipeline import Pipeline
 from etna.transforms import LagTransform
 from tests.test_models.test_linear_model import linear_segments_by_parameters
 
@@ -57,6 +58,8 @@ def test_reper(model_class, model_class_repr):
         "n_jobs": None,
         "multiprocessing_start_method": None,
         "context": None,
+        "worker_budget": None,
+        "joblib_params": None,
     }
     kwargs_repr = (
         "use_box_cox = None, "
@@ -68,7 +71,9 @@ def test_reper(model_class, model_class_repr):
         + "show_warnings = None, "
         + "n_jobs = None, "
         + "multiprocessing_start_method = None, "
-        + "context = None"
+        + "context = None, "
+        + "worker_budget = None, "
+        + "joblib_params = None"
     )
     model = model_class(**kwargs)
     model_repr = model.__repr__()
@@ -115,3 +120,43 @@ def test_prediction_interval(model, example_tsds):
         segment_slice = forecast[:, segment, :][segment]
         assert {"target_0.025", "target_0.975", "target"}.issubset(segment_slice.columns)
         assert (segment_slice["target_0.975"] - segment_slice["target_0.025"] >= 0).all()
+
+
+@pytest.mark.parametrize("model_class", [TBATSModel, BATSModel])
+def test_worker_budget_sets_single_job_estimator(model_class):
+    model = model_class(n_jobs=4, worker_budget=2)
+    assert model.model.n_jobs == 1
+    assert model._get_n_jobs() == 2
+
+
+@pytest.mark.parametrize("model_class", [TBATSModel, BATSModel])
+def test_worker_budget_fit(model_class, sinusoid_ts):
+    train, _ = sinusoid_ts
+    sequential_model = model_class().fit(train)
+    parallel_model = model_class(worker_budget=2).fit(train)
+    sequential_forecast = sequential_model.forecast(train.make_future(14)).to_pandas()
+    parallel_forecast = parallel_model.forecast(train.make_future(14)).to_pandas()
+    pd.testing.assert_frame_equal(parallel_forecast, sequential_forecast)
+
+
+@pytest.mark.parametrize(
+    "worker_budget, n_parallel_folds, expected_budget", [(4, 2, 2), (5, 2, 2), (2, 3, 1), (None, 2, None)]
+)
+def test_pipeline_shares_worker_budget(worker_budget, n_parallel_folds, expected_budget):
+    pipeline = Pipeline(model=TBATSModel(worker_budget=worker_budget), horizon=7)
+    pipeline._share_workers(n_parallel_folds=n_parallel_folds)
+    assert pipeline.model.worker_budget == expected_budget
+
+
+def test_pipeline_shares_workers_switches_default_backend():
+    pipeline = Pipeline(model=TBATSModel(worker_budget=4), horizon=7)
+    pipeline._share_workers(n_parallel_folds=2)
+    assert pipeline.model.joblib_params == {"verbose": 0, "backend": "loky", "mmap_mode": "c"}
+    assert TBATSModel(worker_budget=4).joblib_params is None
+
+
+def test_backtest_with_worker_budget(example_tsds):
+    pipeline = Pipeline(model=BATSModel(worker_budget=4), horizon=7)
+    _, forecast, _ = pipeline.backtest(ts=example_tsds, metrics=[MAE()], n_folds=2, n_jobs=2)
+    assert not forecast.isnull().values.any()
+    assert pipeline.model.worker_budget == 4
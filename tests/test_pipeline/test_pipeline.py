@@ -1,7 +1,12 @@
+import os
+import time
 from copy import deepcopy
 from datetime import datetime
+from pathlib import Path
 from typing import Dict
 from typing import List
+from typing import Optional
+from unittest.mock import patch
 
 import numpy as np
 import pandas as pd
@@ -15,16 +20,20 @@ from etna.metrics import SMAPE
 from etna.metrics import Metric
 from etna.metrics import MetricAggregationMode
 from etna.metrics import Width
+from etna.models import HoltWintersModel
 from etna.models import LinearPerSegmentModel
 from etna.models import MovingAverageModel
 from etna.models import NaiveModel
 from etna.models import ProphetModel
 from etna.models import SARIMAXModel
+from etna.models.base import BaseAdapter
+from etna.models.base import PerSegmentModel
 from etna.pipeline import FoldMask
 from etna.pipeline import Pipeline
 from etna.transforms import AddConstTransform
 from etna.transforms import DateFlagsTransform
 from etna.transforms import FilterFeaturesTransform
+from etna.transforms import LagTransform
 from etna.transforms import LogTransform
 from tests.utils import DummyMetric
 
@@ -367,6 +376,86 @@ def test_backtest_forecasts_sanity(step_ts: TSDataset):
     assert np.all(forecast_df == expected_forecast_df)
 
 
+@pytest.mark.parametrize("n_jobs", [1, 2])
+def test_backtest_forecasts_dir(step_ts: TSDataset, tmp_path, n_jobs):
+    """Check that Pipeline.backtest saves forecasts of folds to the directory and reads them back."""
+    ts, expected_metrics_df, expected_forecast_df = step_ts
+    pipeline = Pipeline(model=NaiveModel(), horizon=5)
+    metrics_df, forecast_df, _ = pipeline.backtest(
+        ts, metrics=[MAE()], n_folds=3, n_jobs=n_jobs, forecasts_dir=tmp_path / "forecasts"
+    )
+
+    assert sorted(path.name for path in (tmp_path / "forecasts").iterdir()) == ["backtest_manifest.json"] + [
+        f"fold_{i}.pkl" for i in range(3)
+    ]
+    assert np.all(metrics_df.reset_index(drop=True) == expected_metrics_df)
+    assert np.all(forecast_df == expected_forecast_df)
+
+
+def test_backtest_forecasts_dir_without_returned_forecasts(step_ts: TSDataset, tmp_path):
+    """Check that forecasts saved by Pipeline.backtest without returning them can be loaded from the directory."""
+    ts, _, expected_forecast_df = step_ts
+    pipeline = Pipeline(model=NaiveModel(), horizon=5)
+    _, forecast_df, _ = pipeline.backtest(
+        ts, metrics=[MAE()], n_folds=3, forecasts_dir=tmp_path / "forecasts", return_forecasts=False
+    )
+
+    assert forecast_df is None
+    assert all(isinstance(fold["forecast"], Path) for fold in pipeline._folds.values())
+    assert np.all(Pipeline.load_backtest_forecasts(tmp_path / "forecasts") == expected_forecast_df)
+
+
+def test_load_backtest_forecasts_empty_dir(tmp_path):
+    """Check that Pipeline.load_backtest_forecasts raises error if there are no forecasts in the directory."""
+    with pytest.raises(ValueError, match="There are no forecasts of folds"):
+        _ = Pipeline.load_backtest_forecasts(tmp_path)
+
+
+def test_load_backtest_forecasts_ignores_other_files(step_ts: TSDataset, tmp_path):
+    """Check that Pipeline.load_backtest_forecasts loads only the folds of the last backtest in the directory."""
+    ts, _, expected_forecast_df = step_ts
+    pipeline = Pipeline(model=NaiveModel(), horizon=5)
+    _ = pipeline.backtest(ts, metrics=[MAE()], n_folds=4, forecasts_dir=tmp_path, return_forecasts=False)
+    (tmp_path / "fold_x.pkl").write_bytes(b"")
+    _ = pipeline.backtest(ts, metrics=[MAE()], n_folds=3, forecasts_dir=tmp_path, return_forecasts=False)
+
+    assert (tmp_path / "fold_3.pkl").exists()
+    assert np.all(Pipeline.load_backtest_forecasts(tmp_path) == expected_forecast_df)
+
+
+def test_load_backtest_forecasts_unfinished_backtest(step_ts: TSDataset, tmp_path):
+    """Check that Pipeline.load_backtest_forecasts raises error if backtest didn't finish."""
+    ts, _, _ = step_ts
+    pipeline = Pipeline(model=NaiveModel(), horizon=5)
+    with patch.object(Pipeline, "_run_fold", side_effect=RuntimeError("fold failed")):
+        with pytest.raises(RuntimeError, match="fold failed"):
+            _ = pipeline.backtest(ts, metrics=[MAE()], n_folds=3, forecasts_dir=tmp_path)
+    with pytest.raises(ValueError, match="didn't finish"):
+        _ = Pipeline.load_backtest_forecasts(tmp_path)
+
+
+def test_load_backtest_forecasts_missing_fold(step_ts: TSDataset, tmp_path):
+    """Check that Pipeline.load_backtest_forecasts raises error if forecast of some fold is missing."""
+    ts, _, _ = step_ts
+    pipeline = Pipeline(model=NaiveModel(), horizon=5)
+    _ = pipeline.backtest(ts, metrics=[MAE()], n_folds=3, forecasts_dir=tmp_path, return_forecasts=False)
+    (tmp_path / "fold_1.pkl").unlink()
+    with pytest.raises(ValueError, match=r"Forecasts of folds \[1\] are missing"):
+        _ = Pipeline.load_backtest_forecasts(tmp_path)
+
+
+def test_backtest_without_forecasts(step_ts: TSDataset):
+    """Check that Pipeline.backtest doesn't keep forecasts of folds if they aren't returned."""
+    ts, expected_metrics_df, _ = step_ts
+    pipeline = Pipeline(model=NaiveModel(), horizon=5)
+    metrics_df, forecast_df, fold_info_df = pipeline.backtest(ts, metrics=[MAE()], n_folds=3, return_forecasts=False)
+
+    assert forecast_df is None
+    assert all(fold["forecast"] is None for fold in pipeline._folds.values())
+    assert np.all(metrics_df.reset_index(drop=True) == expected_metrics_df)
+    assert len(fold_info_df) == 3
+
+
 def test_forecast_raise_error_if_not_fitted():
     """Test that Pipeline raise error when calling forecast without being fit."""
     pipeline = Pipeline(model=NaiveModel(), horizon=5)
@@ -573,3 +662,95 @@ def test_backtest_nans_at_beginning_with_mask(ts_name, request):
         metrics=[MAE()],
         n_folds=[mask],
     )
+
+
+@pytest.mark.parametrize("model", [SARIMAXModel(), HoltWintersModel(trend="add", seasonal="add", seasonal_periods=7)])
+def test_update(example_tsds, model):
+    """Test that Pipeline after update forecasts right after the new data and keeps it in its dataset."""
+    train_ts, _ = example_tsds.train_test_split(test_size=10)
+    pipeline = Pipeline(model=model, transforms=[AddConstTransform(in_column="target", value=20)], horizon=5)
+    pipeline.fit(train_ts)
+
+    pipeline.update(deepcopy(example_tsds))
+    forecast = pipeline.forecast()
+
+    pd.testing.assert_frame_equal(pipeline.ts[:, :, "target"], example_tsds[:, :, "target"])
+    assert forecast.index.min() > example_tsds.index.max()
+    assert len(forecast.index) == 5
+    assert not forecast[:, :, "target"].isnull().values.any()
+
+
+def test_update_raise_error_if_not_fitted(example_tsds):
+    """Test that Pipeline raise error when calling update without being fit."""
+    pipeline = Pipeline(model=SARIMAXModel(), horizon=5)
+    with pytest.raises(ValueError, match="Pipeline is not fitted!"):
+        _ = pipeline.update(example_tsds)
+
+
+def test_update_raise_error_if_not_implemented(example_tsds):
+    """Test that Pipeline raise error when calling update with the model that doesn't support it."""
+    pipeline = Pipeline(
+        model=LinearPerSegmentModel(), transforms=[LagTransform(in_column="target", lags=[5, 6])], horizon=5
+    )
+    pipeline.fit(example_tsds)
+    with pytest.raises(NotImplementedError, match="update method is not implemented"):
+        _ = pipeline.update(example_tsds)
+
+
+class _PidAdapter(BaseAdapter):
+    """Adapter that predicts the id of the process it was fitted in."""
+
+    def fit(self, df: pd.DataFrame, regressors: List[str]) -> "_PidAdapter":
+        self.pid = os.getpid()
+        # let the other segments be taken by the other workers
+        time.sleep(1)
+        return self
+
+    def predict(self, df: pd.DataFrame) -> np.ndarray:
+        return np.full(len(df), self.pid)
+
+    def get_model(self) -> "_PidAdapter":
+        return self
+
+
+class _PidModel(PerSegmentModel):
+    """Per-segment model that fits segments within worker budget like BATSModel."""
+
+    def __init__(self, worker_budget: Optional[int] = None):
+        self.worker_budget = worker_budget
+        super().__init__(base_model=_PidAdapter())
+
+    def _get_n_jobs(self) -> int:
+        return 1 if self.worker_budget is None else self.worker_budget
+
+
+def test_backtest_fits_segments_in_parallel_inside_fold(example_tsds):
+    """Check that segments are fitted by different processes inside each of the folds run in parallel."""
+    pipeline = Pipeline(model=_PidModel(worker_budget=4), horizon=7)
+    _, forecast, _ = pipeline.backtest(ts=example_tsds, metrics=[MAE()], n_folds=2, n_jobs=2)
+    for _, fold_forecast in forecast.groupby(forecast.loc[:, pd.IndexSlice[:, "fold_number"]].iloc[:, 0]):
+        pids = fold_forecast.loc[:, pd.IndexSlice[:, "target"]].iloc[0]
+        assert pids.nunique() == len(example_tsds.segments)
+        assert os.getpid() not in pids.values
+
+
+@pytest.mark.parametrize(
+    "n_jobs, n_parallel_folds, expected_n_jobs, expected_backend",
+    [(1, 2, 1, "multiprocessing"), (4, 1, 4, "multiprocessing"), (4, 2, 2, "loky"), (4, 3, 1, "loky")],
+)
+def test_share_workers_divides_n_jobs(n_jobs, n_parallel_folds, expected_n_jobs, expected_backend):
+    """Check that the segments fitted in parallel by the model are divided between the folds."""
+    pipeline = Pipeline(model=PerSegmentModel(base_model=_PidAdapter(), n_jobs=n_jobs), horizon=7)
+    pipeline._share_workers(n_parallel_folds=n_parallel_folds)
+    assert pipeline.model._get_n_jobs() == expected_n_jobs
+    assert pipeline.model._get_joblib_params()["backend"] == expected_backend
+
+
+def test_backtest_fits_segments_with_n_jobs_in_parallel_inside_fold(example_tsds):
+    """Check that segments of the model with ``n_jobs`` are fitted by different processes inside each fold."""
+    pipeline = Pipeline(model=PerSegmentModel(base_model=_PidAdapter(), n_jobs=4), horizon=7)
+    _, forecast, _ = pipeline.backtest(ts=example_tsds, metrics=[MAE()], n_folds=2, n_jobs=2)
+    for _, fold_forecast in forecast.groupby(forecast.loc[:, pd.IndexSlice[:, "fold_number"]].iloc[:, 0]):
+        pids = fold_forecast.loc[:, pd.IndexSlice[:, "target"]].iloc[0]
+        assert pids.nunique() == len(example_tsds.segments)
+        assert os.getpid() not in pids.values
@@ -1,5 +1,6 @@
 from copy import deepcopy
 from typing import Any
+from unittest.mock import patch
 
 import numpy as np
 import pandas as pd
@@ -13,6 +14,7 @@ from ruptures.costs import CostNormal
 from ruptures.costs import CostRank
 from ruptures.costs import CostRbf
 
+from etna.analysis.change_points_trend.search import _detect_change_points
 from etna.datasets import TSDataset
 from etna.transforms.decomposition import BinsegTrendTransform
 
@@ -67,3 +69,26 @@ def test_fit_transform_with_nans_in_middle_raise_error(df_with_nans):
     transform = BinsegTrendTransform(in_column="target")
     with pytest.raises(ValueError, match="The input column contains NaNs in the middle of the series!"):
         _ = transform.fit_transform(df=df_with_nans)
+
+
+def test_binseg_parallel(example_tsds: TSDataset):
+    """Check that binseg trend with parallel change points search gives the same result as sequential one."""
+    ts = deepcopy(example_tsds)
+    ts.fit_transform([BinsegTrendTransform(in_column="target", n_bkps=3)])
+    ts_parallel = deepcopy(example_tsds)
+    ts_parallel.fit_transform([BinsegTrendTransform(in_column="target", n_bkps=3, n_jobs=2)])
+    pd.testing.assert_frame_equal(ts_parallel.to_pandas(), ts.to_pandas())
+
+
+def test_binseg_cache_change_points(example_tsds: TSDataset):
+    """Check that binseg trend reuses change points only with ``cache_change_points`` and shares them with copies."""
+    transform = BinsegTrendTransform(in_column="target", n_bkps=3, cache_change_points=True)
+    transform.fit(example_tsds.to_pandas())
+    transform_copy = deepcopy(transform)
+    with patch(
+        "etna.analysis.change_points_trend.search._detect_change_points", wraps=_detect_change_points
+    ) as detect_change_points:
+        transform_copy.fit(example_tsds.to_pandas())
+        detect_change_points.assert_not_called()
+        BinsegTrendTransform(in_column="target", n_bkps=3).fit(example_tsds.to_pandas())
+        assert detect_change_points.call_count == len(example_tsds.segments)
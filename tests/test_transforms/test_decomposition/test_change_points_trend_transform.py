@@ -1,3 +1,5 @@
+from unittest.mock import patch
+
 import numpy as np
 import pandas as pd
 import pytest
@@ -195,3 +197,54 @@ def test_fit_transform_with_nans_in_middle_raise_error(df_with_nans):
     )
     with pytest.raises(ValueError, match="The input column contains NaNs in the middle of the series!"):
         _ = bs.fit_transform(df=df_with_nans)
+
+
+def test_get_timestamps():
+    series = pd.Series(0, index=pd.date_range("2020-01-01 00:00:00.5", periods=5, freq="7H"))
+    transform = _OneSegmentChangePointsTrendTransform(
+        in_column="target", change_point_model=Binseg(), detrend_model=LinearRegression()
+    )
+    timestamps = transform._get_timestamps(series=series)
+    expected = np.array([[timestamp.timestamp()] for timestamp in series.index])
+    np.testing.assert_array_equal(timestamps, expected)
+
+
+@pytest.mark.parametrize("n_bkps", [1, 5, 20])
+def test_linear_trends_same_as_per_interval_models(multitrend_df: pd.DataFrame, pre_multitrend_df, n_bkps: int):
+    """Check that linear trends fitted at once are the same as fitted interval by interval."""
+    df = multitrend_df["segment_1"]
+    bs = _OneSegmentChangePointsTrendTransform(
+        in_column="target", change_point_model=Binseg(), detrend_model=LinearRegression(), n_bkps=n_bkps
+    )
+    bs.fit(df=df)
+    assert bs._linear_trends is not None
+
+    bs_per_interval = _OneSegmentChangePointsTrendTransform(
+        in_column="target", change_point_model=Binseg(), detrend_model=LinearRegression(), n_bkps=n_bkps
+    )
+    with patch.object(_OneSegmentChangePointsTrendTransform, "_is_linear_detrend_model", return_value=False):
+        bs_per_interval.fit(df=df)
+    assert bs_per_interval._linear_trends is None
+
+    for interval, model in bs_per_interval.per_interval_models.items():
+        np.testing.assert_allclose(bs.per_interval_models[interval].coef_, model.coef_, rtol=1e-6)
+        np.testing.assert_allclose(bs.per_interval_models[interval].intercept_, model.intercept_, rtol=1e-6)
+    for test_df in (df, pre_multitrend_df["segment_1"]):
+        np.testing.assert_allclose(
+            bs._predict_per_interval_model(test_df["target"]),
+            bs_per_interval._predict_per_interval_model(test_df["target"]),
+            atol=1e-6,
+        )
+
+
+def test_per_interval_models_for_other_regressors(multitrend_df: pd.DataFrame):
+    """Check that models other than linear regression with intercept are fitted interval by interval."""
+    bs = _OneSegmentChangePointsTrendTransform(
+        in_column="target",
+        change_point_model=Binseg(),
+        detrend_model=LinearRegression(fit_intercept=False),
+        n_bkps=5,
+    )
+    bs.fit(df=multitrend_df["segment_1"])
+    assert bs._linear_trends is None
+    assert all(model.intercept_ == 0 for model in bs.per_interval_models.values())
@@ -1,9 +1,16 @@
+from unittest.mock import patch
+
 import numpy as np
 import pandas as pd
 import pytest
+from statsmodels.tsa.arima.model import ARIMA
+from statsmodels.tsa.forecasting.stl import STLForecast
+from statsmodels.tsa.seasonal import STL
 
 from etna.datasets.tsdataset import TSDataset
+from etna.metrics import MAE
 from etna.models import NaiveModel
+from etna.pipeline import Pipeline
 from etna.transforms.decomposition import STLTransform
 from etna.transforms.decomposition.stl import _OneSegmentSTLTransform
 
@@ -184,3 +191,102 @@ def test_fit_transform_with_nans_in_middle_raise_error(df_with_nans):
     transform = STLTransform(in_column="target", period=7)
     with pytest.raises(ValueError, match="The input column contains NaNs in the middle of the series!"):
         _ = transform.fit_transform(df_with_nans)
+
+
+def test_fit_transform_parallel(ts_trend_seasonal):
+    """Test that transform fitted in parallel gives the same result as fitted sequentially."""
+    df = ts_trend_seasonal.to_pandas()
+    transformed = STLTransform(in_column="target", period=7).fit_transform(df.copy())
+    transformed_parallel = STLTransform(in_column="target", period=7, n_jobs=2).fit_transform(df.copy())
+    pd.testing.assert_frame_equal(transformed_parallel, transformed)
+
+
+@pytest.mark.parametrize("n_new", [0, 1, 6])
+def test_reuse_seasonal(df_trend_seasonal_one_segment, n_new):
+    """Test that seasonal component is reused if the series is extended by less than period points."""
+    df = df_trend_seasonal_one_segment
+    transform = _OneSegmentSTLTransform(in_column="target", period=7, reuse_seasonal=True)
+    transform.fit(df.iloc[:-10])
+    seasonal = transform._seasonal
+
+    transform.fit(df.iloc[: len(df) - 10 + n_new])
+    reused_seasonal = transform._seasonal
+    np.testing.assert_array_equal(reused_seasonal[: len(seasonal)], seasonal)
+    np.testing.assert_array_equal(
+        reused_seasonal[len(seasonal) :], seasonal[len(seasonal) - 7 : len(seasonal) - 7 + n_new]
+    )
+    df_transformed = transform.transform(df.iloc[: len(df) - 10 + n_new])
+    np.testing.assert_allclose(df_transformed["target"], 0, atol=0.3)
+
+
+@pytest.mark.parametrize(
+    "reuse_seasonal, start, n_new",
+    [(False, 0, 1), (True, 0, 7), (True, 1, 1)],
+)
+def test_not_reuse_seasonal(df_trend_seasonal_one_segment, reuse_seasonal, start, n_new):
+    """Test that seasonal component is recomputed if it is disabled or the series isn't extended enough."""
+    df = df_trend_seasonal_one_segment
+    transform = _OneSegmentSTLTransform(in_column="target", period=7, reuse_seasonal=reuse_seasonal)
+    transform.fit(df.iloc[:-10])
+    transform.fit(df.iloc[start : len(df) - 10 + n_new])
+    expected_transform = _OneSegmentSTLTransform(in_column="target", period=7)
+    expected_transform.fit(df.iloc[start : len(df) - 10 + n_new])
+    np.testing.assert_array_equal(transform._seasonal, expected_transform._seasonal)
+
+
+def test_reuse_seasonal_after_changed_history(df_trend_seasonal_one_segment):
+    """Test that seasonal component is recomputed if the history of series is changed."""
+    df = df_trend_seasonal_one_segment
+    transform = _OneSegmentSTLTransform(in_column="target", period=7, reuse_seasonal=True)
+    transform.fit(df.iloc[:-10])
+    df_changed = df.iloc[:-9].copy()
+    df_changed.iloc[0] += 1
+    transform.fit(df_changed)
+    expected_transform = _OneSegmentSTLTransform(in_column="target", period=7)
+    expected_transform.fit(df_changed)
+    np.testing.assert_array_equal(transform._seasonal, expected_transform._seasonal)
+
+
+def test_reuse_seasonal_multi_segments(ts_trend_seasonal):
+    """Test that refit of STLTransform keeps decompositions of segments to reuse them."""
+    df = ts_trend_seasonal.to_pandas()
+    transform = STLTransform(in_column="target", period=7, reuse_seasonal=True)
+    transform.fit(df.iloc[:-3])
+    decompositions = {segment: transform.segment_transforms[segment]._decomposition for segment in df.columns.levels[0]}
+    transform.fit(df.iloc[:-1])
+    for segment, decomposition in decompositions.items():
+        assert transform.segment_transforms[segment]._decomposition is decomposition
+
+
+def test_season_trend_same_as_stl_forecast(df_trend_seasonal_one_segment):
+    """Test that season and trend of the transform are the same as the prediction of STLForecast."""
+    df = df_trend_seasonal_one_segment.asfreq("D")
+    transform = _OneSegmentSTLTransform(in_column="target", period=7).fit(df.iloc[:-10])
+    expected_results = STLForecast(df["target"].iloc[:-10], ARIMA, model_kwargs={"order": (1, 1, 0)}, period=7).fit()
+    for start, end in [(0, len(df) - 11), (len(df) - 10, len(df) - 1), (len(df) - 5, len(df) - 1)]:
+        df_inversed = transform.inverse_transform(df.iloc[start : end + 1].assign(target=0.0))
+        expected = expected_results.get_prediction(start=df.index[start], end=df.index[end]).predicted_mean
+        np.testing.assert_allclose(df_inversed["target"], expected)
+
+
+def test_reuse_seasonal_without_stl_refit(df_trend_seasonal_one_segment):
+    """Test that only the same transform refitted on the extension of the decomposed series doesn't run STL."""
+    df = df_trend_seasonal_one_segment
+    transform = _OneSegmentSTLTransform(in_column="target", period=7, reuse_seasonal=True)
+    with patch("etna.transforms.decomposition.stl.STL", wraps=STL) as stl:
+        transform.fit(df.iloc[:-10])
+        transform.fit(df.iloc[:-5])
+        assert stl.call_count == 1
+        # the new window should start with exactly the decomposed one
+        transform.fit(df.iloc[1:-5])
+        assert stl.call_count == 2
+
+
+def test_reuse_seasonal_not_in_backtest(ts_trend_seasonal):
+    """Test that folds of backtest don't reuse seasonal component as each of them fits its own copy of transform."""
+    pipeline = Pipeline(
+        model=NaiveModel(), transforms=[STLTransform(in_column="target", period=7, reuse_seasonal=True)], horizon=3
+    )
+    with patch("etna.transforms.decomposition.stl.STL", wraps=STL) as stl:
+        _ = pipeline.backtest(ts=ts_trend_seasonal, metrics=[MAE()], n_folds=3)
+        assert stl.call_count == 3 * len(ts_trend_seasonal.segments)
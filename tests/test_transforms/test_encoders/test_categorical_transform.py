@@ -1,3 +1,5 @@
+from copy import deepcopy
+
 import numpy as np
 import pandas as pd
 import pytest
@@ -7,7 +9,10 @@ from etna.datasets import generate_ar_df
 from etna.datasets import generate_const_df
 from etna.datasets import generate_periodic_df
 from etna.metrics import R2
+from etna.models import CatBoostMultiSegmentModel
+from etna.models import LinearMultiSegmentModel
 from etna.models import LinearPerSegmentModel
+from etna.pipeline import Pipeline
 from etna.transforms import FilterFeaturesTransform
 from etna.transforms.encoders.categorical import LabelEncoderTransform
 from etna.transforms.encoders.categorical import OneHotEncoderTransform
@@ -191,12 +196,14 @@ def test_naming_ohe_encoder(two_df_with_new_values):
     "in_column",
     [("2"), ("regressor_1")],
 )
-def test_naming_ohe_encoder_no_out_column(df_for_naming, in_column):
+@pytest.mark.parametrize("sparse", [False, True])
+def test_naming_ohe_encoder_no_out_column(df_for_naming, in_column, sparse):
     """Test OneHotEncoderTransform gives the correct columns with no out_column."""
     df = df_for_naming
-    ohe = OneHotEncoderTransform(in_column=in_column)
+    ohe = OneHotEncoderTransform(in_column=in_column, sparse=sparse)
     ohe.fit(df)
-    answer = set(list(df["segment_0"].columns) + [str(ohe.__repr__()) + "_0", str(ohe.__repr__()) + "_1"])
+    prefix = f"OneHotEncoderTransform(in_column = '{in_column}', out_column = None, )"
+    answer = set(list(df["segment_0"].columns) + [prefix + "_0", prefix + "_1"])
     assert answer == set(ohe.transform(df)["segment_0"].columns.values)
 
 
@@ -245,3 +252,39 @@ def test_ohe_sanity(ts_for_ohe_sanity):
     forecast_ts = model.forecast(future_ts)
     r2 = R2()
     assert 1 - r2(test_ts, forecast_ts)["segment_0"] < 1e-5
+
+
+def test_ohe_encoder_sparse_same_values(df_for_ohe_encoding):
+    """Test that sparse OneHotEncoderTransform gives the same values as the dense one."""
+    df, _ = df_for_ohe_encoding
+    dense_df = OneHotEncoderTransform(in_column="regressor_0", out_column="test").fit_transform(df.copy())
+    sparse_df = OneHotEncoderTransform(in_column="regressor_0", out_column="test", sparse=True).fit_transform(df.copy())
+    out_columns = dense_df.loc[:, pd.IndexSlice[:, ["test_0", "test_1", "test_2"]]].columns
+    assert all(isinstance(dtype, pd.SparseDtype) for dtype in sparse_df[out_columns].dtypes)
+    np.testing.assert_array_equal(sparse_df[out_columns].sparse.to_dense().values, dense_df[out_columns].astype(float))
+
+
+def test_ohe_sparse_linear_model(ts_for_ohe_sanity):
+    """Test that linear model gives the same forecast with sparse and dense features."""
+    forecasts = []
+    for sparse in [False, True]:
+        ts = deepcopy(ts_for_ohe_sanity)
+        ohe = OneHotEncoderTransform(in_column="regressor_0", sparse=sparse)
+        filt = FilterFeaturesTransform(exclude=["regressor_0"])
+        pipeline = Pipeline(model=LinearMultiSegmentModel(), transforms=[ohe, filt], horizon=10)
+        pipeline.fit(ts)
+        forecasts.append(pipeline.forecast().to_pandas()["segment_0"]["target"].values)
+    np.testing.assert_allclose(forecasts[0], forecasts[1], rtol=1e-3)
+
+
+def test_ohe_sparse_catboost_model(ts_for_ohe_sanity):
+    """Test that catboost model works with sparse features."""
+    horizon = 10
+    train_ts, test_ts = ts_for_ohe_sanity.train_test_split(test_size=horizon)
+    ohe = OneHotEncoderTransform(in_column="regressor_0", sparse=True)
+    filt = FilterFeaturesTransform(exclude=["regressor_0"])
+    pipeline = Pipeline(model=CatBoostMultiSegmentModel(iterations=100), transforms=[ohe, filt], horizon=horizon)
+    pipeline.fit(train_ts)
+    forecast_ts = pipeline.forecast()
+    r2 = R2()
+    assert r2(test_ts, forecast_ts)["segment_0"] > 0.9
@@ -456,3 +456,78 @@ def test_full_backtest_sanity(period, order, df_nans_with_noise):
     """Test that DifferencingTransform correctly works in backtest."""
     transform = DifferencingTransform(in_column="target", period=period, order=order, inplace=True)
     check_backtest_sanity(transform, df_nans_with_noise)
+
+
+@pytest.fixture
+def df_nans_float(random_seed) -> pd.DataFrame:
+    """Create DataFrame with random values and nans at the beginning of segments of different length."""
+    timestamp = pd.date_range("2021-01-01", "2021-04-01")
+    dfs = []
+    for i in range(5):
+        df = pd.DataFrame({"timestamp": timestamp, "target": np.random.normal(size=len(timestamp)), "segment": str(i)})
+        dfs.append(df.iloc[i * 3 :])
+    df = TSDataset.to_dataset(pd.concat(dfs, ignore_index=True))
+    return df
+
+
+@pytest.mark.parametrize("period", [1, 3, 7])
+def test_make_inv_diff(period, df_nans_float):
+    """Test that inverse difference is a cumulative sum over strides of period skipping NaNs."""
+    values = df_nans_float.values[:-2]
+    transform = _SingleDifferencingTransform(in_column="target", period=period)
+    expected = pd.DataFrame(values.copy())
+    for i in range(period):
+        expected.iloc[i::period] = expected.iloc[i::period].cumsum()
+    np.testing.assert_array_equal(transform._make_inv_diff(values), expected.values)
+
+
+@pytest.mark.parametrize("period", [3, 7])
+@pytest.mark.parametrize("order", [1, 3])
+def test_full_transform_float(period, order, df_nans_float):
+    """Test that DifferencingTransform generates correct values on data with random values."""
+    transform = DifferencingTransform(in_column="target", period=period, order=order, inplace=False, out_column="diff")
+    check_transform(transform, period, order, "diff", df_nans_float)
+
+
+@pytest.mark.parametrize("period", [3, 7])
+@pytest.mark.parametrize("order", [1, 3])
+def test_full_inverse_transform_float(period, order, df_nans_float):
+    """Test that DifferencingTransform reconstructs train and test with random values."""
+    ts = TSDataset(df_nans_float, freq="D")
+    ts_train, ts_test = ts.train_test_split(test_size=20)
+    df_train = ts_train.to_pandas()
+    transform = DifferencingTransform(in_column="target", period=period, order=order)
+
+    transformed_df = transform.fit_transform(df_train)
+    pd.testing.assert_frame_equal(transform.inverse_transform(transformed_df), df_train)
+
+    df_test = ts.to_pandas()
+    for _ in range(order):
+        df_test = df_test.diff(periods=period)
+    inverse_transformed_test = transform.inverse_transform(df_test.iloc[-20:])
+    np.testing.assert_allclose(inverse_transformed_test.values, ts_test.to_pandas().values)
+
+
+@pytest.mark.parametrize(
+    "transform",
+    [
+        _SingleDifferencingTransform(in_column="target", period=1, inplace=True),
+        DifferencingTransform(in_column="target", period=1, order=2, inplace=True),
+    ],
+)
+@pytest.mark.parametrize("on_test", [False, True])
+def test_general_inverse_transform_fail_unknown_segment(transform, on_test, df_nans):
+    """Test that differencing transform fails to make inverse_transform on segments unseen in fit."""
+    df_unknown = df_nans.loc[:, pd.IndexSlice["2", :]].rename(columns={"2": "x"}, level="segment")
+    ts = TSDataset(pd.concat([df_nans, df_unknown], axis=1), freq="D")
+    ts_train, _ = ts.train_test_split(test_size=10)
+    df_train = ts_train.to_pandas()
+    transform.fit(df_train.loc[:, pd.IndexSlice[["1", "2"], :]])
+    if on_test:
+        df = ts_train.make_future(10).to_pandas()
+        df.loc[:, pd.IndexSlice[:, "target"]] = 0
+    else:
+        df = transform.transform(df_train)
+
+    with pytest.raises(ValueError, match=r"Segments \['x'\] were not seen during fit"):
+        _ = transform.inverse_transform(df)
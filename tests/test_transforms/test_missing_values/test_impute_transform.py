@@ -348,3 +348,67 @@ def test_fit_transform_nans_at_the_end(fill_strategy, ts_diff_endings):
     imputer = TimeSeriesImputerTransform(in_column="target", strategy=fill_strategy)
     ts_diff_endings.fit_transform([imputer])
     assert (ts_diff_endings[:, :, "target"].isna()).sum().sum() == 0
+
+
+def fill_seasonal_mean_sequentially(series: pd.Series, nan_timestamps: pd.Index, window: int, seasonality: int):
+    """Fill gaps one by one with the mean of previous values of the season."""
+    series = series.copy()
+    history = seasonality * window if window != -1 else len(series)
+    timestamps = list(series.index)
+    for timestamp in nan_timestamps:
+        i = timestamps.index(timestamp)
+        indexes = np.arange(i - seasonality, i - seasonality - history, -seasonality)
+        indexes = indexes[indexes >= 0]
+        series.iloc[i] = np.nanmean(series.iloc[indexes])
+    return series
+
+
+@pytest.fixture
+def ts_with_sparse_gaps(random_seed) -> TSDataset:
+    """Dataset with many random gaps in the middle and NaNs at the beginning of segments."""
+    timestamp = pd.date_range(start="2020-01-01", periods=200, freq="D")
+    dfs = []
+    for i in range(5):
+        df = pd.DataFrame({"timestamp": timestamp, "segment": f"segment_{i}"})
+        df["target"] = np.random.normal(size=len(df)) + i
+        df.loc[np.random.choice(np.arange(5, len(df)), size=60, replace=False), "target"] = np.NaN
+        df.loc[: i - 1, "target"] = np.NaN
+        dfs.append(df)
+    df = pd.concat(dfs, ignore_index=True)
+    return TSDataset(df=TSDataset.to_dataset(df), freq="D")
+
+
+@pytest.mark.parametrize("fill_strategy", ["running_mean", "seasonal"])
+@pytest.mark.parametrize("window, seasonality", [(-1, 1), (3, 1), (-1, 7), (2, 7)])
+def test_mean_strategies_same_as_sequential_filling(ts_with_sparse_gaps, fill_strategy, window, seasonality):
+    """Check that gaps of all segments filled at once are the same as filled one by one."""
+    df = ts_with_sparse_gaps.to_pandas()
+    imputer = TimeSeriesImputerTransform(strategy=fill_strategy, window=window, seasonality=seasonality)
+    result = imputer.fit_transform(df)
+    for segment in ts_with_sparse_gaps.segments:
+        series = df[segment]["target"]
+        series = series[series.first_valid_index() :]
+        expected = fill_seasonal_mean_sequentially(
+            series=series, nan_timestamps=series[series.isna()].index, window=window, seasonality=seasonality
+        )
+        np.testing.assert_allclose(result.loc[expected.index, pd.IndexSlice[segment, "target"]], expected)
+
+        one_segment_imputer = _OneSegmentTimeSeriesImputerTransform(
+            in_column="target", strategy=fill_strategy, window=window, seasonality=seasonality, default_value=None
+        )
+        np.testing.assert_array_equal(
+            one_segment_imputer.fit_transform(df[segment])["target"], result[segment]["target"]
+        )
+
+
+@pytest.mark.parametrize("fill_strategy", ["running_mean", "seasonal"])
+def test_mean_strategies_keep_unfitted_nans(ts_with_sparse_gaps, fill_strategy):
+    """Check that only gaps seen in fit are filled."""
+    df = ts_with_sparse_gaps.to_pandas()
+    imputer = TimeSeriesImputerTransform(strategy=fill_strategy, seasonality=7, default_value=100)
+    imputer.fit(df.iloc[:100])
+    result = imputer.transform(df)
+    for i, segment in enumerate(ts_with_sparse_gaps.segments):
+        assert result[segment]["target"].iloc[:i].isna().all()
+        assert not result[segment]["target"].iloc[i:100].isna().any()
+    np.testing.assert_array_equal(result.iloc[100:].isna(), df.iloc[100:].isna())
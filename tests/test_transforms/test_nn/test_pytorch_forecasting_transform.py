@@ -1,4 +1,9 @@
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
 import pytest
+from pytorch_forecasting.data import TimeSeriesDataSet
 
 from etna.transforms.nn import PytorchForecastingTransform
 
@@ -23,3 +28,45 @@ def test_time_idx(days_offset, example_tsds):
     expected_len = new_df.shape[0]
     expected_list = list(range(expected_len)) * len(example_tsds.segments)
     assert time_idx == expected_list
+
+
+def test_encode_time_idx():
+    timestamps = pd.Series(pd.to_datetime(["2020-01-03", "2020-01-01", "2020-01-03", "2020-01-10"]))
+    time_idx = PytorchForecastingTransform._encode_time_idx(timestamps)
+    np.testing.assert_array_equal(time_idx, [1, 0, 1, 2])
+
+
+@pytest.mark.parametrize("lags, expected", [(None, 0), ({"target": []}, 0), ({"target": [7, 14], "exog": [3]}, 14)])
+def test_get_max_lag(lags, expected):
+    transform = PytorchForecastingTransform(lags=lags)
+    assert transform._get_max_lag() == expected
+
+
+def test_predict_dataset_uses_only_last_timestamps(example_tsds):
+    horizon = 3
+    transform = PytorchForecastingTransform(
+        max_encoder_length=5,
+        max_prediction_length=horizon,
+        time_varying_known_reals=["time_idx"],
+        time_varying_unknown_reals=["target"],
+    )
+    example_tsds.fit_transform([transform])
+    future = example_tsds.make_future(horizon)
+    n_timestamps = len(example_tsds.index) + horizon
+    time_idx = transform.pf_dataset_predict.data["time"]
+    assert time_idx.min() == n_timestamps - (5 + horizon)
+    assert time_idx.max() == n_timestamps - 1
+    assert len(future.df) == horizon
+
+
+def test_fit_transform_reuses_fit_dataset(example_tsds):
+    transform = PytorchForecastingTransform(
+        max_encoder_length=5,
+        max_prediction_length=3,
+        time_varying_known_reals=["time_idx"],
+        time_varying_unknown_reals=["target"],
+    )
+    with patch.object(TimeSeriesDataSet, "from_parameters") as from_parameters:
+        example_tsds.fit_transform([transform])
+    from_parameters.assert_not_called()
+    assert transform.pf_dataset_train is not None